@@ -1,11 +1,15 @@
-from .utils import Utils
+from .utils import Utils, RandomStreams
 from .deck import Card
 from .deck import Deck
-from .final_hand import FinalHandType, FinalHand, StrongestFinalHandFinder
+from .final_hand import FinalHandType, FinalHand, IncrementalHandEvaluator, StrongestFinalHandFinder
+from .equity import Equity, EquityCalculator, HandPotential, HandPotentialCalculator, SuitIsomorphism
 from .logger import Logger
 from .moves import Moves
 from .phases import Phases
 from .state import State
 from .player import Dummy, RandomBot, SemiRandomBot, OpponentBot, SimpleDqnBot, OpponentBotSilver, OpponentBotGold, \
     CollectiveSimpleDqnBot, MonitoredSimpleDqnBot, SimpleDqnBot3l
-from .table import Table, TrainingTable
+from .table import Table, TrainingTable, DecisionProfiler, LatencyHistogram, TableSnapshot
+from .simulation import BatchPolicy, RandomBatchPolicy, SemiRandomBatchPolicy, NeuralNetworkBatchPolicy, \
+    VectorizedTables
+from .runner import ParallelTournamentRunner, TournamentResult
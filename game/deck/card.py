@@ -1,32 +1,95 @@
+from typing import Dict, Iterable, List, Tuple
+
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
+SUITS = ('Heart', 'Diamond', 'Spade', 'Club')
+
+
 class Card:
-    def __init__(self, rank: str, suit: str, value: int) -> None:
-        self._rank = rank
-        self._suit = suit
-        self._value = value
+    """
+    Immutable playing card. The 52 cards of the deck are interned, so constructing a card returns the shared instance.
+
+    Every card carries an id between 0 and 51 (deck order: by value, then by suit) and a single bit mask (1 << id),
+    so sets of cards can be represented, compared and filtered as one integer (see to_mask).
+    """
+    __slots__ = ('rank', 'suit', 'value', 'id', 'mask')
+
+    _interned: Dict[Tuple[str, str, int], 'Card'] = {}
+    _by_id: List['Card'] = []
+
+    def __new__(cls, rank: str, suit: str, value: int) -> 'Card':
+        card = cls._interned.get((rank, suit, value))
+
+        if card is None:
+            if suit not in SUITS or not 1 <= value <= len(RANKS):
+                raise ValueError(f'Unknown card {rank}({suit}) with value {value}')
+
+            card = super().__new__(cls)
+            card_id = (value - 1) * len(SUITS) + SUITS.index(suit)
+            object.__setattr__(card, 'rank', rank)
+            object.__setattr__(card, 'suit', suit)
+            object.__setattr__(card, 'value', value)
+            object.__setattr__(card, 'id', card_id)
+            object.__setattr__(card, 'mask', 1 << card_id)
+
+        return card
+
+    @staticmethod
+    def from_id(card_id: int) -> 'Card':
+        return Card._by_id[card_id]
 
-    @property
-    def rank(self) -> str:
-        return self._rank
+    @staticmethod
+    def from_mask(mask: int) -> List['Card']:
+        return [card for card in Card._by_id if card.mask & mask]
 
-    @property
-    def suit(self) -> str:
-        return self._suit
+    @staticmethod
+    def to_mask(cards: Iterable['Card']) -> int:
+        mask = 0
 
-    @property
-    def value(self) -> int:
-        return self._value
+        for card in cards:
+            mask |= card.mask
+
+        return mask
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError('Card is immutable')
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError('Card is immutable')
+
+    def __reduce__(self):
+        return Card, (self.rank, self.suit, self.value)
+
+    def __copy__(self) -> 'Card':
+        return self
+
+    def __deepcopy__(self, memo) -> 'Card':
+        return self
 
     def __str__(self) -> str:
-        return str(self._rank) + '(' + str(self._suit + ')')
+        return str(self.rank) + '(' + str(self.suit + ')')
 
     def __eq__(self, other) -> bool:
-        return self._value == other.value and self._suit == other.suit
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return self.id
 
     def __lt__(self, other) -> bool:
-        return self._value < other.value
+        return self.value < other.value
 
     def __gt__(self, other) -> bool:
-        return self._value > other.value
+        return self.value > other.value
 
     def __repr__(self) -> str:
         return str(self)
+
+    @classmethod
+    def _intern_deck(cls) -> None:
+        for value, rank in enumerate(RANKS, 1):
+            for suit in SUITS:
+                card = cls(rank, suit, value)
+                cls._interned[(rank, suit, value)] = card
+                cls._by_id.append(card)
+
+
+Card._intern_deck()
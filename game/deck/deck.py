@@ -1,30 +1,68 @@
-from .card import Card
-from random import shuffle
-from typing import List
-
-RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
-SUITS = ('Heart', 'Diamond', 'Spade', 'Club')
+from .card import Card, RANKS, SUITS
+from random import Random
+import random as global_random
+from typing import List, Optional, Tuple
 
 
 class Deck:
+    """
+    Deck of the 52 interned cards, dealt from a preallocated permutation of card ids by moving a cursor.
+
+    Shuffling permutes the remaining ids in place (Fisher-Yates of random.shuffle, so a seeded generator deals the same
+    cards as a shuffled list of cards would), dealing and burning only advance the cursor and resetting restores the
+    ordered permutation, so a deck can be reused for every hand without allocating.
+    """
+    CARDS: Tuple[Card, ...] = tuple(Card(rank, suit, value + 1) for rank, value in zip(RANKS, range(len(RANKS)))
+                                    for suit in SUITS)
+    ORDER: Tuple[int, ...] = tuple(card.id for card in CARDS)
+
+    def __init__(self, random: Optional[Random] = None) -> None:
+        """
+        :param random: Generator used for shuffling, the global generator by default
+        """
+        self._order = list(self.ORDER)
+        self._cursor = 0
+        self._random = random if random is not None else global_random
 
-    def __init__(self) -> None:
-        self.cards = [Card(rank, suit, value + 1) for rank, value in zip(RANKS, range(len(RANKS))) for suit in SUITS]
+    @property
+    def cards(self) -> List[Card]:
+        return self.get_cards()
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self._order = [card.id for card in cards]
+        self._cursor = 0
 
     def shuffle(self) -> None:
-        shuffle(self.cards)
+        if self._cursor == 0:
+            self._random.shuffle(self._order)
+        else:
+            remaining = self._order[self._cursor:]
+            self._random.shuffle(remaining)
+            self._order[self._cursor:] = remaining
 
     def deal(self, amount: int = 1) -> List[Card]:
-        to_deal = self.cards[:amount]
-        self.cards = self.cards[amount:]
+        start = self._cursor
+        self._cursor = min(start + amount, len(self._order))
+        order = self._order
 
-        return to_deal
+        return [self.CARDS[order[i]] for i in range(start, self._cursor)]
 
     def burn(self, amount: int = 1) -> None:
-        self.cards = self.cards[amount:]
+        self._cursor = min(self._cursor + amount, len(self._order))
+
+    def reset(self) -> None:
+        self._order[:] = self.ORDER
+        self._cursor = 0
 
     def create_new_deck(self) -> None:
-        self.__init__()
+        self.reset()
 
     def get_cards(self) -> List[Card]:
-        return self.cards
+        """
+        :return: Remaining cards in dealing order
+        """
+        return [self.CARDS[card_id] for card_id in self._order[self._cursor:]]
+
+    def __len__(self) -> int:
+        return len(self._order) - self._cursor
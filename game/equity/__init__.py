@@ -0,0 +1,5 @@
+from .equity import Equity
+from .hand_potential import HandPotential
+from .suit_isomorphism import SuitIsomorphism
+from .equity_calculator import EquityCalculator
+from .hand_potential_calculator import HandPotentialCalculator
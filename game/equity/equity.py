@@ -0,0 +1,17 @@
+from typing import NamedTuple
+
+
+class Equity(NamedTuple):
+    """
+    Showdown results of the hero against the opponents, win, tie and loss are fractions of all showdowns.
+
+    equity is the expected share of the pot (a tie among n players counts as 1 / n), confidence_interval is the half
+    width of its confidence interval (0 when the showdowns were enumerated).
+    """
+    win: float
+    tie: float
+    loss: float
+    equity: float
+    confidence_interval: float
+    samples: int
+    is_exact: bool
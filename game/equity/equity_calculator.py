@@ -0,0 +1,287 @@
+from . import Equity, SuitIsomorphism
+from game import Card, Deck, IncrementalHandEvaluator
+from itertools import combinations
+from math import factorial, sqrt
+from random import Random
+from time import perf_counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+class _Results:
+    def __init__(self) -> None:
+        self.wins = 0
+        self.ties = 0
+        self.losses = 0
+        self.share = 0.0
+        self.squared_share = 0.0
+
+    @property
+    def samples(self) -> int:
+        return self.wins + self.ties + self.losses
+
+    def add(self, hero_strength: int, opponent_strengths: Iterable[int], weight: int = 1) -> None:
+        best_strength = 0
+        best_cnt = 0
+
+        for strength in opponent_strengths:
+            if strength > best_strength:
+                best_strength = strength
+                best_cnt = 1
+            elif strength == best_strength:
+                best_cnt += 1
+
+        if hero_strength > best_strength:
+            self.wins += weight
+            self.share += weight
+            self.squared_share += weight
+        elif hero_strength == best_strength:
+            share = 1 / (best_cnt + 1)
+            self.ties += weight
+            self.share += share * weight
+            self.squared_share += share * share * weight
+        else:
+            self.losses += weight
+
+    def to_equity(self, is_exact: bool, confidence_z: float) -> Equity:
+        samples = self.samples
+
+        if samples == 0:
+            raise ValueError('No showdown has been evaluated')
+
+        equity = self.share / samples
+
+        if is_exact:
+            confidence_interval = 0.0
+        else:
+            variance = max(self.squared_share / samples - equity * equity, 0.0)
+            confidence_interval = confidence_z * sqrt(variance / samples)
+
+        return Equity(win=self.wins / samples, tie=self.ties / samples, loss=self.losses / samples, equity=equity,
+                      confidence_interval=confidence_interval, samples=samples, is_exact=is_exact)
+
+
+class EquityCalculator:
+    """
+    Equity of hero cards against a number of opponents holding random cards (optionally restricted to a range of
+    starting hands), on a board of 0 to 5 community cards.
+
+    calculate enumerates all showdowns when there are at most MAX_ENUMERATIONS of them, otherwise it runs a seeded
+    Monte Carlo simulation limited by a sample and/or time budget.
+    """
+    MAX_ENUMERATIONS = 100_000
+    SAMPLES = 10_000
+    CONFIDENCE_Z = 1.96
+    BUDGET_CHECK_INTERVAL = 256
+    MAX_RANGE_REJECTIONS = 1_000
+
+    @classmethod
+    def calculate(cls, hand: Sequence[Card], board: Sequence[Card] = (), opponents: int = 1,
+                  opponent_range: Optional[Iterable[Sequence[Card]]] = None, samples: Optional[int] = None,
+                  time_limit: Optional[float] = None, seed: Optional[int] = None) -> Equity:
+        """
+        :param hand: Hero cards
+        :param board: Community cards dealt so far
+        :param opponents: Amount of opponents
+        :param opponent_range: Starting hands (2 cards each) the opponents may hold, all hands if not given
+        :param samples: Monte Carlo sample budget (SAMPLES if neither samples nor time_limit is given)
+        :param time_limit: Monte Carlo time budget in seconds
+        :param seed: Monte Carlo random seed
+        :return: Exact equity if enumeration is cheap, estimated equity otherwise
+        """
+        if cls.count_showdowns(hand, board, opponents, opponent_range) <= cls.MAX_ENUMERATIONS:
+            return cls.enumerate(hand, board, opponents, opponent_range)
+
+        return cls.simulate(hand, board, opponents, opponent_range, samples, time_limit, seed)
+
+    @classmethod
+    def count_showdowns(cls, hand: Sequence[Card], board: Sequence[Card] = (), opponents: int = 1,
+                        opponent_range: Optional[Iterable[Sequence[Card]]] = None) -> int:
+        """
+        :return: Upper bound of showdowns to evaluate by enumeration
+        """
+        dead_cards = cls._validate(hand, board, opponents)
+        deck = cls._create_deck(dead_cards)
+        range_hands = cls._create_range_hands(opponent_range, deck, dead_cards)
+
+        return cls._count_combinations(len(deck), 5 - len(board)) * \
+            cls._count_combinations(len(range_hands), opponents)
+
+    @classmethod
+    def enumerate(cls, hand: Sequence[Card], board: Sequence[Card] = (), opponents: int = 1,
+                  opponent_range: Optional[Iterable[Sequence[Card]]] = None) -> Equity:
+        dead_cards = cls._validate(hand, board, opponents)
+        deck = cls._create_deck(dead_cards)
+        range_hands = cls._create_range_hands(opponent_range, deck, dead_cards)
+        board_evaluator = IncrementalHandEvaluator(board)
+        results = _Results()
+        runouts = combinations(deck, 5 - len(board))
+
+        # Suit symmetries of hand and board hold for random opponent hands only
+        if opponent_range is None:
+            runouts = SuitIsomorphism.reduce(runouts, list(hand) + list(board))
+        else:
+            runouts = [(runout, 1) for runout in runouts]
+
+        for runout, weight in runouts:
+            runout_mask = Card.to_mask(runout)
+            runout_evaluator = board_evaluator.copy()
+            runout_evaluator.add_cards(runout)
+            hero_strength = cls._evaluate(runout_evaluator, hand)
+
+            opponent_hands = [(mask, cls._evaluate(runout_evaluator, cards)) for mask, cards in range_hands
+                              if not mask & runout_mask]
+
+            if opponents == 1:
+                for _, strength in opponent_hands:
+                    results.add(hero_strength, (strength,), weight)
+                continue
+
+            for opponent_combo in combinations(opponent_hands, opponents):
+                if cls._are_disjoint(opponent_combo):
+                    results.add(hero_strength, [strength for _, strength in opponent_combo], weight)
+
+        return results.to_equity(True, cls.CONFIDENCE_Z)
+
+    @classmethod
+    def simulate(cls, hand: Sequence[Card], board: Sequence[Card] = (), opponents: int = 1,
+                 opponent_range: Optional[Iterable[Sequence[Card]]] = None, samples: Optional[int] = None,
+                 time_limit: Optional[float] = None, seed: Optional[int] = None) -> Equity:
+        """
+        Monte Carlo estimate, stops when the samples or the time limit (checked every BUDGET_CHECK_INTERVAL samples)
+        are exhausted. The same seed and sample budget give the same result.
+        """
+        if samples is None and time_limit is None:
+            samples = cls.SAMPLES
+
+        if samples is not None and samples < 1:
+            raise ValueError('At least 1 sample is required')
+
+        dead_cards = cls._validate(hand, board, opponents)
+        deck = cls._create_deck(dead_cards)
+        range_hands = None if opponent_range is None else cls._create_range_hands(opponent_range, deck, dead_cards)
+        board_evaluator = IncrementalHandEvaluator(board)
+        missing_cards = 5 - len(board)
+        random = Random(seed)
+        results = _Results()
+        start = perf_counter()
+
+        while samples is None or results.samples < samples:
+            if time_limit is not None and results.samples % cls.BUDGET_CHECK_INTERVAL == 0 \
+                    and results.samples > 0 and perf_counter() - start >= time_limit:
+                break
+
+            if range_hands is None:
+                cards = random.sample(deck, missing_cards + 2 * opponents)
+                runout = cards[:missing_cards]
+                opponent_hands = [cards[i:i + 2] for i in range(missing_cards, len(cards), 2)]
+            else:
+                opponent_hands, used_cards = cls._sample_range_hands(range_hands, opponents, random)
+                runout = random.sample([card for card in deck if not card.mask & used_cards], missing_cards)
+
+            runout_evaluator = board_evaluator.copy()
+            runout_evaluator.add_cards(runout)
+
+            results.add(cls._evaluate(runout_evaluator, hand),
+                        [cls._evaluate(runout_evaluator, cards) for cards in opponent_hands])
+
+        return results.to_equity(False, cls.CONFIDENCE_Z)
+
+    @staticmethod
+    def _validate(hand: Sequence[Card], board: Sequence[Card], opponents: int) -> int:
+        """
+        :return: Mask of the cards which can't be dealt anymore
+        """
+        if len(hand) != 2:
+            raise ValueError('Hand has to consist of 2 cards')
+
+        if len(board) > 5:
+            raise ValueError('Board can have at most 5 cards')
+
+        if opponents < 1:
+            raise ValueError('At least 1 opponent is required')
+
+        dead_cards = Card.to_mask(hand) | Card.to_mask(board)
+
+        if bin(dead_cards).count('1') != len(hand) + len(board):
+            raise ValueError('Hand and board contain duplicate cards')
+
+        if 52 - len(hand) - len(board) < 5 - len(board) + 2 * opponents:
+            raise ValueError('Not enough cards left for all opponents')
+
+        return dead_cards
+
+    @staticmethod
+    def _create_deck(dead_cards: int) -> List[Card]:
+        return [card for card in Deck().get_cards() if not card.mask & dead_cards]
+
+    @staticmethod
+    def _create_range_hands(opponent_range: Optional[Iterable[Sequence[Card]]], deck: List[Card],
+                            dead_cards: int) -> List[Tuple[int, Sequence[Card]]]:
+        """
+        :return: Mask and cards of the range hands which do not contain dead cards
+        """
+        if opponent_range is None:
+            return [(c1.mask | c2.mask, (c1, c2)) for c1, c2 in combinations(deck, 2)]
+
+        range_hands = dict()
+
+        for cards in opponent_range:
+            mask = Card.to_mask(cards)
+
+            if len(cards) != 2 or bin(mask).count('1') != 2:
+                raise ValueError('Range hands have to consist of 2 different cards')
+
+            if not mask & dead_cards:
+                range_hands[mask] = tuple(cards)
+
+        if len(range_hands) == 0:
+            raise ValueError('No hand of the opponent range is possible')
+
+        return list(range_hands.items())
+
+    @classmethod
+    def _sample_range_hands(cls, range_hands: List[Tuple[int, Sequence[Card]]], opponents: int,
+                            random: Random) -> Tuple[List[Sequence[Card]], int]:
+        """
+        Rejection sampling, so every combination of non overlapping range hands is equally likely.
+
+        :return: Opponent hands and the mask of their cards
+        """
+        for _ in range(cls.MAX_RANGE_REJECTIONS):
+            used_cards = 0
+            opponent_hands = []
+
+            for mask, cards in random.choices(range_hands, k=opponents):
+                if mask & used_cards:
+                    break
+
+                used_cards |= mask
+                opponent_hands.append(cards)
+
+            if len(opponent_hands) == opponents:
+                return opponent_hands, used_cards
+
+        raise ValueError('Opponent range is too narrow for the amount of opponents')
+
+    @staticmethod
+    def _count_combinations(n: int, k: int) -> int:
+        if k > n:
+            return 0
+
+        return factorial(n) // (factorial(k) * factorial(n - k))
+
+    @staticmethod
+    def _are_disjoint(opponent_hands: Sequence[Tuple[int, int]]) -> bool:
+        used_cards = 0
+
+        for mask, _ in opponent_hands:
+            if mask & used_cards:
+                return False
+
+            used_cards |= mask
+
+        return True
+
+    @staticmethod
+    def _evaluate(evaluator: IncrementalHandEvaluator, cards: Sequence[Card]) -> int:
+        return evaluator.evaluate_with(cards)
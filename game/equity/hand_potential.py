@@ -0,0 +1,17 @@
+from typing import NamedTuple
+
+
+class HandPotential(NamedTuple):
+    """
+    Hand strength and potential against one opponent (see Opponent Modeling in Poker by Billings et al.).
+
+    positive_potential is the probability that a hand which is currently behind (or tied) ends ahead,
+    negative_potential the probability that a hand which is currently ahead (or tied) ends behind.
+    """
+    hand_strength: float
+    positive_potential: float
+    negative_potential: float
+
+    @property
+    def effective_hand_strength(self) -> float:
+        return self.hand_strength * (1 - self.negative_potential) + (1 - self.hand_strength) * self.positive_potential
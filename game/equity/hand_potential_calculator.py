@@ -0,0 +1,173 @@
+from . import HandPotential
+from game import Card, Deck
+from game.final_hand import LookupTableEvaluator
+from itertools import combinations
+import numpy as np
+from typing import Dict, Sequence, Tuple
+
+AHEAD = 0
+TIED = 1
+BEHIND = 2
+
+
+class HandPotentialCalculator:
+    """
+    Exact hand strength and hand potential of a hand against all possible opponent hands and board run-outs.
+
+    Opponent hand and run-out are disjoint card sets of the remaining deck, so every final opponent hand is the board
+    plus one union of the two. Each union is evaluated once (C(47, 4) unions instead of C(47, 2) * C(45, 2) opponent
+    hand and run-out pairs on the flop), all splits of the unions are then compared without a python loop.
+    """
+    _positions: Dict[Tuple[int, int], np.ndarray] = {}
+    _pair_indices: Dict[int, np.ndarray] = {}
+    _splits: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def calculate(cls, hand: Sequence[Card], board: Sequence[Card]) -> HandPotential:
+        """
+        :param hand: Hero cards
+        :param board: Community cards, 3 to 5 cards
+        """
+        if len(hand) != 2:
+            raise ValueError('Hand has to consist of 2 cards')
+
+        if not 3 <= len(board) <= 5:
+            raise ValueError('Hand potential is calculated on boards of 3 to 5 cards')
+
+        dead_cards = Card.to_mask(hand) | Card.to_mask(board)
+
+        if bin(dead_cards).count('1') != len(hand) + len(board):
+            raise ValueError('Hand and board contain duplicate cards')
+
+        deck = np.array([card.id for card in Deck().get_cards() if not card.mask & dead_cards], dtype=np.int64)
+        board_ids = np.array([card.id for card in board], dtype=np.int64)
+        hand_ids = np.array([card.id for card in hand], dtype=np.int64)
+
+        opponent_hands = deck[cls._get_positions(len(deck), 2)]
+        hero_strength = cls._evaluate(np.concatenate((hand_ids, board_ids))[None, :])[0]
+        opponent_strengths = cls._evaluate(cls._join(board_ids, opponent_hands))
+        current = cls._compare(hero_strength, opponent_strengths)
+
+        ahead, tied, behind = (np.bincount(current, minlength=3) / len(current)).tolist()
+        hand_strength = ahead + tied / 2
+
+        if len(board) == 5:
+            return HandPotential(hand_strength, 0.0, 0.0)
+
+        potential = cls._count_potential(deck, hand_ids, board_ids, current)
+        totals = potential.sum(axis=1)
+
+        positive_potential = cls._divide(potential[BEHIND, AHEAD] + potential[BEHIND, TIED] / 2 +
+                                         potential[TIED, AHEAD] / 2, totals[BEHIND] + totals[TIED])
+        negative_potential = cls._divide(potential[AHEAD, BEHIND] + potential[TIED, BEHIND] / 2 +
+                                         potential[AHEAD, TIED] / 2, totals[AHEAD] + totals[TIED])
+
+        return HandPotential(hand_strength, positive_potential, negative_potential)
+
+    @classmethod
+    def build(cls) -> None:
+        """
+        Precomputes evaluation tables and the flop and turn splits, otherwise they are generated on first use.
+        """
+        LookupTableEvaluator.build()
+
+        for board_size in (3, 4):
+            cls._get_splits(52 - 2 - board_size, 5 - board_size)
+
+    @classmethod
+    def _count_potential(cls, deck: np.ndarray, hand_ids: np.ndarray, board_ids: np.ndarray,
+                         current: np.ndarray) -> np.ndarray:
+        """
+        :param current: AHEAD, TIED or BEHIND per opponent hand (in order of _get_positions(len(deck), 2))
+        :return: Counts of opponent hand and run-out pairs indexed by current and final state
+        """
+        missing_cards = 5 - len(board_ids)
+        unions = cls._get_positions(len(deck), 2 + missing_cards)
+        opponent_hands, runouts = cls._get_splits(len(deck), missing_cards)
+
+        hero_runouts = deck[cls._get_positions(len(deck), missing_cards)]
+        hero_strengths = cls._evaluate(cls._join(np.concatenate((hand_ids, board_ids)), hero_runouts))
+        opponent_strengths = cls._evaluate(cls._join(board_ids, deck[unions]))
+
+        final = cls._compare(hero_strengths[runouts], opponent_strengths[None, :])
+        counts = np.bincount((current[opponent_hands] * 3 + final).ravel(), minlength=9)
+
+        return counts.reshape(3, 3)
+
+    @classmethod
+    def _get_splits(cls, amount: int, missing_cards: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Every split of every union (_get_positions(amount, 2 + missing_cards)) into an opponent hand and a run-out.
+
+        :return: Opponent hand indices (see _get_positions(amount, 2)) and run-out indices (see
+            _get_positions(amount, missing_cards)), both with shape (splits per union, unions)
+        """
+        splits = cls._splits.get((amount, missing_cards))
+
+        if splits is None:
+            unions = cls._get_positions(amount, 2 + missing_cards)
+            pair_indices = cls._get_pair_indices(amount)
+            opponent_hands = []
+            runouts = []
+
+            for opponent_positions in combinations(range(2 + missing_cards), 2):
+                runout_positions = [i for i in range(2 + missing_cards) if i not in opponent_positions]
+                opponent_hands.append(pair_indices[unions[:, opponent_positions[0]], unions[:, opponent_positions[1]]])
+
+                if missing_cards == 2:
+                    runouts.append(pair_indices[unions[:, runout_positions[0]], unions[:, runout_positions[1]]])
+                else:
+                    runouts.append(unions[:, runout_positions[0]])
+
+            splits = np.array(opponent_hands), np.array(runouts)
+            cls._splits[(amount, missing_cards)] = splits
+
+        return splits
+
+    @classmethod
+    def _get_positions(cls, amount: int, size: int) -> np.ndarray:
+        """
+        :return: All combinations of size positions out of amount positions, with shape (combinations, size)
+        """
+        positions = cls._positions.get((amount, size))
+
+        if positions is None:
+            positions = np.array(list(combinations(range(amount), size)), dtype=np.int64).reshape(-1, size)
+            cls._positions[(amount, size)] = positions
+
+        return positions
+
+    @classmethod
+    def _get_pair_indices(cls, amount: int) -> np.ndarray:
+        """
+        :return: Matrix of the index in _get_positions(amount, 2) of each pair of positions
+        """
+        pair_indices = cls._pair_indices.get(amount)
+
+        if pair_indices is None:
+            pairs = cls._get_positions(amount, 2)
+            pair_indices = np.zeros((amount, amount), dtype=np.int64)
+            pair_indices[pairs[:, 0], pairs[:, 1]] = np.arange(len(pairs))
+            pair_indices[pairs[:, 1], pairs[:, 0]] = np.arange(len(pairs))
+            cls._pair_indices[amount] = pair_indices
+
+        return pair_indices
+
+    @staticmethod
+    def _evaluate(cards: np.ndarray) -> np.ndarray:
+        return LookupTableEvaluator.evaluate_batch(cards)[0]
+
+    @staticmethod
+    def _join(cards: np.ndarray, other_cards: np.ndarray) -> np.ndarray:
+        return np.concatenate((np.broadcast_to(cards, (len(other_cards), len(cards))), other_cards), axis=1)
+
+    @staticmethod
+    def _compare(hero_strengths: np.ndarray, opponent_strengths: np.ndarray) -> np.ndarray:
+        """
+        :return: AHEAD, TIED or BEHIND of the hero per comparison
+        """
+        return np.sign(opponent_strengths - hero_strengths).astype(np.int64) + TIED
+
+    @staticmethod
+    def _divide(numerator: float, denominator: float) -> float:
+        return float(numerator / denominator) if denominator > 0 else 0.0
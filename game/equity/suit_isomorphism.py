@@ -0,0 +1,110 @@
+from game import Card
+from game.deck.card import RANKS, SUITS
+from itertools import permutations
+from typing import Iterable, List, Sequence, Tuple
+
+SUIT_PERMUTATIONS = tuple(permutations(range(len(SUITS))))
+SUIT_MASKS = tuple(sum(1 << card_id for card_id in range(suit, len(RANKS) * len(SUITS), len(SUITS)))
+                   for suit in range(len(SUITS)))
+VALUE_KEYS = {value: 1 << (3 * (value - 1)) for value in range(1, len(RANKS) + 1)}
+
+
+class SuitIsomorphism:
+    """
+    Hand evaluation does not depend on the suits themselves, only on which cards share a suit. Card sets which are
+    mapped onto each other by a permutation of the suits that leaves the known cards unchanged (e.g. the suits which
+    are not on the board yet) are therefore equivalent, and only one of them has to be evaluated, weighted by the
+    amount of equivalent sets. Suits which can't make a flush with the board are not relevant at all, so cards of those
+    suits are compared by value only.
+    """
+
+    @staticmethod
+    def find_symmetries(cards: Iterable[Card]) -> List[Tuple[int, ...]]:
+        """
+        :return: Suit permutations (new suit index per suit index) which map the cards onto themselves
+        """
+        mask = Card.to_mask(cards)
+
+        return [permutation for permutation in SUIT_PERMUTATIONS
+                if SuitIsomorphism._permute_mask(mask, permutation) == mask]
+
+    @staticmethod
+    def permute(cards: Iterable[Card], permutation: Sequence[int]) -> List[Card]:
+        return [Card.from_id(SuitIsomorphism._permute_id(card.id, permutation)) for card in cards]
+
+    @staticmethod
+    def reduce(card_sets: Iterable[Sequence[Card]], known_cards: Iterable[Card], board: Sequence[Card] = ()) \
+            -> List[Tuple[Sequence[Card], int]]:
+        """
+        :param card_sets: Card sets of the same size to evaluate, e.g. all opponent hands
+        :param known_cards: Cards which take part in the evaluations or can't be in a card set, e.g. hand and board
+        :param board: Cards every card set is evaluated with, if given, cards of suits which can't make a flush with the
+            board are compared by value only
+        :return: One card set of every group of equivalent card sets, with the size of the group as weight
+        """
+        card_sets = list(card_sets)
+        symmetries = SuitIsomorphism.find_symmetries(known_cards)
+        suitless_mask = 0
+
+        if len(board) > 0 and len(card_sets) > 0:
+            board_mask = Card.to_mask(board)
+            symmetries = [permutation for permutation in symmetries
+                          if SuitIsomorphism._permute_mask(board_mask, permutation) == board_mask]
+            suitless_mask = SuitIsomorphism._find_suitless_mask(board, max(len(card_set) for card_set in card_sets))
+
+        if len(symmetries) == 1 and suitless_mask == 0:
+            return [(card_set, 1) for card_set in card_sets]
+
+        reduced = dict()
+        deck_size = len(RANKS) * len(SUITS)
+
+        for card_set in card_sets:
+            mask = 0
+            suitless_key = 0
+
+            for card in card_set:
+                if card.mask & suitless_mask:
+                    suitless_key += VALUE_KEYS[card.value]
+                else:
+                    mask |= card.mask
+
+            if len(symmetries) > 1:
+                mask = min(SuitIsomorphism._permute_mask(mask, permutation) for permutation in symmetries)
+
+            key = mask | (suitless_key << deck_size)
+            entry = reduced.get(key)
+
+            if entry is None:
+                reduced[key] = [card_set, 1]
+            else:
+                entry[1] += 1
+
+        return [(card_set, weight) for card_set, weight in reduced.values()]
+
+    @staticmethod
+    def _find_suitless_mask(board: Sequence[Card], set_size: int) -> int:
+        """
+        :return: Mask of all cards of the suits which can't have 5 cards on the board plus one card set
+        """
+        suitless_mask = 0
+
+        for suit in range(len(SUITS)):
+            if sum(1 for card in board if card.id % len(SUITS) == suit) + set_size < 5:
+                suitless_mask |= SUIT_MASKS[suit]
+
+        return suitless_mask
+
+    @staticmethod
+    def _permute_id(card_id: int, permutation: Sequence[int]) -> int:
+        return card_id - card_id % len(SUITS) + permutation[card_id % len(SUITS)]
+
+    @staticmethod
+    def _permute_mask(mask: int, permutation: Sequence[int]) -> int:
+        permuted_mask = 0
+
+        while mask:
+            card_mask = mask & -mask
+            permuted_mask |= 1 << SuitIsomorphism._permute_id(card_mask.bit_length() - 1, permutation)
+            mask ^= card_mask
+
+        return permuted_mask
@@ -1,3 +1,5 @@
 from .final_hand_type import FinalHandType
 from .final_hand import FinalHand
+from .lookup_table_evaluator import LookupTableEvaluator
+from .incremental_hand_evaluator import IncrementalHandEvaluator
 from .strongest_final_hand_finder import StrongestFinalHandFinder
@@ -1,9 +1,24 @@
 from . import FinalHandType
 from game import Card
-from typing import List, NamedTuple
+from typing import Iterable, NamedTuple, Tuple
 
 
 class FinalHand(NamedTuple):
-    hand: List[Card]
+    hand: Tuple[Card, ...]
     type: FinalHandType
     score: int
+    strength: int
+
+    @staticmethod
+    def calculate_strength(score: int, hand_values: Iterable[int]) -> int:
+        """
+        Strength is the score followed by the 5 hand values (4 bits each, in descending order), so comparing strengths
+        gives the same result as comparing scores and, on equal scores, the hand values card by card.
+        """
+        strength = score
+        sorted_values = sorted(hand_values, reverse=True)
+
+        for i in range(5):
+            strength = (strength << 4) | (sorted_values[i] if i < len(sorted_values) else 0)
+
+        return strength
@@ -0,0 +1,118 @@
+from . import FinalHandType, FinalHand, LookupTableEvaluator
+from .lookup_table_evaluator import CARD_KEYS, HandEntry
+from game import Card
+from game.deck.card import SUITS
+from typing import Iterable, List, Sequence
+
+
+class IncrementalHandEvaluator:
+    """
+    Final hand of a growing set of cards (e.g. hand plus community cards dealt phase by phase).
+
+    Rank counts and suit counts are kept packed in one key (see LookupTableEvaluator) together with a bit mask of
+    values per suit, so adding a card is a constant amount of work and the best hand of the current cards is a single
+    table lookup. Results are the same as StrongestFinalHandFinder.find of the cards in the order they were added.
+    """
+
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        self._cards = []
+        self._mask = 0
+        self._key = 0
+        self._suit_value_masks = [0 for _ in SUITS]
+        self._entry = None
+        self._flush_suit = None
+
+        self.add_cards(cards)
+
+    @property
+    def cards(self) -> List[Card]:
+        return list(self._cards)
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    @property
+    def strength(self) -> int:
+        """
+        :return: Hand strength (see FinalHand.strength)
+        """
+        if self._entry is not None:
+            return self._entry[3]
+
+        if len(self._cards) == 0:
+            raise ValueError('No cards to evaluate')
+
+        return LookupTableEvaluator.evaluate_key(self._key, self._suit_value_masks)
+
+    @property
+    def type(self) -> FinalHandType:
+        return self._get_entry()[0]
+
+    @property
+    def score(self) -> int:
+        return self._get_entry()[2]
+
+    def add_card(self, card: Card) -> None:
+        self._cards.append(card)
+        self._mask |= card.mask
+        self._key += CARD_KEYS[card.id]
+        self._suit_value_masks[card.id % len(SUITS)] |= 1 << (card.value - 1)
+        self._entry = None
+
+    def add_cards(self, cards: Iterable[Card]) -> None:
+        for card in cards:
+            self.add_card(card)
+
+    def evaluate_with(self, cards: Sequence[Card]) -> int:
+        """
+        Strength of the cards together with additional cards (e.g. a player hand to the community cards), without
+        changing or copying the evaluator.
+
+        :return: Hand strength (see FinalHand.strength)
+        """
+        key = self._key
+
+        for card in cards:
+            key += CARD_KEYS[card.id]
+
+        return LookupTableEvaluator.evaluate_key(key, self._suit_value_masks, cards)
+
+    def copy(self) -> 'IncrementalHandEvaluator':
+        """
+        Copy which can be extended independently, e.g. the community cards evaluator per player hand.
+        """
+        evaluator = IncrementalHandEvaluator()
+        evaluator._cards = list(self._cards)
+        evaluator._mask = self._mask
+        evaluator._key = self._key
+        evaluator._suit_value_masks = list(self._suit_value_masks)
+        evaluator._entry = self._entry
+        evaluator._flush_suit = self._flush_suit
+
+        return evaluator
+
+    def find(self) -> FinalHand:
+        entry = self._get_entry()
+
+        return LookupTableEvaluator._create_final_hand(self._cards, entry, self._flush_suit)
+
+    def reset(self) -> None:
+        self._cards = []
+        self._mask = 0
+        self._key = 0
+        self._suit_value_masks = [0 for _ in SUITS]
+        self._entry = None
+        self._flush_suit = None
+
+    def _get_entry(self) -> HandEntry:
+        if self._entry is None:
+            if len(self._cards) == 0:
+                raise ValueError('No cards to evaluate')
+
+            self._entry, self._flush_suit = LookupTableEvaluator._lookup_key(self._key, self._suit_value_masks)
+
+        return self._entry
+
+    def __len__(self) -> int:
+        return len(self._cards)
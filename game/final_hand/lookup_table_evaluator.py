@@ -0,0 +1,337 @@
+from . import FinalHandType, FinalHand
+from game import Card
+from game.deck.card import RANKS, SUITS
+from itertools import combinations_with_replacement
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+HandEntry = Tuple[FinalHandType, Tuple[int, ...], int, int]
+
+VALUE_BITS = 3
+SUIT_COUNT = len(SUITS)
+SUIT_KEY_SHIFT = VALUE_BITS * len(RANKS)
+RANK_KEY_MASK = (1 << SUIT_KEY_SHIFT) - 1
+RANK_KEYS = {value: 1 << (VALUE_BITS * (value - 1)) for value in range(1, len(RANKS) + 1)}
+SUIT_KEYS = {suit: 1 << (VALUE_BITS * i) for i, suit in enumerate(SUITS)}
+CARD_KEYS = [RANK_KEYS[Card.from_id(card_id).value] | (SUIT_KEYS[Card.from_id(card_id).suit] << SUIT_KEY_SHIFT)
+             for card_id in range(len(RANKS) * len(SUITS))]
+
+
+class LookupTableEvaluator:
+    """
+    Table driven replacement for the search in StrongestFinalHandFinder.
+
+    Every card adds a fixed amount (indexed by card id) to a rank key (3 bits per value) and a suit key (3 bits per
+    suit) packed into one integer, so a hand is classified by one addition per card followed by a single table lookup.
+    Tables reproduce the result of the search algorithm exactly (hand type, score, selected cards and tie-break),
+    including its handling of paired straights and the 4 card wheel. All tables are generated at once on first use
+    (or by build), so a lookup never has to generate an entry.
+
+    evaluate and evaluate_type only look up the strength or type of a hand, find additionally picks the cards of the
+    final hand and should only be used when they are needed.
+    """
+    _rank_table: Dict[int, HandEntry] = {}
+    _rank_strengths: Dict[int, int] = {}
+    _flush_table: List[Optional[HandEntry]] = []
+    _flush_strengths: List[int] = []
+    _flush_suits: List[int] = []
+    _batch_tables: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def find(cls, cards: List[Card]) -> FinalHand:
+        entry, flush_suit = cls._lookup(cards)
+
+        return cls._create_final_hand(cards, entry, flush_suit)
+
+    @classmethod
+    def evaluate(cls, cards: Sequence[Card]) -> int:
+        """
+        :return: Hand strength (see FinalHand.strength)
+        """
+        if len(cls._flush_suits) == 0:
+            cls.build()
+
+        key = 0
+
+        for card in cards:
+            key += CARD_KEYS[card.id]
+
+        flush_suit_index = cls._flush_suits[key >> SUIT_KEY_SHIFT]
+
+        if flush_suit_index < 0:
+            return cls._rank_strengths[key & RANK_KEY_MASK]
+
+        return cls._flush_strengths[cls._find_flush_mask(cards, flush_suit_index)]
+
+    @classmethod
+    def evaluate_type(cls, cards: Sequence[Card]) -> FinalHandType:
+        return cls._lookup(cards)[0][0]
+
+    @classmethod
+    def evaluate_key(cls, key: int, suit_value_masks: List[int], cards: Sequence[Card] = ()) -> int:
+        """
+        Strength of already accumulated cards (see IncrementalHandEvaluator).
+
+        :param key: Sum of CARD_KEYS of all cards
+        :param suit_value_masks: Per suit (SUITS order) bit mask of card values (bit value - 1)
+        :param cards: Cards included in the key but not in the suit value masks
+        """
+        if len(cls._flush_suits) == 0:
+            cls.build()
+
+        flush_suit_index = cls._flush_suits[key >> SUIT_KEY_SHIFT]
+
+        if flush_suit_index < 0:
+            return cls._rank_strengths[key & RANK_KEY_MASK]
+
+        return cls._flush_strengths[suit_value_masks[flush_suit_index] | cls._find_flush_mask(cards, flush_suit_index)]
+
+    @classmethod
+    def evaluate_batch(cls, cards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized evaluate for many hands of the same size.
+
+        :param cards: Card ids with shape (amount of hands, cards per hand)
+        :return: Hand strengths (as evaluate) and FinalHandType values, both with shape (amount of hands,)
+        """
+        cards = np.asarray(cards, dtype=np.int64)
+
+        if cards.ndim != 2 or cards.shape[1] < 1:
+            raise ValueError('Cards have to be a 2 dimensional array of card ids')
+
+        tables = cls._get_batch_tables()
+
+        keys = tables['card_keys'][cards].sum(axis=1)
+        rank_keys = keys & RANK_KEY_MASK
+        flush_suits = tables['flush_suits'][keys >> SUIT_KEY_SHIFT]
+
+        indices = np.searchsorted(tables['rank_keys'], rank_keys)
+        strengths = tables['strengths'][indices]
+        types = tables['types'][indices]
+
+        is_flush = flush_suits >= 0
+
+        if is_flush.any():
+            flush_cards = cards[is_flush]
+            is_flush_suit = tables['card_suits'][flush_cards] == flush_suits[is_flush][:, None]
+            flush_masks = (tables['card_value_bits'][flush_cards] * is_flush_suit).sum(axis=1)
+            strengths[is_flush] = tables['flush_strengths'][flush_masks]
+            types[is_flush] = tables['flush_types'][flush_masks]
+
+        return strengths, types
+
+    @classmethod
+    def build(cls) -> None:
+        if len(cls._flush_suits) == 0:
+            cls._build_rank_table()
+            cls._build_flush_table()
+            cls._build_flush_suits()
+
+    @classmethod
+    def _lookup(cls, cards: Sequence[Card]) -> Tuple[HandEntry, Optional[str]]:
+        if len(cls._flush_suits) == 0:
+            cls.build()
+
+        key = 0
+
+        for card in cards:
+            key += CARD_KEYS[card.id]
+
+        flush_suit_index = cls._flush_suits[key >> SUIT_KEY_SHIFT]
+
+        if flush_suit_index < 0:
+            return cls._rank_table[key & RANK_KEY_MASK], None
+
+        return cls._flush_table[cls._find_flush_mask(cards, flush_suit_index)], SUITS[flush_suit_index]
+
+    @classmethod
+    def _lookup_key(cls, key: int, suit_value_masks: List[int]) -> Tuple[HandEntry, Optional[str]]:
+        """
+        Lookup of already accumulated cards (see evaluate_key).
+        """
+        if len(cls._flush_suits) == 0:
+            cls.build()
+
+        flush_suit_index = cls._flush_suits[key >> SUIT_KEY_SHIFT]
+
+        if flush_suit_index < 0:
+            return cls._rank_table[key & RANK_KEY_MASK], None
+
+        return cls._flush_table[suit_value_masks[flush_suit_index]], SUITS[flush_suit_index]
+
+    @staticmethod
+    def _find_flush_mask(cards: Sequence[Card], flush_suit_index: int) -> int:
+        flush_mask = 0
+
+        for card in cards:
+            if card.id % SUIT_COUNT == flush_suit_index:
+                flush_mask |= 1 << (card.value - 1)
+
+        return flush_mask
+
+    @staticmethod
+    def _create_final_hand(cards: Sequence[Card], entry: HandEntry, flush_suit: Optional[str]) -> FinalHand:
+        """
+        Picks the cards the search algorithm would: of equally valued cards the first ones in the order given (its sort
+        is stable), except for the top of a straight, which is the last card of its value.
+        """
+        hand_type, hand_values, score, strength = entry
+        cards_by_value = dict()
+
+        for card in cards:
+            if flush_suit is None or card.suit == flush_suit:
+                same_value_cards = cards_by_value.get(card.value)
+
+                if same_value_cards is None:
+                    cards_by_value[card.value] = [card]
+                else:
+                    same_value_cards.append(card)
+
+        if hand_type is FinalHandType.STRAIGHT:
+            hand = [cards_by_value[hand_values[0]][-1]] + [cards_by_value[value][0] for value in hand_values[1:]]
+        else:
+            hand = [cards_by_value[value].pop(0) for value in hand_values]
+
+        return FinalHand(tuple(hand), hand_type, score, strength)
+
+    @classmethod
+    def _build_rank_table(cls) -> None:
+        values = range(len(RANKS), 0, -1)
+        rank_table = {}
+
+        for amount in range(1, 8):
+            for hand_values in combinations_with_replacement(values, amount):
+                if any(hand_values[i] == hand_values[i + 4] for i in range(amount - 4)):
+                    continue
+
+                rank_table[sum(RANK_KEYS[value] for value in hand_values)] = \
+                    cls._create_entry(*cls._classify(hand_values))
+
+        cls._rank_table = rank_table
+        cls._rank_strengths = {rank_key: entry[3] for rank_key, entry in rank_table.items()}
+
+    @classmethod
+    def _get_batch_tables(cls) -> Dict[str, np.ndarray]:
+        if cls._batch_tables is None:
+            cls.build()
+
+            rank_keys = sorted(cls._rank_table)
+            flush_entries = [(entry[3], entry[0].value) if entry is not None else (0, 0) for entry in cls._flush_table]
+            cards = [Card.from_id(card_id) for card_id in range(len(CARD_KEYS))]
+
+            cls._batch_tables = {
+                'card_keys': np.array(CARD_KEYS, dtype=np.int64),
+                'card_suits': np.array([SUITS.index(card.suit) for card in cards], dtype=np.int64),
+                'card_value_bits': np.array([1 << (card.value - 1) for card in cards], dtype=np.int64),
+                'flush_suits': np.array(cls._flush_suits, dtype=np.int64),
+                'rank_keys': np.array(rank_keys, dtype=np.int64),
+                'strengths': np.array([cls._rank_table[key][3] for key in rank_keys], dtype=np.int64),
+                'types': np.array([cls._rank_table[key][0].value for key in rank_keys], dtype=np.int64),
+                'flush_strengths': np.array([entry[0] for entry in flush_entries], dtype=np.int64),
+                'flush_types': np.array([entry[1] for entry in flush_entries], dtype=np.int64)
+            }
+
+        return cls._batch_tables
+
+    @classmethod
+    def _build_flush_table(cls) -> None:
+        values = range(len(RANKS), 0, -1)
+        cls._flush_table = [None for _ in range(1 << len(RANKS))]
+
+        for amount in range(5, 8):
+            for hand_values in combinations_with_replacement(values, amount):
+                if len(set(hand_values)) != amount:
+                    continue
+
+                flush_mask = sum(1 << (value - 1) for value in hand_values)
+                cls._flush_table[flush_mask] = cls._create_entry(*cls._classify_flush(hand_values))
+
+        cls._flush_strengths = [entry[3] if entry is not None else 0 for entry in cls._flush_table]
+
+    @classmethod
+    def _build_flush_suits(cls) -> None:
+        flush_suits = [-1 for _ in range(1 << (VALUE_BITS * len(SUITS)))]
+
+        for suit_key in range(len(flush_suits)):
+            for i in range(len(SUITS)):
+                if (suit_key >> (VALUE_BITS * i)) & 0b111 >= 5:
+                    flush_suits[suit_key] = i
+
+        cls._flush_suits = flush_suits
+
+    @classmethod
+    def _create_entry(cls, hand_type: FinalHandType, hand_values: List[int]) -> HandEntry:
+        if hand_type is FinalHandType.TWO_PAIRS or hand_type is FinalHandType.FULL_HOUSE:
+            score = hand_values[0] * hand_type.value + hand_values[3]
+        else:
+            score = hand_values[0] * hand_type.value
+
+        return hand_type, tuple(hand_values), score, FinalHand.calculate_strength(score, hand_values)
+
+    @staticmethod
+    def _classify_flush(values: Tuple[int, ...]) -> Tuple[FinalHandType, List[int]]:
+        flush = list(values[:5])
+        straight = LookupTableEvaluator._find_straight(flush)
+
+        if straight is None:
+            return FinalHandType.FLUSH, flush
+
+        if straight == [13, 12, 11, 10, 9]:
+            return FinalHandType.ROYAL_FLUSH, straight
+
+        return FinalHandType.STRAIGHT_FLUSH, straight
+
+    @staticmethod
+    def _classify(values: Tuple[int, ...]) -> Tuple[FinalHandType, List[int]]:
+        counts = dict()
+
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+
+        quads = [value for value in counts if counts[value] >= 4]
+        trips = [value for value in counts if counts[value] == 3]
+        pairs = [value for value in counts if counts[value] >= 2]
+
+        if len(quads) > 0:
+            return FinalHandType.POKER, [quads[0]] * 4 + [v for v in values if v != quads[0]][:1]
+
+        if len(trips) > 0:
+            full_house_pairs = [value for value in pairs if value != trips[0]]
+            if len(full_house_pairs) > 0:
+                return FinalHandType.FULL_HOUSE, [trips[0]] * 3 + [full_house_pairs[0]] * 2
+
+        straight = LookupTableEvaluator._find_straight(list(values))
+        if straight is not None:
+            return FinalHandType.STRAIGHT, straight
+
+        if len(trips) > 0:
+            return FinalHandType.TRIS, [trips[0]] * 3 + [v for v in values if v != trips[0]][:2]
+
+        if len(pairs) > 1:
+            kicker = [v for v in values if v != pairs[0] and v != pairs[1]][:1]
+            return FinalHandType.TWO_PAIRS, [pairs[0]] * 2 + [pairs[1]] * 2 + kicker
+
+        if len(pairs) > 0:
+            return FinalHandType.PAIR, [pairs[0]] * 2 + [v for v in values if v != pairs[0]][:3]
+
+        return FinalHandType.HIGH_CARD, list(values[:5])
+
+    @staticmethod
+    def _find_straight(values: List[int]) -> Optional[List[int]]:
+        """
+        Mirrors StrongestFinalHandFinder._try_find_straight on card values sorted in descending order.
+        """
+        cnt = 0
+
+        for i in range(1, len(values)):
+            if values[i] != values[i - 1] - 1:
+                cnt = 0
+            else:
+                cnt += 1
+                if cnt == 4:
+                    return values[i - 4:i + 1]
+
+        if cnt == 3 and values[0] == 13 and values[-1] == 1:
+            return values[len(values) - 4:-1] + [values[0]]
+
+        return None
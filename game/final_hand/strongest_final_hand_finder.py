@@ -1,11 +1,37 @@
-from . import FinalHandType, FinalHand
+from . import FinalHandType, FinalHand, LookupTableEvaluator
 from game import Card
-from typing import Dict, List, Optional
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
 
 
 class StrongestFinalHandFinder:
+    USE_LOOKUP_TABLE = True
+
     @staticmethod
     def find(cards: List[Card]) -> FinalHand:
+        if StrongestFinalHandFinder.USE_LOOKUP_TABLE:
+            return LookupTableEvaluator.find(cards)
+
+        return StrongestFinalHandFinder._search(cards)
+
+    @staticmethod
+    def find_batch(cards: np.ndarray, with_types: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Evaluates many hands at once without a python loop.
+
+        :param cards: Card ids (see Card.id) with shape (amount of hands, cards per hand)
+        :param with_types: Additionally return FinalHandType values of the hands
+        :return: Hand strengths (see FinalHand.strength)
+        """
+        strengths, types = LookupTableEvaluator.evaluate_batch(cards)
+
+        if with_types:
+            return strengths, types
+
+        return strengths
+
+    @staticmethod
+    def _search(cards: List[Card]) -> FinalHand:
         hand = sorted(cards, reverse=True)
         final_hand = StrongestFinalHandFinder._try_find_flush(hand)
 
@@ -47,22 +73,10 @@ class StrongestFinalHandFinder:
 
     @staticmethod
     def find_stronger_hand(final_hand1: FinalHand, final_hand2: FinalHand) -> Optional[FinalHand]:
-        if final_hand1.score == final_hand2.score:
-            hand1 = sorted(final_hand1.hand, reverse=True)
-            hand2 = sorted(final_hand2.hand, reverse=True)
-
-            nbr_of_cards = len(hand1) if len(hand1) < len(hand2) else len(hand2)
-
-            for i in range(nbr_of_cards):
-                if hand1[i].value > hand2[i].value:
-                    return final_hand1
-
-                if hand2[i].value > hand1[i].value:
-                    return final_hand2
-
+        if final_hand1.strength == final_hand2.strength:
             return None
 
-        elif final_hand1.score > final_hand2.score:
+        elif final_hand1.strength > final_hand2.strength:
             return final_hand1
 
         else:
@@ -75,7 +89,9 @@ class StrongestFinalHandFinder:
         else:
             score = hand[0].value * hand_type.value
 
-        return FinalHand(hand=hand, type=hand_type, score=score)
+        strength = FinalHand.calculate_strength(score, [card.value for card in hand])
+
+        return FinalHand(hand=tuple(hand), type=hand_type, score=score, strength=strength)
 
     @staticmethod
     def _try_find_flush(sorted_cards: List[Card]) -> Optional[List[Card]]:
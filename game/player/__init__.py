@@ -5,6 +5,7 @@ from .terminal_player import TerminalPlayer
 from .random_bot import RandomBot
 from .semi_random_bot import SemiRandomBot
 from .dqn import SimpleDqnBot, CollectiveSimpleDqnBot, MonitoredSimpleDqnBot, SimpleDqnBot3l
+from .sklansky_groups import SklanskyGroups
 from .opponent_bot import OpponentBot
 from .opponend_bot_gold import OpponentBotGold
 from .opponent_bot_silver import OpponentBotSilver
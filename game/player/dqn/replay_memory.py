@@ -1,4 +1,5 @@
-from random import sample
+from random import Random
+import random as global_random
 from typing import Any, List
 
 
@@ -11,6 +12,7 @@ class ReplayMemory:
         self._batch_size = batch_size
         self._memory = []
         self._memory_index = 0
+        self._random = global_random
 
     @property
     def memory_size(self) -> int:
@@ -20,11 +22,19 @@ class ReplayMemory:
     def batch_size(self) -> int:
         return self._batch_size
 
+    @property
+    def random(self) -> Random:
+        return self._random
+
+    @random.setter
+    def random(self, random: Random) -> None:
+        self._random = random
+
     def can_sample(self) -> bool:
         return len(self._memory) >= self._batch_size
 
     def get_sample(self) -> List[Any]:
-        return sample(self._memory, self._batch_size)
+        return self._random.sample(self._memory, self._batch_size)
 
     def insert(self, experience: Any) -> None:
         if len(self._memory) < self._memory_size:
@@ -3,7 +3,7 @@ from .simple_neural_network import SimpleNeuralNetwork, Experience, BatchOfExper
 from .state_interpreter import InterpretableState
 from game import Moves, State, Utils
 from game.player import Mode, SemiRandomBot
-from random import random
+from random import Random
 from typing import List, Optional
 
 
@@ -50,6 +50,11 @@ class SimpleDqnBot(SemiRandomBot):
         self._mode = mode
         self._nn.activate_mode(mode)
 
+    @SemiRandomBot.random.setter
+    def random(self, random: Random) -> None:
+        self._random = random
+        self._replay_memory.random = random
+
     def make_move(self, possible_moves: List[Moves], state: State) -> Moves:
         self._update_states(state)
         self._update_chips()
@@ -107,7 +112,7 @@ class SimpleDqnBot(SemiRandomBot):
         return self._chips == 0 or self._chips == self._total_chips_amount
 
     def _determine_current_move(self, possible_moves: List[Moves]) -> None:
-        if self._mode is Mode.TRAIN and random() < round(self._epsilon, 2):
+        if self._mode is Mode.TRAIN and self._random.random() < round(self._epsilon, 2):
             self._explore(possible_moves)
         else:
             self._exploit(possible_moves)
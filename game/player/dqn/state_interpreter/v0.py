@@ -1,6 +1,6 @@
 from .base import Base
 from . import InterpretableState
-from game.final_hand import FinalHandType, StrongestFinalHandFinder
+from game.final_hand import FinalHandType, LookupTableEvaluator
 from typing import List
 
 
@@ -26,10 +26,10 @@ class V0(Base):
     def _generate_card_state_part(state: InterpretableState) -> List[float]:
         cards_state_part = []
 
-        final_hand = StrongestFinalHandFinder.find(list(state.hand + state.game_state.community_cards))
+        hand_type = LookupTableEvaluator.evaluate_type(state.hand + state.game_state.community_cards)
 
         for t in FinalHandType:
-            if final_hand.type is t:
+            if hand_type is t:
                 cards_state_part.append(1.0)
             else:
                 cards_state_part.append(0.0)
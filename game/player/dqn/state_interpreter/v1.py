@@ -1,5 +1,6 @@
 from .base import Base
 from . import InterpretableState
+from game.deck import Card
 from typing import List
 
 
@@ -23,9 +24,10 @@ class V1(Base):
 
     def _generate_card_state_part(self, state: InterpretableState) -> List[float]:
         cards_state_part = []
+        known_cards = Card.to_mask(state.hand) | Card.to_mask(state.game_state.community_cards)
 
         for card in self._deck.get_cards():
-            if card in state.hand or card in state.game_state.community_cards:
+            if card.mask & known_cards:
                 cards_state_part.append(1.0)
             else:
                 cards_state_part.append(0.0)
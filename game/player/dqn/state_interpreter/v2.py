@@ -1,7 +1,8 @@
 from .base import Base
+from game.deck import Card
 from game.player.dqn.state_interpreter import InterpretableState
 from game.moves import Moves
-from game.final_hand import FinalHandType, StrongestFinalHandFinder
+from game.final_hand import FinalHandType, LookupTableEvaluator
 from typing import List, Tuple
 
 
@@ -28,14 +29,16 @@ class V2(Base):
     def _generate_cards_states_parts(self, state: InterpretableState) -> Tuple[List[float], List[float]]:
         hand_state_part = []
         community_cards_state_part = []
+        hand = Card.to_mask(state.hand)
+        community_cards = Card.to_mask(state.game_state.community_cards)
 
         for card in self._deck.get_cards():
-            if card in state.hand:
+            if card.mask & hand:
                 hand_state_part.append(1.0)
             else:
                 hand_state_part.append(0.0)
 
-            if card in state.game_state.community_cards:
+            if card.mask & community_cards:
                 community_cards_state_part.append(1.0)
             else:
                 community_cards_state_part.append(0.0)
@@ -58,10 +61,10 @@ class V2(Base):
     def _generate_hand_type_state_part(state: InterpretableState) -> List[float]:
         hand_type_state_part = []
 
-        final_hand = StrongestFinalHandFinder.find(list(state.hand + state.game_state.community_cards))
+        hand_type = LookupTableEvaluator.evaluate_type(state.hand + state.game_state.community_cards)
 
         for t in FinalHandType:
-            if final_hand.type is t:
+            if hand_type is t:
                 hand_type_state_part.append(1.0)
             else:
                 hand_type_state_part.append(0.0)
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from game import Card, Moves, State
+from random import Random
+import random as global_random
 from typing import List, Optional
 
 
@@ -11,11 +13,23 @@ class Player(ABC):
         if name is None:
             name = type(self).__name__
         self._name = name
+        self._random = global_random
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def random(self) -> Random:
+        """
+        Generator for the player's random decisions, the global generator unless the table assigns one.
+        """
+        return self._random
+
+    @random.setter
+    def random(self, random: Random) -> None:
+        self._random = random
+
     @property
     def wager(self) -> int:
         return self._wager
@@ -0,0 +1,77 @@
+from game import Card
+from game.deck.card import RANKS
+from itertools import combinations
+from typing import Dict, Sequence, Tuple
+
+
+class SklanskyGroups:
+    """
+    Sklansky & Malmuth starting hands table.
+    https://www.thepokerbank.com/strategy/basic/starting-hand-selection/sklansky-groups/
+
+    Hands are written by rank symbols (T stands for 10), an 's' marks suited hands, hands without it are either suited
+    or not. A hand belongs to the first group it is listed in, hands which are not listed belong to the last group.
+    The strengths of all 1326 starting hands are generated on import, keyed by the mask of their cards.
+    """
+    GROUPS: Tuple[Tuple[str, ...], ...] = (
+        ('AA', 'AKs', 'KK', 'QQ', 'JJ'),
+        ('AK', 'AQs', 'AJs', 'KQs', 'TT'),
+        ('AQ', 'ATs', 'KJs', 'QJs', 'JTs', '99'),
+        ('AJ', 'KQ', 'KTs', 'QTs', 'J9s', 'T9s', '98s', '88'),
+        ('A9s', 'A8s', 'A7s', 'A6s', 'A5s', 'A4s', 'A3s', 'A2s', 'KJ', 'QJ', 'JT', 'Q9s', 'T8s', '97s', '87s', '77',
+         '76s', '66'),
+        ('AT', 'KT', 'QT', 'J8s', '86s', '75s', '65s', '55', '54s'),
+        ('K9s', 'K8s', 'K7s', 'K6s', 'K5s', 'K4s', 'K3s', 'K2s', 'J9', 'T9', '98', '64s', '53s', '44', '43s', '33',
+         '22'),
+        ('A9', 'K9', 'Q9', 'J8', 'J7s', 'T8', '96s', '87', '85s', '76', '74s', '65', '54', '42s', '32s')
+    )
+    STRENGTHS = (100, 88, 77, 66, 55, 44, 33, 22, 11)
+    SYMBOLS = ('2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A')
+
+    _strengths: Dict[int, int] = {}
+
+    @classmethod
+    def get_strength(cls, hand: Sequence[Card]) -> int:
+        """
+        :param hand: 2 starting hand cards
+        :return: Strength of the hand's group, between 11 and 100
+        """
+        return cls._strengths[hand[0].mask | hand[1].mask]
+
+    @classmethod
+    def get_group(cls, hand: Sequence[Card]) -> int:
+        """
+        :return: Group number of the hand, between 1 and 9
+        """
+        return cls.STRENGTHS.index(cls.get_strength(hand)) + 1
+
+    @staticmethod
+    def get_canonical_hand(hand: Sequence[Card]) -> str:
+        """
+        :return: One of the 169 distinct starting hands in group notation, suited hands always end with 's'
+        """
+        c1, c2 = sorted(hand, reverse=True)
+        canonical_hand = SklanskyGroups.SYMBOLS[c1.value - 1] + SklanskyGroups.SYMBOLS[c2.value - 1]
+
+        if c1.suit == c2.suit:
+            canonical_hand += 's'
+
+        return canonical_hand
+
+    @classmethod
+    def _build(cls) -> None:
+        groups = dict()
+
+        for group, hands in enumerate(cls.GROUPS):
+            for hand in hands:
+                groups.setdefault(hand, group)
+
+        cards = [Card.from_id(card_id) for card_id in range(len(RANKS) * 4)]
+
+        for hand in combinations(cards, 2):
+            canonical_hand = cls.get_canonical_hand(hand)
+            group = min(groups.get(canonical_hand, len(cls.GROUPS)), groups.get(canonical_hand[:2], len(cls.GROUPS)))
+            cls._strengths[hand[0].mask | hand[1].mask] = cls.STRENGTHS[group]
+
+
+SklanskyGroups._build()
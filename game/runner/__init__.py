@@ -0,0 +1,2 @@
+from .tournament_result import TournamentResult
+from .parallel_tournament_runner import ParallelTournamentRunner
@@ -0,0 +1,271 @@
+from . import TournamentResult
+from game import RandomStreams, Utils
+from game.player import Player as BasicPlayer
+from game.table import Table
+import json
+from multiprocessing import Pool
+import numpy as np
+import os
+from pathlib import Path
+import random
+import torch
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+Task = Tuple[Type[Table], List[Type[BasicPlayer]], Optional[List[Dict[str, Any]]], int, int, int, bool]
+
+
+class ParallelTournamentRunner:
+    """
+    Runs tournaments on a pool of worker processes and aggregates the results in the parent process.
+
+    Tournaments are split into chunks of a fixed size. Every chunk is played on a new table seeded with a stream split
+    from the master seed by the index of the chunk's first tournament, and the global generators (random, NumPy and
+    PyTorch) of the worker are seeded the same way. The results only depend on the master seed and the chunk size, not
+    on the amount of workers or the order they finish in. Results are streamed back in tournament order.
+
+    In duplicate mode every deal (the deck orders of a tournament) is played once per seat with the players rotated
+    through all seats, so every player gets every seat on the same cards and card luck cancels out of the seat averaged
+    results. Each tournament of a deal is played on a new table seeded by the deal.
+
+    With a checkpoint path the counters and aggregated results are written to disk (atomically) after the first chunk
+    completing every checkpoint interval and at the end of every run. A runner created with an existing checkpoint
+    continues from it: since every chunk only depends on the seed and its first deal, the remaining deals are played
+    exactly as they would have been without the interruption.
+
+    Checkpoints are chunk granular: only completed chunks are counted and saved, tables in progress are not
+    checkpointed (Table.snapshot is not used), so an interrupted run replays the chunks which were running, losing at
+    most one chunk per worker. Smaller chunks bound the lost work at the cost of more table setup.
+    """
+    CHUNK_SIZE = 10
+    CHECKPOINT_INTERVAL = 100
+
+    def __init__(self, players_classes: List[Type[BasicPlayer]],
+                 players_kwargs: Optional[List[Dict[str, Any]]] = None,
+                 table_class: Type[Table] = Table,
+                 workers: Optional[int] = None,
+                 seed: int = 0,
+                 chunk_size: Optional[int] = None,
+                 initializer: Optional[Callable[..., None]] = None,
+                 initargs: Sequence[Any] = (),
+                 duplicate: bool = False,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: Optional[int] = None) -> None:
+        """
+        :param players_kwargs: Additional constructor arguments of every player (see Table)
+        :param workers: Amount of worker processes, all CPUs by default, 1 runs the tournaments in this process (in one
+            worker process if an initializer is given), leaving its global generators as they were
+        :param seed: Master seed
+        :param initializer: Called with initargs in every worker before the first tournament, e.g. to configure class
+            variables (Table.INIT_CHIPS, SimpleNeuralNetwork.LOAD_PATH, ...) in workers which are not forked
+        :param duplicate: Replay every deal with the players rotated through all seats, chunks consist of deals
+        :param checkpoint_path: File to checkpoint to, and to resume from if it exists
+        :param checkpoint_interval: Tournaments between checkpoints
+        """
+        self._players_classes = list(players_classes)
+        self._players_kwargs = players_kwargs
+        self._table_class = table_class
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._seed = seed
+        self._chunk_size = chunk_size if chunk_size is not None else self.CHUNK_SIZE
+        self._initializer = initializer
+        self._initargs = tuple(initargs)
+        self._duplicate = duplicate
+        self._tournaments = 0
+        self._wins: Dict[str, int] = {}
+        self._rank_sums: Dict[str, int] = {}
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self._checkpoint_interval = checkpoint_interval if checkpoint_interval is not None else self.CHECKPOINT_INTERVAL
+        self._checkpointed_tournaments = 0
+
+        if self._workers < 1 or self._chunk_size < 1:
+            raise ValueError('At least one worker and one tournament per chunk are needed')
+
+        if self._checkpoint_path is not None and self._checkpoint_path.exists():
+            self._load_checkpoint()
+
+    @property
+    def tournaments(self) -> int:
+        return self._tournaments
+
+    @property
+    def duplicate(self) -> bool:
+        return self._duplicate
+
+    @property
+    def deals(self) -> int:
+        return self._tournaments // self.tournaments_per_deal
+
+    @property
+    def tournaments_per_deal(self) -> int:
+        return len(self._players_classes) if self._duplicate else 1
+
+    @property
+    def wins(self) -> Dict[str, int]:
+        return dict(self._wins)
+
+    @property
+    def win_rates(self) -> Dict[str, float]:
+        return {name: wins / self._tournaments for name, wins in self._wins.items()}
+
+    @property
+    def average_ranks(self) -> Dict[str, float]:
+        """
+        :return: Average finishing position of every player, 1 for the winner
+        """
+        return {name: rank_sum / self._tournaments for name, rank_sum in self._rank_sums.items()}
+
+    def run(self, deals: int) -> Iterator[TournamentResult]:
+        """
+        Plays the deals and yields the results of their tournaments in order. Without duplicate mode every deal is one
+        tournament. Consecutive runs continue the numbering, so they play different deals.
+        """
+        start = self.deals
+        tasks = []
+
+        for first in range(start, start + deals, self._chunk_size):
+            amount = min(self._chunk_size, start + deals - first)
+            tasks.append((self._table_class, self._players_classes, self._players_kwargs, self._seed, first, amount,
+                          self._duplicate))
+
+        if (self._workers == 1 or len(tasks) == 1) and self._initializer is None:
+            for task in tasks:
+                yield from self._collect(self._run_in_process(task))
+        elif len(tasks) > 0:
+            with Pool(min(self._workers, len(tasks)), self._initializer, self._initargs) as pool:
+                for results in pool.imap(_run_tournaments, tasks):
+                    yield from self._collect(results)
+
+        if self._checkpoint_path is not None:
+            self.save_checkpoint()
+
+    def save_checkpoint(self) -> None:
+        checkpoint = {
+            'players': [player_class.__name__ for player_class in self._players_classes],
+            'seed': self._seed,
+            'chunk_size': self._chunk_size,
+            'duplicate': self._duplicate,
+            'tournaments': self._tournaments,
+            'wins': self._wins,
+            'rank_sums': self._rank_sums
+        }
+        Utils.write_atomically(self._checkpoint_path, json.dumps(checkpoint, indent=2))
+        self._checkpointed_tournaments = self._tournaments
+
+    def _load_checkpoint(self) -> None:
+        with open(self._checkpoint_path) as file:
+            checkpoint = json.load(file)
+
+        configuration = ([player_class.__name__ for player_class in self._players_classes], self._seed,
+                         self._chunk_size, self._duplicate)
+
+        if configuration != (checkpoint['players'], checkpoint['seed'], checkpoint['chunk_size'],
+                             checkpoint['duplicate']):
+            raise ValueError('Checkpoint was written by a runner with other players, seed, chunk size or mode')
+
+        self._tournaments = self._checkpointed_tournaments = checkpoint['tournaments']
+        self._wins = checkpoint['wins']
+        self._rank_sums = checkpoint['rank_sums']
+
+    def _collect(self, results: List[TournamentResult]) -> Iterator[TournamentResult]:
+        for result in results:
+            if len(self._wins) == 0:
+                self._wins = {name: 0 for name in sorted(result.ranking)}
+                self._rank_sums = {name: 0 for name in sorted(result.ranking)}
+
+            self._wins[result.winner] += 1
+
+            for rank, name in enumerate(result.ranking, 1):
+                self._rank_sums[name] += rank
+
+            self._tournaments += 1
+
+            yield result
+
+        if self._checkpoint_path is not None \
+                and self._tournaments - self._checkpointed_tournaments >= self._checkpoint_interval:
+            self.save_checkpoint()
+
+    @staticmethod
+    def _run_in_process(task: Task) -> List[TournamentResult]:
+        """
+        Plays a chunk in this process, the global generators seeded by the chunk are restored afterwards.
+        """
+        random_state = random.getstate()
+        np_random_state = np.random.get_state()
+        torch_random_state = torch.get_rng_state()
+
+        try:
+            return _run_tournaments(task)
+        finally:
+            random.setstate(random_state)
+            np.random.set_state(np_random_state)
+            torch.set_rng_state(torch_random_state)
+
+    @staticmethod
+    def create_streams(seed: int, deal: int) -> RandomStreams:
+        """
+        :return: Random streams of the chunk (or in duplicate mode the table) starting with the deal, independent of the
+            streams of all other chunks
+        """
+        return RandomStreams(seed, (deal,))
+
+
+def _run_tournaments(task: Task) -> List[TournamentResult]:
+    """
+    Worker part of ParallelTournamentRunner.run, plays one chunk of tournaments on a new table.
+    """
+    table_class, players_classes, players_kwargs, seed, first, amount, duplicate = task
+    streams = ParallelTournamentRunner.create_streams(seed, first)
+    global_seed = streams.child(0).create_seed()
+
+    random.seed(global_seed)
+    np.random.seed(global_seed)
+    torch.manual_seed(global_seed)
+
+    if duplicate:
+        return _run_duplicate_deals(table_class, players_classes, players_kwargs, seed, first, amount)
+
+    table = table_class(players_classes, players_kwargs, streams.child(1).create_seed())
+    results = []
+
+    for tournament in range(first, first + amount):
+        table.reset_tournament()
+        table.run_tournament()
+
+        results.append(TournamentResult(tournament, table.get_winner_name(), tuple(table.get_ranking())))
+
+    return results
+
+
+def _run_duplicate_deals(table_class: Type[Table], players_classes: List[Type[BasicPlayer]],
+                         players_kwargs: Optional[List[Dict[str, Any]]], seed: int, first: int,
+                         amount: int) -> List[TournamentResult]:
+    """
+    Plays every deal once per seat rotation, players are reported by their names in the unrotated seating.
+    """
+    players = len(players_classes)
+    if players_kwargs is None:
+        players_kwargs = [{} for _ in players_classes]
+
+    results = []
+
+    for deal in range(first, first + amount):
+        table_seed = ParallelTournamentRunner.create_streams(seed, deal).child(1).create_seed()
+        names = []
+
+        for rotation in range(players):
+            seated = [(rotation + seat) % players for seat in range(players)]
+            table = table_class([players_classes[i] for i in seated], [players_kwargs[i] for i in seated], table_seed)
+
+            if rotation == 0:
+                names = table.player_names
+
+            original_names = {name: names[i] for name, i in zip(table.player_names, seated)}
+
+            table.reset_tournament()
+            table.run_tournament()
+
+            ranking = tuple(original_names[name] for name in table.get_ranking())
+            results.append(TournamentResult(deal * players + rotation, ranking[0], ranking, rotation))
+
+    return results
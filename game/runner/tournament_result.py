@@ -0,0 +1,8 @@
+from typing import NamedTuple, Tuple
+
+
+class TournamentResult(NamedTuple):
+    tournament: int
+    winner: str
+    ranking: Tuple[str, ...]
+    rotation: int = 0
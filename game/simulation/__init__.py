@@ -0,0 +1,5 @@
+from .batch_policy import BatchPolicy
+from .random_batch_policy import RandomBatchPolicy
+from .semi_random_batch_policy import SemiRandomBatchPolicy
+from .neural_network_batch_policy import NeuralNetworkBatchPolicy
+from .vectorized_tables import VectorizedTables
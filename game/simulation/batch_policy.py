@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class BatchPolicy(ABC):
+    """
+    Chooses the moves of the acting players of many tables at once (see VectorizedTables.play).
+    """
+
+    @abstractmethod
+    def make_moves(self, tables: 'VectorizedTables', indices: np.ndarray) -> np.ndarray:
+        """
+        :param tables: Tables waiting for moves
+        :param indices: Indices of the tables the policy has to move at
+        :return: Moves value per index, one of the allowed moves (see VectorizedTables.allowed_moves)
+        """
+        pass
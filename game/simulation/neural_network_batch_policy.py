@@ -0,0 +1,64 @@
+from .batch_policy import BatchPolicy
+from game import FinalHandType
+from game.final_hand import LookupTableEvaluator
+import numpy as np
+import torch
+
+
+class NeuralNetworkBatchPolicy(BatchPolicy):
+    """
+    Batched exploiting SimpleDqnBot. The states of all acting players are interpreted like StateInterpreterV2 (hand,
+    community cards, hand type and allowed moves) into one tensor, so the network is queried once per call, and the
+    allowed move with the highest predicted value is chosen.
+    """
+    STATE_SPACE = 119
+
+    def __init__(self, network) -> None:
+        """
+        :param network: SimpleNeuralNetwork (or a network with the same model and state interpreter)
+        """
+        if network._state_interpreter.state_space != self.STATE_SPACE:
+            raise ValueError(f'Network has to use states of size {self.STATE_SPACE}')
+
+        self._network = network
+        self._hand_types = np.array([hand_type.value for hand_type in FinalHandType], dtype=np.int64)
+
+    def make_moves(self, tables: 'VectorizedTables', indices: np.ndarray) -> np.ndarray:
+        states = self.interpret_states(tables, indices)
+        model = self._network.model
+        device = next(model.parameters()).device
+
+        with torch.no_grad():
+            predictions = model(torch.as_tensor(states, dtype=torch.float32, device=device)).cpu().numpy()
+
+        allowed_moves = tables.allowed_moves[indices]
+
+        return np.where(allowed_moves, predictions, -np.inf).argmax(axis=1) + 1
+
+    def interpret_states(self, tables: 'VectorizedTables', indices: np.ndarray) -> np.ndarray:
+        """
+        :return: Interpreted states (see StateInterpreterV2) of the acting players, with shape (indices, 119)
+        """
+        rows = np.arange(len(indices))
+        hands = tables.hands[indices, tables.actors[indices]]
+        community_cards = tables.community_cards[indices]
+        community_card_amounts = tables.community_card_amounts[indices]
+        is_dealt = np.arange(5) < community_card_amounts[:, None]
+
+        hand_part = np.zeros((len(indices), 52))
+        hand_part[rows[:, None], hands] = 1.0
+        community_part = np.zeros((len(indices), 52))
+        dealt_rows, dealt_columns = np.nonzero(is_dealt)
+        community_part[dealt_rows, community_cards[dealt_rows, dealt_columns]] = 1.0
+
+        hand_types = np.zeros(len(indices), dtype=np.int64)
+
+        for amount in np.unique(community_card_amounts):
+            is_amount = community_card_amounts == amount
+            cards = np.concatenate((hands[is_amount], community_cards[is_amount, :amount]), axis=1)
+            hand_types[is_amount] = LookupTableEvaluator.evaluate_batch(cards)[1]
+
+        hand_type_part = (hand_types[:, None] == self._hand_types).astype(np.float64)
+        allowed_moves_part = tables.allowed_moves[indices].astype(np.float64)
+
+        return np.concatenate((hand_part, community_part, hand_type_part, allowed_moves_part), axis=1)
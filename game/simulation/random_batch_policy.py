@@ -0,0 +1,18 @@
+from .batch_policy import BatchPolicy
+import numpy as np
+from typing import Optional
+
+
+class RandomBatchPolicy(BatchPolicy):
+    """
+    Batched RandomBot, every allowed move is chosen with the same probability.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self._rng = np.random.default_rng(seed)
+
+    def make_moves(self, tables: 'VectorizedTables', indices: np.ndarray) -> np.ndarray:
+        allowed_moves = tables.allowed_moves[indices]
+        keys = np.where(allowed_moves, self._rng.random(allowed_moves.shape), -1.0)
+
+        return keys.argmax(axis=1) + 1
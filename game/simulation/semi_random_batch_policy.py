@@ -0,0 +1,15 @@
+from .random_batch_policy import RandomBatchPolicy
+from game import Moves
+import numpy as np
+
+
+class SemiRandomBatchPolicy(RandomBatchPolicy):
+    """
+    Batched SemiRandomBot, a random allowed move, but checking instead of folding whenever checking is allowed.
+    """
+
+    def make_moves(self, tables: 'VectorizedTables', indices: np.ndarray) -> np.ndarray:
+        moves = super().make_moves(tables, indices)
+        can_check = tables.allowed_moves[indices, Moves.CHECK.value - 1]
+
+        return np.where((moves == Moves.FOLD.value) & can_check, Moves.CHECK.value, moves)
@@ -0,0 +1,530 @@
+from .batch_policy import BatchPolicy
+from game import Moves, Phases
+from game.final_hand import LookupTableEvaluator
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+NO_MOVE = 0
+FINDING_PLAYER = 0
+DECIDING = 1
+ENDING_ROUND = 2
+FINISHED = 3
+
+
+class VectorizedTables:
+    """
+    Many independent limit hold'em tables played in lockstep, with the state of all tables held in NumPy arrays.
+
+    Every table plays by the rules of Table (blinds, allowed moves, raise cap, all-ins, side pots, pot leftover, dealer
+    rotation and players leaving the table), but all tables waiting for a decision advance together by one step, so
+    batched policies choose the moves of all acting players with one array call per seat. Moves are given as Moves
+    values, allowed moves are boolean masks indexed by Moves value - 1. A table which finished a tournament starts the
+    next one (all players seated again in seat order, dealer on seat 0) until it played the requested amount.
+    """
+    INIT_CHIPS = 100
+    SMALL_BET = 2
+    BIG_BET = 4
+    RAISE_CAP = 4
+    SHARE_SCALE = 2520
+
+    def __init__(self, tables: int, players: int, tournaments: int = 1, seed: Optional[int] = None) -> None:
+        """
+        :param tables: Amount of tables
+        :param players: Players per table, between 2 and 10
+        :param tournaments: Tournaments every table plays
+        :param seed: Seed of the deck shuffles
+        """
+        if players < 2 or players > 10:
+            raise ValueError('Only between 2 and 10 players allowed...')
+
+        if tables < 1 or tournaments < 1:
+            raise ValueError('At least one table has to play at least one tournament')
+
+        self._amount = tables
+        self._players = players
+        self._tournaments = tournaments
+        self._rng = np.random.default_rng(seed)
+        self._init_chips = self.INIT_CHIPS
+        self._small_bet = self.SMALL_BET
+        self._big_bet = self.BIG_BET
+
+        shape = (tables, players)
+        self._chips = np.zeros(shape, dtype=np.int64)
+        self._player_bets = np.zeros(shape, dtype=np.int64)
+        self._total_bets = np.zeros(shape, dtype=np.int64)
+        self._moves = np.zeros(shape, dtype=np.int64)
+        self._is_active = np.zeros(shape, dtype=bool)
+        self._is_seated = np.zeros(shape, dtype=bool)
+        self._hands = np.zeros((tables, players, 2), dtype=np.int64)
+        self._decks = np.tile(np.arange(52, dtype=np.int64), (tables, 1))
+        self._community_cards = np.zeros((tables, 5), dtype=np.int64)
+        self._community_card_amounts = np.zeros(tables, dtype=np.int64)
+        self._dealers = np.zeros(tables, dtype=np.int64)
+        self._actors = np.zeros(tables, dtype=np.int64)
+        self._stopping_players = np.zeros(tables, dtype=np.int64)
+        self._phases = np.zeros(tables, dtype=np.int64)
+        self._current_bets = np.zeros(tables, dtype=np.int64)
+        self._current_raises = np.zeros(tables, dtype=np.int64)
+        self._raise_counts = np.zeros(tables, dtype=np.int64)
+        self._pots = np.zeros(tables, dtype=np.int64)
+        self._pot_leftovers = np.zeros(tables, dtype=np.int64)
+        self._is_round_active = np.zeros(tables, dtype=bool)
+        self._allowed_moves = np.zeros((tables, len(Moves)), dtype=bool)
+        self._stages = np.zeros(tables, dtype=np.int64)
+        self._hands_played = np.zeros(tables, dtype=np.int64)
+        self._tournaments_played = np.zeros(tables, dtype=np.int64)
+        self._wins = np.zeros(shape, dtype=np.int64)
+        self._seat_offsets = np.arange(1, players + 1, dtype=np.int64)
+
+        self._start_tournament(np.arange(tables))
+        self._advance()
+
+    @property
+    def amount(self) -> int:
+        return self._amount
+
+    @property
+    def players(self) -> int:
+        return self._players
+
+    @property
+    def is_finished(self) -> bool:
+        return bool((self._stages == FINISHED).all())
+
+    @property
+    def deciding_tables(self) -> np.ndarray:
+        """
+        :return: Indices of the tables waiting for a move
+        """
+        return np.flatnonzero(self._stages == DECIDING)
+
+    @property
+    def actors(self) -> np.ndarray:
+        """
+        :return: Seat of the acting player per table
+        """
+        return self._actors
+
+    @property
+    def allowed_moves(self) -> np.ndarray:
+        """
+        :return: Allowed moves of the acting player per table, indexed by Moves value - 1
+        """
+        return self._allowed_moves
+
+    @property
+    def hands(self) -> np.ndarray:
+        """
+        :return: Card ids of the hands with shape (tables, players, 2)
+        """
+        return self._hands
+
+    @property
+    def community_cards(self) -> np.ndarray:
+        """
+        :return: Card ids of all 5 community cards per table, only community_card_amounts of them are dealt
+        """
+        return self._community_cards
+
+    @property
+    def community_card_amounts(self) -> np.ndarray:
+        return self._community_card_amounts
+
+    @property
+    def chips(self) -> np.ndarray:
+        return self._chips
+
+    @property
+    def player_bets(self) -> np.ndarray:
+        """
+        :return: Bets of the players in the current betting round
+        """
+        return self._player_bets
+
+    @property
+    def moves(self) -> np.ndarray:
+        """
+        :return: Last move (Moves value, 0 for none) of the players in the current hand
+        """
+        return self._moves
+
+    @property
+    def is_seated(self) -> np.ndarray:
+        return self._is_seated
+
+    @property
+    def current_bets(self) -> np.ndarray:
+        return self._current_bets
+
+    @property
+    def raise_counts(self) -> np.ndarray:
+        return self._raise_counts
+
+    @property
+    def pots(self) -> np.ndarray:
+        return self._pots
+
+    @property
+    def phases(self) -> np.ndarray:
+        """
+        :return: Phases value per table
+        """
+        return self._phases
+
+    @property
+    def total_chips(self) -> int:
+        return self._players * self._init_chips
+
+    @property
+    def hands_played(self) -> np.ndarray:
+        return self._hands_played
+
+    @property
+    def wins(self) -> np.ndarray:
+        """
+        :return: Won tournaments with shape (tables, players)
+        """
+        return self._wins
+
+    def step(self, moves: np.ndarray) -> None:
+        """
+        Executes the moves of the acting players and advances the tables to their next decision.
+
+        :param moves: Moves value per table, values of tables which don't wait for a move are ignored
+        """
+        tables = self.deciding_tables
+        moves = np.asarray(moves, dtype=np.int64)[tables]
+
+        if ((moves < 1) | (moves > len(Moves))).any() \
+                or not self._allowed_moves[tables, np.clip(moves, 1, len(Moves)) - 1].all():
+            raise ValueError('Moves have to be allowed moves of the acting players')
+
+        self._execute_moves(tables, moves)
+        self._advance()
+
+    def play(self, policies: Sequence[BatchPolicy]) -> np.ndarray:
+        """
+        Plays all tournaments, the players of a seat at all tables are asked together.
+
+        :param policies: Policy per seat
+        :return: Won tournaments per seat
+        """
+        if len(policies) != self._players:
+            raise ValueError('Every seat needs a policy')
+
+        moves = np.zeros(self._amount, dtype=np.int64)
+
+        while not self.is_finished:
+            tables = self.deciding_tables
+
+            for seat, policy in enumerate(policies):
+                seat_tables = tables[self._actors[tables] == seat]
+
+                if len(seat_tables) > 0:
+                    moves[seat_tables] = policy.make_moves(self, seat_tables)
+
+            self.step(moves)
+
+        return self._wins.sum(axis=0)
+
+    def _advance(self) -> None:
+        """
+        Moves all tables forward until each one waits for a move or finished its tournaments.
+        """
+        while True:
+            finding_tables = np.flatnonzero(self._stages == FINDING_PLAYER)
+            ending_tables = np.flatnonzero(self._stages == ENDING_ROUND)
+
+            if len(finding_tables) == 0 and len(ending_tables) == 0:
+                break
+
+            if len(finding_tables) > 0:
+                self._find_next_decision(finding_tables)
+
+            if len(ending_tables) > 0:
+                self._end_betting_round(ending_tables)
+
+    def _start_tournament(self, tables: np.ndarray) -> None:
+        self._chips[tables] = self._init_chips
+        self._is_seated[tables] = True
+        self._dealers[tables] = 0
+        self._start_hand(tables)
+
+    def _start_hand(self, tables: np.ndarray) -> None:
+        seated = self._is_seated[tables]
+
+        self._player_bets[tables] = 0
+        self._total_bets[tables] = 0
+        self._moves[tables] = NO_MOVE
+        self._is_active[tables] = seated
+        self._raise_counts[tables] = 0
+        self._is_round_active[tables] = True
+        self._phases[tables] = Phases.PRE_FLOP.value
+        self._community_card_amounts[tables] = 0
+
+        self._deal_cards(tables, seated)
+        self._collect_blinds(tables)
+        self._current_raises[tables] = self._current_bets[tables] = self._small_bet
+
+        self._actors[tables] = self._stopping_players[tables] = self._find_seat(tables, self._dealers[tables], 3)
+        self._stages[tables] = FINDING_PLAYER
+
+    def _deal_cards(self, tables: np.ndarray, seated: np.ndarray) -> None:
+        """
+        Deals like Table, one card to each player starting with the dealer, twice, and the community cards after one
+        burnt card per street.
+        """
+        decks = self._shuffle_decks(tables)
+        rows = np.arange(len(tables))
+        seats = (self._dealers[tables][:, None] + self._seat_offsets - 1) % self._players
+        is_seated = seated[rows[:, None], seats]
+        positions = is_seated.cumsum(axis=1) - 1
+        amounts = is_seated.sum(axis=1)
+
+        table_rows, columns = np.nonzero(is_seated)
+        player_seats = seats[table_rows, columns]
+        player_positions = positions[table_rows, columns]
+        self._hands[tables[table_rows], player_seats, 0] = decks[table_rows, player_positions]
+        self._hands[tables[table_rows], player_seats, 1] = decks[table_rows, amounts[table_rows] + player_positions]
+
+        community_positions = 2 * amounts[:, None] + np.array([1, 2, 3, 5, 7])
+        self._community_cards[tables] = decks[rows[:, None], community_positions]
+
+    def _shuffle_decks(self, tables: np.ndarray) -> np.ndarray:
+        """
+        :return: Card ids in dealing order, with shape (tables, 52)
+        """
+        return self._rng.permuted(self._decks[tables], axis=1)
+
+    def _collect_blinds(self, tables: np.ndarray) -> None:
+        small_blind_seats = self._find_seat(tables, self._dealers[tables], 1)
+        self._collect_blind(tables, small_blind_seats, int(self._small_bet / 2))
+        self._collect_blind(tables, self._find_seat(tables, small_blind_seats, 1), self._small_bet)
+
+    def _collect_blind(self, tables: np.ndarray, seats: np.ndarray, blind: int) -> None:
+        chips = self._chips[tables, seats]
+        is_all_in = chips <= blind
+
+        self._collect_bets(tables, seats, np.where(is_all_in, chips, blind))
+        self._moves[tables[is_all_in], seats[is_all_in]] = Moves.ALL_IN.value
+
+    def _collect_bets(self, tables: np.ndarray, seats: np.ndarray, amounts: np.ndarray) -> None:
+        self._chips[tables, seats] -= amounts
+        self._player_bets[tables, seats] += amounts
+        self._total_bets[tables, seats] += amounts
+        self._pots[tables] += amounts
+
+    def _find_seat(self, tables: np.ndarray, seats: np.ndarray, position: int) -> np.ndarray:
+        """
+        :return: Seat of the seated player the position after the seat (see Players.get_by_position), per table
+        """
+        candidates = (seats[:, None] + self._seat_offsets) % self._players
+        counts = self._is_seated[tables[:, None], candidates].cumsum(axis=1)
+        targets = (position - 1) % counts[:, -1] + 1
+
+        return candidates[np.arange(len(tables)), (counts >= targets[:, None]).argmax(axis=1)]
+
+    def _find_next_decision(self, tables: np.ndarray) -> None:
+        self._update_round_active_state(tables)
+
+        is_round_active = self._is_round_active[tables]
+        self._stages[tables[~is_round_active]] = ENDING_ROUND
+        tables = tables[is_round_active]
+
+        allowed_moves, has_moves = self._generate_moves(tables, self._actors[tables])
+        deciding_tables = tables[has_moves]
+        self._allowed_moves[deciding_tables] = allowed_moves[has_moves]
+        self._stages[deciding_tables] = DECIDING
+
+        skipping_tables = tables[~has_moves]
+        self._move_to_next_player(skipping_tables)
+
+    def _move_to_next_player(self, tables: np.ndarray) -> None:
+        actors = self._find_seat(tables, self._actors[tables], 1)
+        self._actors[tables] = actors
+        self._stages[tables] = np.where(actors == self._stopping_players[tables], ENDING_ROUND, FINDING_PLAYER)
+
+    def _generate_moves(self, tables: np.ndarray, seats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: Allowed moves mask (see Table._generate_player_moves) and whether the player can move at all
+        """
+        chips = self._chips[tables, seats]
+        player_bets = self._player_bets[tables, seats]
+        current_bets = self._current_bets[tables]
+        raised_bets = current_bets + self._current_raises[tables]
+        is_raising_capped = self._raise_counts[tables] >= self.RAISE_CAP
+        reachable_bets = chips + player_bets
+
+        moves = self._moves[tables]
+        betting_players = (self._is_seated[tables] & (moves != Moves.FOLD.value)
+                           & (moves != Moves.ALL_IN.value)).sum(axis=1)
+
+        allowed_moves = np.zeros((len(tables), len(Moves)), dtype=bool)
+        allowed_moves[:, Moves.CALL.value - 1] = (player_bets < current_bets) & (current_bets < reachable_bets)
+        allowed_moves[:, Moves.ALL_IN.value - 1] = (reachable_bets <= current_bets) \
+            | ((reachable_bets <= raised_bets) & ~is_raising_capped)
+        allowed_moves[:, Moves.CHECK.value - 1] = current_bets == player_bets
+        allowed_moves[:, Moves.RAISE.value - 1] = ~is_raising_capped & (reachable_bets > raised_bets) \
+            & (betting_players > 1)
+        allowed_moves[:, Moves.FOLD.value - 1] = True
+
+        has_moves = (moves[np.arange(len(tables)), seats] != Moves.FOLD.value) & (chips != 0)
+
+        return allowed_moves, has_moves
+
+    def _execute_moves(self, tables: np.ndarray, moves: np.ndarray) -> None:
+        seats = self._actors[tables]
+        chips = self._chips[tables, seats]
+        amounts_to_call = self._current_bets[tables] - self._player_bets[tables, seats]
+
+        is_raise = moves == Moves.RAISE.value
+        is_all_in = moves == Moves.ALL_IN.value
+        amounts = np.select([moves == Moves.CALL.value, is_raise, is_all_in],
+                            [amounts_to_call, amounts_to_call + self._current_raises[tables], chips], 0)
+        self._collect_bets(tables, seats, amounts)
+
+        player_bets = self._player_bets[tables, seats]
+        is_raising_all_in = is_all_in & (self._current_bets[tables] < player_bets)
+        is_raising = is_raise | is_raising_all_in
+
+        self._current_bets[tables] = np.where(is_raising, player_bets, self._current_bets[tables])
+        self._raise_counts[tables] += is_raising
+
+        is_deactivated = (is_all_in & ~is_raising_all_in) | (moves == Moves.FOLD.value)
+        self._is_active[tables[is_deactivated], seats[is_deactivated]] = False
+        self._moves[tables, seats] = moves
+
+        self._stopping_players[tables] = np.where(is_raising, seats, self._stopping_players[tables])
+        self._move_to_next_player(tables)
+
+    def _update_round_active_state(self, tables: np.ndarray) -> None:
+        seated = self._is_seated[tables]
+        moves = self._moves[tables]
+
+        active_players = (seated & self._is_active[tables]).sum(axis=1)
+        not_folded_players = (seated & (moves != Moves.FOLD.value)).sum(axis=1)
+        pending_players = (seated & (moves == NO_MOVE)).sum(axis=1)
+
+        self._is_round_active[tables] = (active_players > 1) | ((not_folded_players > 1) & (pending_players > 0))
+
+    def _end_betting_round(self, tables: np.ndarray) -> None:
+        self._is_active[tables] &= self._moves[tables] != Moves.ALL_IN.value
+        self._update_round_active_state(tables)
+
+        phases = self._phases[tables] + 1
+        self._phases[tables] = phases
+
+        is_street = phases <= Phases.RIVER.value
+        street_tables = tables[is_street]
+        self._community_card_amounts[street_tables] = phases[is_street] - Phases.FLOP.value + 3
+
+        betting_tables = street_tables[self._is_round_active[street_tables]]
+        self._start_betting_round(betting_tables, np.where(self._phases[betting_tables] == Phases.FLOP.value,
+                                                           self._small_bet, self._big_bet))
+
+        self._finish_hand(tables[~is_street])
+
+    def _start_betting_round(self, tables: np.ndarray, bet_amounts: np.ndarray) -> None:
+        self._current_raises[tables] = bet_amounts
+        self._raise_counts[tables] = 0
+        self._current_bets[tables] = 0
+        self._player_bets[tables] = 0
+
+        moves = self._moves[tables]
+        self._moves[tables] = np.where((moves == Moves.FOLD.value) | (moves == Moves.ALL_IN.value), moves, NO_MOVE)
+
+        self._actors[tables] = self._stopping_players[tables] = self._find_seat(tables, self._dealers[tables], 1)
+        self._stages[tables] = FINDING_PLAYER
+
+    def _finish_hand(self, tables: np.ndarray) -> None:
+        if len(tables) == 0:
+            return
+
+        self._phases[tables] = Phases.POT_COLLECTION.value
+        self._collect_pots(tables, self._calculate_pot_collections(tables, self._evaluate_players(tables)))
+        self._hands_played[tables] += 1
+
+        self._define_next_dealers(tables)
+        self._is_seated[tables] &= self._chips[tables] > 0
+
+        is_finished = self._is_seated[tables].sum(axis=1) == 1
+        finished_tables = tables[is_finished]
+        table_rows, winners = np.nonzero(self._is_seated[finished_tables])
+        self._wins[finished_tables[table_rows], winners] += 1
+        self._tournaments_played[finished_tables] += 1
+
+        is_done = self._tournaments_played[finished_tables] >= self._tournaments
+        self._stages[finished_tables[is_done]] = FINISHED
+        self._start_tournament(finished_tables[~is_done])
+        self._start_hand(tables[~is_finished])
+
+    def _evaluate_players(self, tables: np.ndarray) -> np.ndarray:
+        """
+        :return: Strength per player, 0 for players who folded, -1 for players who are not seated
+        """
+        is_playing = self._is_seated[tables] & (self._moves[tables] != Moves.FOLD.value)
+        table_rows, seats = np.nonzero(is_playing)
+        cards = np.concatenate((self._hands[tables[table_rows], seats], self._community_cards[tables[table_rows]]),
+                               axis=1)
+
+        strengths = np.where(self._is_seated[tables], 0, -1)
+        strengths[table_rows, seats] = LookupTableEvaluator.evaluate_batch(cards)[0]
+
+        return strengths
+
+    def _calculate_pot_collections(self, tables: np.ndarray, strengths: np.ndarray) -> np.ndarray:
+        """
+        Splits the pot into layers between consecutive total bets. Every layer goes to the strongest players who bet
+        at least its upper bound, split evenly, and each player's share of all layers is rounded down. As in Table,
+        where players who folded form the weakest group, which collects the rest of the pot evenly, players who folded
+        take part in every layer.
+
+        :return: Chips every player collects from the pot
+        """
+        total_bets = self._total_bets[tables]
+        levels = np.sort(total_bets, axis=1)
+        widths = np.diff(levels, axis=1, prepend=0)
+        contributors = self._players - np.arange(self._players)
+
+        is_folded = self._moves[tables] == Moves.FOLD.value
+        is_eligible = (total_bets[:, None, :] >= levels[:, :, None]) | is_folded[:, None, :]
+        eligible_strengths = np.where(is_eligible, strengths[:, None, :], -2)
+        is_winner = is_eligible & (eligible_strengths == eligible_strengths.max(axis=2, keepdims=True))
+
+        shares = widths * contributors * self.SHARE_SCALE // np.maximum(is_winner.sum(axis=2), 1)
+
+        return (is_winner * shares[:, :, None]).sum(axis=1) // self.SHARE_SCALE
+
+    def _collect_pots(self, tables: np.ndarray, collections: np.ndarray) -> None:
+        """
+        Pays out the collections and the pot leftover of previous hands like Table._init_pot_collection_phase, the
+        chips which could not be split evenly are added to the pot leftover.
+        """
+        rows = np.arange(len(tables))
+        seated = self._is_seated[tables]
+        collections = np.where(seated, collections, 0)
+        same_collections = ((collections[:, :, None] == collections[:, None, :]) & seated[:, None, :]).sum(axis=2)
+        received = collections.copy()
+        leftovers = self._pot_leftovers[tables]
+        leftover_collections = np.zeros(len(tables), dtype=np.int64)
+
+        for offset in range(self._players):
+            seats = (self._dealers[tables] + offset) % self._players
+            same_amounts = np.maximum(same_collections[rows, seats], 1)
+            total_leftovers = leftovers * (leftover_collections + 1)
+            is_collecting = seated[rows, seats] & (leftovers > 0) & (total_leftovers % same_amounts == 0)
+            amounts = np.where(is_collecting, total_leftovers // same_amounts, 0)
+
+            received[rows, seats] += amounts
+            leftovers -= amounts
+            leftover_collections += is_collecting
+
+        self._chips[tables] += received
+        self._pot_leftovers[tables] = leftovers + self._pots[tables] - collections.sum(axis=1)
+        self._pots[tables] = 0
+
+    def _define_next_dealers(self, tables: np.ndarray) -> None:
+        candidates = (self._dealers[tables][:, None] + self._seat_offsets) % self._players
+        has_chips = self._is_seated[tables[:, None], candidates] & (self._chips[tables[:, None], candidates] > 0)
+
+        self._dealers[tables] = candidates[np.arange(len(tables)), has_chips.argmax(axis=1)]
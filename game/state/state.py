@@ -1,5 +1,5 @@
 from game import Card, Phases, Moves
-from typing import NamedTuple, Tuple
+from typing import NamedTuple, Optional, Tuple
 
 
 class State(NamedTuple):
@@ -12,3 +12,4 @@ class State(NamedTuple):
     is_raising_capped: bool
     allowed_moves: Tuple[Moves, ...]
     current_bet: int
+    decision_time_budget: Optional[float] = None
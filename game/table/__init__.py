@@ -1,2 +1,5 @@
 from .table import Table
 from .training_table import TrainingTable
+from .latency_histogram import LatencyHistogram
+from .decision_profiler import DecisionProfiler
+from .table_snapshot import TableSnapshot
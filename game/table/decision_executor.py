@@ -0,0 +1,71 @@
+from concurrent.futures import Future
+from queue import Queue
+from threading import Thread
+from typing import Any, Callable, Optional
+
+
+class DecisionExecutor:
+    """
+    Runs the decisions of one player on a daemon worker thread, so the table can stop waiting for a decision which
+    takes too long.
+
+    A decision which timed out keeps running until it returns (threads can't be interrupted). The executor runs one
+    decision at a time, so while it is busy no new decision is submitted for the player and the table has to wait for
+    it (wait) before it changes the player's state again. close stops the worker once the running decision returned.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._requests: 'Queue' = Queue()
+        self._decision: Optional[Future] = None
+        self._is_closed = False
+        self._thread = Thread(target=self._work, name=f'DecisionExecutor {name}', daemon=True)
+        self._thread.start()
+
+    @property
+    def is_busy(self) -> bool:
+        return self._decision is not None and not self._decision.done()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> Future:
+        if self._is_closed:
+            raise RuntimeError('Decision executor is closed')
+
+        if self.is_busy:
+            raise RuntimeError('Previous decision is still running')
+
+        self._decision = Future()
+        self._requests.put((self._decision, function, args))
+
+        return self._decision
+
+    def wait(self) -> None:
+        """
+        Waits until the running decision (if any) returned, its result is dropped.
+        """
+        if self._decision is not None:
+            self._decision.exception()
+
+    def close(self) -> None:
+        if not self._is_closed:
+            self._is_closed = True
+            self._requests.put(None)
+
+    def _work(self) -> None:
+        while True:
+            request = self._requests.get()
+
+            if request is None:
+                return
+
+            future, function, args = request
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(function(*args))
+            except BaseException as exception:
+                future.set_exception(exception)
@@ -0,0 +1,75 @@
+from .latency_histogram import LatencyHistogram
+from game import Phases
+from time import perf_counter_ns
+from typing import Dict, Optional, Tuple
+
+TABLE = 'Table'
+
+
+class DecisionProfiler:
+    """
+    Collects the latency of every player decision per player class and phase, and the table's own time per phase
+    (the time of the phase without the decisions made in it).
+
+    Attached to a table with Table.attach_profiler, a table without a profiler only checks for it once per decision.
+    """
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, print_summary: bool = True) -> None:
+        """
+        :param print_summary: Print the summary at the end of every tournament
+        """
+        self._print_summary = print_summary
+        self._histograms: Dict[Tuple[str, Phases], LatencyHistogram] = {}
+        self._decisions_time = 0
+
+    @property
+    def print_summary(self) -> bool:
+        return self._print_summary
+
+    @property
+    def histograms(self) -> Dict[Tuple[str, Phases], LatencyHistogram]:
+        """
+        :return: Histograms keyed by player class name (TABLE for the table's own time) and phase
+        """
+        return self._histograms
+
+    def get(self, name: str, phase: Phases) -> Optional[LatencyHistogram]:
+        return self._histograms.get((name, phase))
+
+    def record_decision(self, player_type: str, phase: Phases, duration: int) -> None:
+        self._decisions_time += duration
+        self._record(player_type, phase, duration)
+
+    def start_phase(self) -> int:
+        self._decisions_time = 0
+
+        return perf_counter_ns()
+
+    def end_phase(self, phase: Phases, start: int) -> None:
+        self._record(TABLE, phase, perf_counter_ns() - start - self._decisions_time)
+
+    def reset(self) -> None:
+        self._histograms = {}
+
+    def summarize(self) -> str:
+        header = f'{"PHASE":<16}{"PLAYER":<24}{"COUNT":>10}{"MEAN":>12}' \
+                 + ''.join(f'{f"P{percentile}":>12}' for percentile in self.PERCENTILES) + f'{"MAX":>12}'
+        lines = [header + '   (microseconds)']
+
+        for (name, phase), histogram in sorted(self._histograms.items(), key=lambda item: (item[0][1].value,
+                                                                                             item[0][0])):
+            values = [histogram.mean] + [histogram.percentile(percentile) for percentile in self.PERCENTILES] \
+                + [histogram.max]
+            lines.append(f'{phase.name:<16}{name:<24}{histogram.count:>10}'
+                         + ''.join(f'{value / 1000:>12.1f}' for value in values))
+
+        return '\n'.join(lines)
+
+    def _record(self, name: str, phase: Phases, duration: int) -> None:
+        histogram = self._histograms.get((name, phase))
+
+        if histogram is None:
+            histogram = self._histograms[(name, phase)] = LatencyHistogram()
+
+        histogram.record(max(duration, 0))
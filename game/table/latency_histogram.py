@@ -0,0 +1,96 @@
+from typing import List
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies in nanoseconds.
+
+    Values below 2 * 2^SUB_BUCKET_BITS are counted exactly, larger values in log-linear buckets of 2^SUB_BUCKET_BITS
+    sub-buckets per power of two, so every value is kept with a relative error below 2^-SUB_BUCKET_BITS (< 1 %) in a
+    few hundred counters, whatever the range of the values.
+    """
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self) -> None:
+        self._counts: List[int] = []
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    def record(self, value: int) -> None:
+        index = self._find_index(value)
+
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+
+        self._counts[index] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        :param percentile: Between 0 and 100
+        :return: Highest value equivalent to the recorded value at the percentile, 0 if nothing was recorded
+        """
+        if self._count == 0:
+            return 0
+
+        rank = max(1, -(-self._count * percentile // 100))
+        seen = 0
+
+        for index, count in enumerate(self._counts):
+            seen += count
+
+            if seen >= rank:
+                return min(self._find_highest_equivalent_value(index), self._max)
+
+        return self._max
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+
+        self._count += other._count
+        self._total += other._total
+        self._max = max(self._max, other._max)
+
+    @classmethod
+    def _find_index(cls, value: int) -> int:
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+
+        if shift <= 0:
+            return value
+
+        return (shift << cls.SUB_BUCKET_BITS) + (value >> shift)
+
+    @classmethod
+    def _find_highest_equivalent_value(cls, index: int) -> int:
+        shift = (index >> cls.SUB_BUCKET_BITS) - 1
+
+        if shift <= 0:
+            return index
+
+        mantissa = index - (shift << cls.SUB_BUCKET_BITS)
+
+        return ((mantissa + 1) << shift) - 1
@@ -3,3 +3,4 @@ from .base_observer import BaseObserver
 from .textual import TerminalTextual as TerminalTextualObserver
 from .textual import TerminalJustPotCollectionTextual as TerminalJustPotCollectionTextualObserver
 from .textual import FileTextual as FileTextualObserver
+from .hand_history import HandAction, HandRecord, HandHistoryObserver, HandHistoryReader
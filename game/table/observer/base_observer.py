@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
 from . import State
+from game import Moves
 
 
 class BaseObserver(ABC):
     @abstractmethod
     def update(self, state: State) -> None:
         pass
+
+    def update_move(self, player, move: Moves, amount: int) -> None:
+        """
+        Called after every executed move, before the update of the phase it was made in.
+
+        :param player: Table player who moved
+        :param amount: Chips the player put in with the move
+        """
+        pass
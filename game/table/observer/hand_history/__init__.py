@@ -0,0 +1,5 @@
+from .hand_action import HandAction
+from .hand_record import HandRecord
+from .hand_history_format import HandHistoryFormat
+from .hand_history_observer import HandHistoryObserver
+from .hand_history_reader import HandHistoryReader
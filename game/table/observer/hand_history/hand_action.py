@@ -0,0 +1,9 @@
+from game import Moves, Phases
+from typing import NamedTuple
+
+
+class HandAction(NamedTuple):
+    phase: Phases
+    seat: int
+    move: Moves
+    amount: int
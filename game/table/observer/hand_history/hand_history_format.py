@@ -0,0 +1,83 @@
+import numpy as np
+import struct
+import zlib
+from typing import Dict, List, Optional
+
+
+class HandHistoryFormat:
+    """
+    Binary hand history layout.
+
+    A file starts with a header (magic, version, seed of the table or -1), followed by blocks of hands. Every block has
+    a header (amount of hands, compressed size) and a zlib compressed payload holding one column per field: the
+    amount of values of every column, then the columns one after another as little endian integers. Per player values
+    are stored in seating order starting with the dealer, seats are the table's seat indices.
+    """
+    MAGIC = b'PKHH'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHq')
+    BLOCK_HEADER = struct.Struct('<II')
+    COMPRESSION_LEVEL = 6
+    NO_CARD = 255
+    COLUMNS = (
+        ('hands', '<u4'),
+        ('player_counts', 'u1'),
+        ('board_sizes', 'u1'),
+        ('action_counts', '<u2'),
+        ('seats', 'u1'),
+        ('stacks', '<u4'),
+        ('blinds', '<u4'),
+        ('hole_cards', 'u1'),
+        ('collections', '<u4'),
+        ('community_cards', 'u1'),
+        ('action_phases', 'u1'),
+        ('action_seats', 'u1'),
+        ('action_moves', 'u1'),
+        ('action_amounts', '<u4')
+    )
+    SIZES = struct.Struct(f'<{len(COLUMNS)}I')
+
+    @classmethod
+    def create_columns(cls) -> Dict[str, List[int]]:
+        return {name: [] for name, _ in cls.COLUMNS}
+
+    @classmethod
+    def pack_header(cls, seed: Optional[int]) -> bytes:
+        return cls.HEADER.pack(cls.MAGIC, cls.VERSION, seed if seed is not None else -1)
+
+    @classmethod
+    def unpack_header(cls, header: bytes) -> Optional[int]:
+        """
+        :return: Seed of the table, None if not given
+        """
+        if len(header) != cls.HEADER.size:
+            raise ValueError('Hand history file is too short')
+
+        magic, version, seed = cls.HEADER.unpack(header)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError('Not a hand history file of a supported version')
+
+        return seed if seed >= 0 else None
+
+    @classmethod
+    def pack_block(cls, columns: Dict[str, List[int]]) -> bytes:
+        payload = cls.SIZES.pack(*[len(columns[name]) for name, _ in cls.COLUMNS]) \
+            + b''.join(np.asarray(columns[name], dtype=dtype).tobytes() for name, dtype in cls.COLUMNS)
+        compressed = zlib.compress(payload, cls.COMPRESSION_LEVEL)
+
+        return cls.BLOCK_HEADER.pack(len(columns['hands']), len(compressed)) + compressed
+
+    @classmethod
+    def unpack_block(cls, compressed: bytes) -> Dict[str, List[int]]:
+        payload = zlib.decompress(compressed)
+        sizes = cls.SIZES.unpack_from(payload)
+        offset = cls.SIZES.size
+        columns = {}
+
+        for (name, dtype), size in zip(cls.COLUMNS, sizes):
+            column = np.frombuffer(payload, dtype=dtype, count=size, offset=offset)
+            columns[name] = column.tolist()
+            offset += column.nbytes
+
+        return columns
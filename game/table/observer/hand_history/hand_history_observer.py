@@ -0,0 +1,140 @@
+from .hand_history_format import HandHistoryFormat
+from .. import BaseObserver, State
+from game import Moves, Phases, Utils
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class HandHistoryObserver(BaseObserver):
+    """
+    Records every hand (seats, stacks, blinds, hole cards, community cards, actions and pot collections) in the compact
+    binary format of HandHistoryFormat, to be read back by HandHistoryReader.
+
+    Hands are collected in columns and written as one compressed block every BLOCK_HANDS hands through a buffered
+    append-only file, which is flushed every FLUSH_BLOCKS blocks. Hands still in the columns are written by flush and
+    close (also at the end of a with block).
+    """
+    BLOCK_HANDS = 1024
+    FLUSH_BLOCKS = 8
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, path: Optional[str] = None, seed: Optional[int] = None) -> None:
+        """
+        :param path: File to append to, a new file in the log directory by default
+        :param seed: Seed of the observed table, stored in the header of a new file
+        """
+        self._path = Path(path) if path is not None else self._create_default_path()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(str(self._path), 'ab', buffering=self.BUFFER_SIZE)
+
+        if self._file.tell() == 0:
+            self._file.write(HandHistoryFormat.pack_header(seed))
+
+        self._columns = HandHistoryFormat.create_columns()
+        self._blocks_since_flush = 0
+        self._hands = 0
+        self._is_hand_started = False
+        self._phase = Phases.PRE_FLOP
+        self._stacks: Dict[int, int] = {}
+        self._actions: List[Tuple[Phases, int, Moves, int]] = []
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def hands(self) -> int:
+        return self._hands
+
+    def update(self, state: State) -> None:
+        if not self._is_hand_started:
+            self._start_hand(state.players)
+
+        if state.phase is Phases.POT_COLLECTION:
+            self._record_hand(state)
+        else:
+            self._phase = Phases(state.phase.value + 1)
+
+    def update_move(self, player, move: Moves, amount: int) -> None:
+        if not self._is_hand_started:
+            self._start_hand(player)
+
+        self._actions.append((self._phase, player.index, move, amount))
+
+    def flush(self) -> None:
+        if len(self._columns['hands']) > 0:
+            self._write_block()
+
+        self._file.flush()
+        self._blocks_since_flush = 0
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> 'HandHistoryObserver':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _start_hand(self, players) -> None:
+        """
+        :param players: Any table player, iterating it goes over all seated players
+        """
+        self._is_hand_started = True
+        self._phase = Phases.PRE_FLOP
+        self._stacks = {player.index: player.get_amount_of_chips() + player.total_bet for player in players}
+        self._actions = []
+
+    def _record_hand(self, state: State) -> None:
+        columns = self._columns
+        contributions = {}
+
+        for phase, seat, move, amount in self._actions:
+            columns['action_phases'].append(phase.value)
+            columns['action_seats'].append(seat)
+            columns['action_moves'].append(move.value)
+            columns['action_amounts'].append(amount)
+            contributions[seat] = contributions.get(seat, 0) + amount
+
+        player_count = 0
+
+        for player in state.players:
+            hand = [card.id for card in player.get_hand()][:2]
+            player_count += 1
+
+            columns['seats'].append(player.index)
+            columns['stacks'].append(self._stacks.get(player.index, player.get_amount_of_chips() + player.total_bet))
+            columns['blinds'].append(player.total_bet - contributions.get(player.index, 0))
+            columns['hole_cards'].extend(hand + [HandHistoryFormat.NO_CARD] * (2 - len(hand)))
+            columns['collections'].append(state.individual_pot_collection.get(player, 0))
+
+        columns['community_cards'].extend(card.id for card in state.community_cards)
+        columns['hands'].append(self._hands)
+        columns['player_counts'].append(player_count)
+        columns['board_sizes'].append(len(state.community_cards))
+        columns['action_counts'].append(len(self._actions))
+
+        self._hands += 1
+        self._is_hand_started = False
+
+        if len(columns['hands']) >= self.BLOCK_HANDS:
+            self._write_block()
+
+    def _write_block(self) -> None:
+        self._file.write(HandHistoryFormat.pack_block(self._columns))
+        self._columns = HandHistoryFormat.create_columns()
+        self._blocks_since_flush += 1
+
+        if self._blocks_since_flush >= self.FLUSH_BLOCKS:
+            self._file.flush()
+            self._blocks_since_flush = 0
+
+    @staticmethod
+    def _create_default_path() -> Path:
+        log_dir_path = Utils.get_base_dir().joinpath('log')
+        Utils.create_directory(log_dir_path)
+
+        return log_dir_path.joinpath(f'{Utils.get_now_as_str()}.hh')
@@ -0,0 +1,74 @@
+from .hand_action import HandAction
+from .hand_history_format import HandHistoryFormat
+from .hand_record import HandRecord
+from game import Card, Moves, Phases
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+class HandHistoryReader:
+    """
+    Streams the hands of a file written by HandHistoryObserver, decompressing one block at a time. A block cut off at
+    the end of the file (e.g. by a crash of the writing process) ends the iteration.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path)
+
+        with open(str(self._path), 'rb') as file:
+            self._seed = HandHistoryFormat.unpack_header(file.read(HandHistoryFormat.HEADER.size))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def seed(self) -> Optional[int]:
+        """
+        :return: Seed of the recorded table, None if not given
+        """
+        return self._seed
+
+    def __iter__(self) -> Iterator[HandRecord]:
+        with open(str(self._path), 'rb') as file:
+            file.seek(HandHistoryFormat.HEADER.size)
+
+            while True:
+                block_header = file.read(HandHistoryFormat.BLOCK_HEADER.size)
+
+                if len(block_header) < HandHistoryFormat.BLOCK_HEADER.size:
+                    return
+
+                _, size = HandHistoryFormat.BLOCK_HEADER.unpack(block_header)
+                compressed = file.read(size)
+
+                if len(compressed) < size:
+                    return
+
+                yield from self._read_block(HandHistoryFormat.unpack_block(compressed))
+
+    @staticmethod
+    def _read_block(columns: Dict[str, List[int]]) -> Iterator[HandRecord]:
+        players = iter(zip(columns['seats'], columns['stacks'], columns['blinds'], columns['collections']))
+        hole_cards = iter(columns['hole_cards'])
+        community_cards = iter(columns['community_cards'])
+        actions = iter(zip(columns['action_phases'], columns['action_seats'], columns['action_moves'],
+                           columns['action_amounts']))
+
+        for hand, player_count, board_size, action_count in zip(columns['hands'], columns['player_counts'],
+                                                                 columns['board_sizes'], columns['action_counts']):
+            seats, stacks, blinds, collections = zip(*islice(players, player_count))
+
+            yield HandRecord(
+                hand=hand,
+                seats=seats,
+                stacks=stacks,
+                blinds=blinds,
+                hole_cards=tuple(tuple(Card.from_id(card) for card in islice(hole_cards, 2)
+                                       if card != HandHistoryFormat.NO_CARD) for _ in range(player_count)),
+                community_cards=tuple(Card.from_id(card) for card in islice(community_cards, board_size)),
+                actions=tuple(HandAction(Phases(phase), seat, Moves(move), amount)
+                              for phase, seat, move, amount in islice(actions, action_count)),
+                collections=collections
+            )
@@ -0,0 +1,14 @@
+from .hand_action import HandAction
+from game import Card
+from typing import NamedTuple, Tuple
+
+
+class HandRecord(NamedTuple):
+    hand: int
+    seats: Tuple[int, ...]
+    stacks: Tuple[int, ...]
+    blinds: Tuple[int, ...]
+    hole_cards: Tuple[Tuple[Card, ...], ...]
+    community_cards: Tuple[Card, ...]
+    actions: Tuple[HandAction, ...]
+    collections: Tuple[int, ...]
@@ -1,11 +1,11 @@
 from ..players import Players
 from game import Card, Phases
-from typing import Dict, List, NamedTuple
+from typing import Dict, NamedTuple, Tuple
 
 
 class State(NamedTuple):
     players: Players
-    community_cards: List[Card]
+    community_cards: Tuple[Card, ...]
     pot: int
     phase: Phases
     individual_pot_collection: Dict[Players, int]
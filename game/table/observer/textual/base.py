@@ -33,7 +33,7 @@ class Base(RootBaseObserver, ABC):
     def _acquire_state_information(self, state: State) -> None:
         state_info = ''
         state_info += f' POT:\t{str(state.pot)}\n'
-        state_info += f' CARDS:\t{str(state.community_cards)}\n'
+        state_info += f' CARDS:\t{str(list(state.community_cards))}\n'
         state_info += ' PLAYERS:\n'
         state_info += '\n'
         for player in state.players:
@@ -1,4 +1,5 @@
 from .observer import BaseObserver as Observer, State
+from game import Moves
 
 
 class Observers:
@@ -19,3 +20,10 @@ class Observers:
     def notify(self, state: State) -> None:
         for observer in self._observers:
             observer.update(state)
+
+    def notify_move(self, player, move: Moves, amount: int) -> None:
+        for observer in self._observers:
+            observer.update_move(player, move, amount)
+
+    def __len__(self) -> int:
+        return len(self._observers)
@@ -1,223 +1,157 @@
 from copy import deepcopy
 from game import Card, FinalHandType, Moves, State
 from game.player import Player as Basic_Player
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 
 class Players:
-    def __init__(self, basic_player: Basic_Player) -> None:
-        self._basic_player = basic_player
-        self._basic_player_type = basic_player.__class__.__name__
-        self._current_bet = 0
-        self._total_bet = 0
-        self._score = 0
-        self._is_active = True
-        self._current_move = None
-        self._final_hand = None
-        self._final_hand_type = None
-        self._next = None
+    """
+    Handle of one seat, the player's state is stored in the table's Seats.
+
+    Handles are created once per seat and stay the same for the whole tournament, so they can be compared and used as
+    keys. Iterating a handle goes over all seated players, starting with the handle's player.
+    """
+    __slots__ = ('_seats', '_index')
+
+    def __init__(self, seats, index: int) -> None:
+        self._seats = seats
+        self._index = index
+
+    @property
+    def seats(self):
+        return self._seats
+
+    @property
+    def index(self) -> int:
+        return self._index
 
     @property
     def player_type(self) -> str:
-        return self._basic_player_type
+        return self.basic_player.__class__.__name__
 
     @property
     def basic_player(self) -> Basic_Player:
-        return self._basic_player
+        return self._seats._basic_players[self._index]
 
     @property
     def name(self) -> str:
-        return self._basic_player.name
+        return self.basic_player.name
 
     @property
     def current_bet(self) -> int:
-        return self._current_bet
+        return self._seats._current_bets[self._index]
 
     @current_bet.setter
     def current_bet(self, bet: int) -> None:
-        self._current_bet = bet
+        self._seats._current_bets[self._index] = bet
 
     @property
     def total_bet(self) -> int:
-        return self._total_bet
+        return self._seats._total_bets[self._index]
 
     @total_bet.setter
     def total_bet(self, bet: int) -> None:
-        self._total_bet = bet
+        self._seats._total_bets[self._index] = bet
 
     @property
     def current_move(self) -> Moves:
-        return self._current_move
+        return self._seats._moves[self._index]
 
     @current_move.setter
     def current_move(self, move: Moves) -> None:
-        self._current_move = move
+        self._seats.set_move(self._index, move)
 
     @property
-    def final_hand(self) -> List[Card]:
-        return self._final_hand
+    def final_hand(self) -> Optional[Tuple[Card, ...]]:
+        return self._seats._final_hands[self._index]
 
     @final_hand.setter
-    def final_hand(self, hand: List[Card]) -> None:
-        self._final_hand = hand
+    def final_hand(self, hand: Optional[Tuple[Card, ...]]) -> None:
+        self._seats._final_hands[self._index] = hand
 
     @property
     def final_hand_type(self) -> FinalHandType:
-        return self._final_hand_type
+        return self._seats._final_hand_types[self._index]
 
     @final_hand_type.setter
     def final_hand_type(self, hand_type: FinalHandType) -> None:
-        self._final_hand_type = hand_type
+        self._seats._final_hand_types[self._index] = hand_type
 
     @property
     def score(self) -> int:
-        return self._score
+        return self._seats._scores[self._index]
 
     @score.setter
     def score(self, score: int) -> None:
-        self._score = score
+        self._seats._scores[self._index] = score
+
+    @property
+    def strength(self) -> int:
+        return self._seats._strengths[self._index]
+
+    @strength.setter
+    def strength(self, strength: int) -> None:
+        self._seats._strengths[self._index] = strength
 
     @property
     def is_active(self) -> bool:
-        return self._is_active
+        return self._seats._is_active[self._index]
 
     @is_active.setter
     def is_active(self, state: bool) -> None:
-        self._is_active = state
+        self._seats.set_active(self._index, state)
 
     @property
     def next(self) -> 'Players':
-        return self._next
-
-    @next.setter
-    def next(self, player: 'Players') -> None:
-        self._next = player
+        return self._seats.get_next(self._index)
 
     def receive_cards(self, cards: List[Card]) -> None:
-        self._basic_player.receive_cards(cards)
+        self.basic_player.receive_cards(cards)
 
     def get_amount_of_chips(self) -> int:
-        return self._basic_player.get_amount_of_chips()
+        return self.basic_player.get_amount_of_chips()
 
     def spend_chips(self, amount: int) -> int:
-        return self._basic_player.spend_chips(amount)
+        return self.basic_player.spend_chips(amount)
 
     def make_move(self, possible_moves: List[Moves], game_state: State) -> Moves:
-        return self._basic_player.make_move(possible_moves, game_state)
+        return self.basic_player.make_move(possible_moves, game_state)
 
     def get_hand(self) -> List[Card]:
-        return self._basic_player.get_hand()
+        return self.basic_player.get_hand()
 
     def receive_chips(self, amount: int) -> None:
-        self._basic_player.receive_chips(amount)
+        self.basic_player.receive_chips(amount)
 
     def destroy_hand(self) -> None:
-        self._basic_player.destroy_hand()
+        self.basic_player.destroy_hand()
 
     def reset(self) -> None:
-        self._basic_player.destroy_hand()
-        self._current_move = None
-        self._current_bet = 0
-        self._total_bet = 0
-        self._final_hand = None
-        self._final_hand_type = None
-        self._score = 0
-        self._is_active = True
-
-    def append(self, player: 'Players') -> None:
-        tmp = self
-        is_closed_list = False
-
-        while tmp.next is not None:
-            if tmp.next == self:
-                is_closed_list = True
-                tmp.next = None
-            else:
-                tmp = tmp.next
-
-        tmp.next = player
-
-        if is_closed_list:
-            player.next = self
+        self._seats.reset(self._index)
 
     def get_by_position(self, position: int = 1) -> 'Players':
-        next_player = self
-
-        for _ in range(position):
-            next_player = next_player.next
-
-        return next_player
+        return self._seats.get_by_position(self._index, position)
 
     def remove_player(self, player: 'Players') -> None:
-        for p in self:
-            if p.next == player:
-                p.next = player.next
-                player.next = None
+        self._seats.unseat(player)
 
     def find(self, player_to_find: 'Players') -> Optional['Players']:
-        if player_to_find == self:
-            return player_to_find
-
-        player = self._next
-
-        while player != player_to_find:
-            if player == self or player is None:
-                return None
-
-            player = player.next
-
-        return player
+        return player_to_find if self._seats.is_seated(player_to_find) else None
 
     def find_by_move(self, move: Optional[Moves]) -> List['Players']:
-        players = []
-
-        for player in self:
-            if player.current_move is move:
-                players.append(player)
-
-        return players
+        return [player for player in self if player.current_move is move]
 
     def count(self) -> int:
-        player = self._next
-        cnt = 1
-
-        while player != self and player is not None:
-            cnt += 1
-            player = player.next
-
-        return cnt
+        return self._seats.count()
 
     def count_active(self) -> int:
-        active_amount = 0
-
-        for player in self:
-            if player._is_active:
-                active_amount += 1
-
-        return active_amount
+        return self._seats.counters.active
 
     def clone(self) -> 'Players':
         return deepcopy(self)
 
-    def __iter__(self) -> 'Players':
-        self._tmp = self
-        self._has_head_been_returned = False
-        return self
-
-    def __next__(self) -> 'Players':
-        if self._tmp is not None:
-            if self._tmp == self:
-                if not self._has_head_been_returned:
-                    self._has_head_been_returned = True
-                else:
-                    raise StopIteration
-
-            tmp = self._tmp
-            self._tmp = self._tmp.next
-
-            return tmp
-        else:
-            raise StopIteration
+    def __iter__(self) -> Iterator['Players']:
+        return iter(self._seats.rotation(self._index))
 
     def __str__(self) -> str:
         return str(self.name)
@@ -0,0 +1,65 @@
+from game import Moves
+from typing import Dict, Optional
+
+
+class SeatCounters:
+    """
+    Amount of seated players by current move and by active state.
+
+    Seats report every change of a seated player's move or active state (see Seats.set_move), so the table gets the
+    amounts of folded, all-in, pending (no move yet) and active players without walking the list of players.
+    """
+
+    def __init__(self) -> None:
+        self._players = 0
+        self._active = 0
+        self._moves: Dict[Optional[Moves], int] = {move: 0 for move in Moves}
+        self._moves[None] = 0
+
+    @property
+    def players(self) -> int:
+        return self._players
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def folded(self) -> int:
+        return self._moves[Moves.FOLD]
+
+    @property
+    def all_in(self) -> int:
+        return self._moves[Moves.ALL_IN]
+
+    @property
+    def pending(self) -> int:
+        return self._moves[None]
+
+    def count_by_move(self, move: Optional[Moves]) -> int:
+        return self._moves[move]
+
+    def add_player(self, move: Optional[Moves], is_active: bool) -> None:
+        self._players += 1
+        self._moves[move] += 1
+        self._active += is_active
+
+    def remove_player(self, move: Optional[Moves], is_active: bool) -> None:
+        self._players -= 1
+        self._moves[move] -= 1
+        self._active -= is_active
+
+    def update_move(self, old_move: Optional[Moves], new_move: Optional[Moves]) -> None:
+        self._moves[old_move] -= 1
+        self._moves[new_move] += 1
+
+    def update_active(self, old_state: bool, new_state: bool) -> None:
+        self._active += new_state - old_state
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SeatCounters) and self._players == other._players \
+            and self._active == other._active and self._moves == other._moves
+
+    def __str__(self) -> str:
+        return f'SeatCounters(players={self._players}, active={self._active}, folded={self.folded}, ' \
+               f'all_in={self.all_in}, pending={self.pending})'
@@ -0,0 +1,163 @@
+from .seat_counters import SeatCounters
+from .side_pots import SidePots
+from game import Card, FinalHandType, IncrementalHandEvaluator, Moves
+from game.player import Player as BasicPlayer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class Seats:
+    """
+    State of all players at a table, stored as one list per attribute and indexed by seat.
+
+    Seats are never reused, a player who leaves the table keeps the seat index and can be seated again. The seating
+    order is kept as a list of seat indices, so neighbours and positions are found in O(1), and iterating the players
+    goes over a cached tuple (a new one is created only when the seating changes), which keeps iterations independent
+    of each other.
+    """
+
+    def __init__(self, basic_players: List[BasicPlayer]) -> None:
+        from .players import Players
+
+        amount = len(basic_players)
+
+        self._basic_players = list(basic_players)
+        self._current_bets = [0] * amount
+        self._total_bets = [0] * amount
+        self._moves: List[Optional[Moves]] = [None] * amount
+        self._is_active = [True] * amount
+        self._scores = [0] * amount
+        self._strengths = [0] * amount
+        self._final_hands: List[Optional[Tuple[Card, ...]]] = [None] * amount
+        self._final_hand_types: List[Optional[FinalHandType]] = [None] * amount
+        self._is_seated = [False] * amount
+        self._counters = SeatCounters()
+        self._players = tuple(Players(self, index) for index in range(amount))
+        self._order: List[int] = []
+        self._positions = [-1] * amount
+        self._rotations: Dict[int, Tuple[Players, ...]] = {}
+
+        self.seat(self._players)
+
+    @property
+    def counters(self) -> SeatCounters:
+        return self._counters
+
+    def get(self, index: int):
+        return self._players[index]
+
+    def seat(self, players: Iterable) -> None:
+        """
+        Seats exactly the given players, in the given order. Players who are not given leave the table.
+        """
+        order = [player.index for player in players]
+
+        for index in self._order:
+            self._is_seated[index] = False
+            self._positions[index] = -1
+            self._counters.remove_player(self._moves[index], self._is_active[index])
+
+        for position, index in enumerate(order):
+            self._is_seated[index] = True
+            self._positions[index] = position
+            self._counters.add_player(self._moves[index], self._is_active[index])
+
+        self._order = order
+        self._rotations = {}
+
+    def unseat(self, player) -> None:
+        index = player.index
+
+        if not self._is_seated[index]:
+            return
+
+        self.seat(self._players[i] for i in self._order if i != index)
+
+    def is_seated(self, player) -> bool:
+        return player.seats is self and self._is_seated[player.index]
+
+    def count(self) -> int:
+        return len(self._order)
+
+    def get_next(self, index: int):
+        """
+        :return: Next seated player after the seat, raises ValueError for a player who is not seated (see
+            get_by_position)
+        """
+        return self.get_by_position(index, 1)
+
+    def get_by_position(self, index: int, position: int):
+        if not self._is_seated[index]:
+            raise ValueError(f'Player {self._basic_players[index]} is not seated')
+
+        return self._players[self._order[(self._positions[index] + position) % len(self._order)]]
+
+    def rotation(self, index: int) -> Tuple:
+        """
+        :return: Seated players in seating order, starting with the player at the seat
+        """
+        rotation = self._rotations.get(index)
+
+        if rotation is None:
+            if self._is_seated[index]:
+                position = self._positions[index]
+                order = self._order[position:] + self._order[:position]
+            else:
+                order = [index]
+
+            rotation = tuple(self._players[i] for i in order)
+            self._rotations[index] = rotation
+
+        return rotation
+
+    def set_move(self, index: int, move: Optional[Moves]) -> None:
+        if self._is_seated[index]:
+            self._counters.update_move(self._moves[index], move)
+
+        self._moves[index] = move
+
+    def set_active(self, index: int, state: bool) -> None:
+        if self._is_seated[index]:
+            self._counters.update_active(self._is_active[index], state)
+
+        self._is_active[index] = state
+
+    def evaluate_hands(self, players: Iterable, community_cards: Iterable[Card], with_cards: bool) -> None:
+        """
+        Final hand type, score and strength of every given player who didn't fold.
+
+        :param with_cards: Also pick the cards of the final hands (see Players.final_hand)
+        """
+        community_evaluator = IncrementalHandEvaluator(community_cards)
+
+        for player in players:
+            index = player.index
+
+            if self._moves[index] is not Moves.FOLD:
+                evaluator = community_evaluator.copy()
+                evaluator.add_cards(self._basic_players[index].get_hand())
+
+                self._final_hands[index] = evaluator.find().hand if with_cards else None
+                self._final_hand_types[index] = evaluator.type
+                self._scores[index] = evaluator.score
+                self._strengths[index] = evaluator.strength
+
+    def split_pot(self, players: Sequence) -> List[int]:
+        """
+        :return: Chips every given player collects from the total bets (see SidePots)
+        """
+        indices = [player.index for player in players]
+
+        return SidePots.split([self._total_bets[index] for index in indices],
+                              [self._strengths[index] for index in indices],
+                              [self._moves[index] is Moves.FOLD for index in indices])
+
+    def reset(self, index: int) -> None:
+        self._basic_players[index].destroy_hand()
+        self.set_move(index, None)
+        self._current_bets[index] = 0
+        self._total_bets[index] = 0
+        self._final_hands[index] = None
+        self._final_hand_types[index] = None
+        self._scores[index] = 0
+        self._strengths[index] = 0
+        self.set_active(index, True)
@@ -0,0 +1,57 @@
+from typing import List, Sequence
+
+
+class SidePots:
+    """
+    Single pass side pot resolution.
+
+    The total bets are sorted once and cut into layers between consecutive bet levels. Every layer holds the level
+    difference from every player who bet at least its upper bound and goes to the strongest players eligible for it
+    (players who bet at least the upper bound, or folded), split evenly. Players who folded take part in every layer
+    with strength 0, so they only collect layers no remaining player can claim, which replicates the former collection
+    where they formed the weakest group collecting the rest of the pot.
+
+    Shares are accumulated in units of 1 / SHARE_SCALE chips, which divides exactly by up to 10 winners, and every
+    player's total is rounded down once, so the chips which can't be split evenly are the same on every platform and
+    stay in the pot.
+    """
+    SHARE_SCALE = 2520
+
+    @classmethod
+    def split(cls, total_bets: Sequence[int], strengths: Sequence[int], is_folded: Sequence[bool]) -> List[int]:
+        """
+        :param total_bets: Chips every player bet in the hand
+        :param strengths: Strength of every player's final hand, higher is better
+        :param is_folded: If the player folded
+        :return: Chips every player collects
+        """
+        amount = len(total_bets)
+        order = sorted(range(amount), key=total_bets.__getitem__, reverse=True)
+        shares = [0] * amount
+        winners = [i for i in range(amount) if is_folded[i]]
+        best_strength = 0 if len(winners) > 0 else None
+        position = 0
+
+        while position < amount:
+            level = total_bets[order[position]]
+
+            while position < amount and total_bets[order[position]] == level:
+                player = order[position]
+                position += 1
+
+                if is_folded[player]:
+                    continue
+
+                if best_strength is None or strengths[player] > best_strength:
+                    best_strength = strengths[player]
+                    winners = [player]
+                elif strengths[player] == best_strength:
+                    winners.append(player)
+
+            lower_level = total_bets[order[position]] if position < amount else 0
+            share = (level - lower_level) * position * cls.SHARE_SCALE // len(winners)
+
+            for player in winners:
+                shares[player] += share
+
+        return [share // cls.SHARE_SCALE for share in shares]
@@ -1,25 +1,51 @@
+from .decision_executor import DecisionExecutor
+from .decision_profiler import DecisionProfiler
 from .observer import State as ObserverState, BaseObserver
 from .observers import Observers
 from .players import Players as TablePlayers
-from copy import deepcopy
-from game import Card, Deck, Moves, Phases, State, StrongestFinalHandFinder
+from .seat_counters import SeatCounters
+from .seats import Seats
+from .table_snapshot import TableSnapshot
+from collections import Counter
+from concurrent.futures import TimeoutError as DecisionTimeoutError
+from game import Card, Deck, Moves, Phases, RandomStreams, State
 from game.player import Player as BasicPlayer
-from typing import Dict, List, Optional, Tuple, Type
+from random import Random
+import random as global_random
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 
 class Table:
     INIT_CHIPS = 100
     SMALL_BET = 2
     BIG_BET = 4
-
-    def __init__(self, players_classes: List[Type[BasicPlayer]]) -> None:
+    DEBUG_SEAT_COUNTERS = False
+    DECISION_TIME_BUDGET: Optional[float] = None
+    TIMEOUT_MOVES = (Moves.CHECK, Moves.FOLD)
+
+    def __init__(self, players_classes: List[Type[BasicPlayer]],
+                 players_kwargs: Optional[List[Dict[str, Any]]] = None,
+                 seed: Optional[int] = None) -> None:
+        """
+        :param players_classes: Class of every player
+        :param players_kwargs: Additional constructor arguments of every player
+        :param seed: Seed of the table's random streams, the deck and every player get their own stream split from it.
+            The global generator is used by all of them if no seed is given.
+        """
         self._init_chips = self.INIT_CHIPS
-        self._deck = Deck()
-        self._players = self._create_players(players_classes)
+        self._random_streams = RandomStreams(seed) if seed is not None else None
+        self._random = self._create_random(0)
+        self._deck = Deck(self._random)
+        self._seats = self._create_seats(players_classes, players_kwargs)
+        self._seat_counters = self._seats.counters
+        self._players = self._seats.get(0)
         self._total_players = self._players.count()
         self._pot = 0
         self._pot_leftover = 0
         self._community_cards = []
+        self._board: Tuple[Card, ...] = ()
+        self._board_source = None
         self._current_bet = 0
         self._small_bet = self.SMALL_BET
         self._big_bet = self.BIG_BET
@@ -28,18 +54,59 @@ class Table:
         self._is_round_active = True
         self._is_game_active = True
         self._observers = Observers()
+        self._profiler: Optional[DecisionProfiler] = None
+        self._decision_time_budget = self.DECISION_TIME_BUDGET
+        self._decision_executors: Dict[TablePlayers, DecisionExecutor] = {}
+        self._timeouts: Dict[str, int] = {}
         self._players_who_lost = []
         self._current_phase = None
+        self._hands_played = 0
+        self._tournaments_played = 0
 
     def run_tournament(self) -> None:
-        while self._is_game_active:
-            self._init_pre_flop_phase()
-            self._init_flop_phase()
-            self._init_turn_phase()
-            self._init_river_phase()
-            self._init_showdown_phase()
-            self._init_pot_collection_phase()
-            self._prepare_next_round()
+        try:
+            while self._is_game_active:
+                self._play_hand()
+        finally:
+            self.close()
+
+        self._tournaments_played += 1
+
+        if self._profiler is not None and self._profiler.print_summary:
+            print(self._profiler.summarize())
+
+    def close(self) -> None:
+        """
+        Stops the decision worker threads (started again by the next decision within a time budget). Called at the end
+        of every tournament, has to be called by the owner of a table which is dropped in the middle of a tournament.
+        """
+        for executor in self._decision_executors.values():
+            executor.close()
+
+        self._decision_executors = {}
+
+    def _play_hand(self) -> None:
+        profiler = self._profiler
+
+        for phase, steps in self._get_hand_steps():
+            start = profiler.start_phase() if profiler is not None else 0
+
+            for step in steps:
+                step()
+
+            if profiler is not None:
+                profiler.end_phase(phase, start)
+
+    def _get_hand_steps(self) -> Tuple[Tuple[Phases, Tuple[Callable[[], None], ...]], ...]:
+        """
+        :return: Steps of a hand in order, grouped by the phase their time is attributed to by the profiler
+        """
+        return ((Phases.PRE_FLOP, (self._init_pre_flop_phase,)),
+                (Phases.FLOP, (self._init_flop_phase,)),
+                (Phases.TURN, (self._init_turn_phase,)),
+                (Phases.RIVER, (self._init_river_phase,)),
+                (Phases.SHOWDOWN, (self._init_showdown_phase,)),
+                (Phases.POT_COLLECTION, (self._init_pot_collection_phase, self._prepare_next_round)))
 
     def reset_tournament(self) -> None:
         self._reset_players()
@@ -52,6 +119,74 @@ class Table:
             return self._players.name
         return str(None)
 
+    def get_ranking(self) -> List[str]:
+        """
+        :return: Names of the players by their finishing position, starting with the players still in the tournament
+        """
+        return [player.name for player in self._players] + [player.name for player in reversed(self._players_who_lost)]
+
+    @property
+    def hands_played(self) -> int:
+        return self._hands_played
+
+    @property
+    def tournaments_played(self) -> int:
+        return self._tournaments_played
+
+    def snapshot(self) -> TableSnapshot:
+        """
+        Captures the table between two hands: seating (starting with the dealer), stacks, pot leftover, counters and
+        the state of the random generators of the deck and of the players (the global generator if not seeded).
+        """
+        return TableSnapshot(
+            seats=tuple(player.index for player in self._players),
+            players_who_lost=tuple(player.index for player in self._players_who_lost),
+            chips=tuple(self._seats.get(i).get_amount_of_chips() for i in range(self._total_players)),
+            pot_leftover=self._pot_leftover,
+            is_game_active=self._is_game_active,
+            hands_played=self._hands_played,
+            tournaments_played=self._tournaments_played,
+            random_state=self._deck_random.getstate(),
+            players_random_states=tuple(self._get_player_random_state(self._seats.get(i).basic_player)
+                                        for i in range(self._total_players))
+        )
+
+    def restore(self, snapshot: TableSnapshot) -> None:
+        """
+        Continues from a snapshot of a table with the same players, the next hand is played as it would have been after
+        the snapshot was taken.
+        """
+        if len(snapshot.chips) != self._total_players:
+            raise ValueError('Snapshot has to be taken at a table with the same amount of players')
+
+        seated_players = [self._seats.get(i) for i in snapshot.seats]
+        self._seats.seat(seated_players)
+        self._players = seated_players[0]
+        self._players_who_lost = [self._seats.get(i) for i in snapshot.players_who_lost]
+
+        for i, chips in enumerate(snapshot.chips):
+            player = self._seats.get(i)
+            player.spend_chips(player.get_amount_of_chips())
+            player.receive_chips(chips)
+
+            if snapshot.players_random_states[i] is not None:
+                player.basic_player.random.setstate(snapshot.players_random_states[i])
+
+        self._pot_leftover = snapshot.pot_leftover
+        self._is_game_active = snapshot.is_game_active
+        self._hands_played = snapshot.hands_played
+        self._tournaments_played = snapshot.tournaments_played
+        self._deck_random.setstate(snapshot.random_state)
+        self._reset_play()
+
+    @property
+    def _deck_random(self) -> Random:
+        return self._random if self._random is not None else global_random
+
+    @staticmethod
+    def _get_player_random_state(player: BasicPlayer) -> Optional[tuple]:
+        return player.random.getstate() if player.random is not global_random else None
+
     @property
     def player_names(self) -> List[str]:
         names = []
@@ -66,32 +201,67 @@ class Table:
     def detach_observer(self, observer: BaseObserver) -> None:
         self._observers.detach(observer)
 
-    def _create_players(self, players_classes: List[Type[BasicPlayer]]) -> TablePlayers:
+    @property
+    def decision_time_budget(self) -> Optional[float]:
+        return self._decision_time_budget
+
+    @decision_time_budget.setter
+    def decision_time_budget(self, budget: Optional[float]) -> None:
+        """
+        :param budget: Seconds every decision may take before the first allowed move of TIMEOUT_MOVES is made instead,
+            None to wait for every decision. With a budget players decide on worker threads.
+        """
+        self._decision_time_budget = budget
+
+    @property
+    def timeouts(self) -> Dict[str, int]:
+        """
+        :return: Amount of decisions every player (by name) exceeded the time budget with
+        """
+        return dict(self._timeouts)
+
+    @property
+    def profiler(self) -> Optional[DecisionProfiler]:
+        return self._profiler
+
+    def attach_profiler(self, profiler: DecisionProfiler) -> None:
+        self._profiler = profiler
+
+    def detach_profiler(self) -> None:
+        self._profiler = None
+
+    def _create_seats(self, players_classes: List[Type[BasicPlayer]],
+                      players_kwargs: Optional[List[Dict[str, Any]]] = None) -> Seats:
         if len(players_classes) < 2 or len(players_classes) > 10:
             raise ValueError('Only between 2 and 10 players allowed...')
 
-        dealer = None
-        previous_table_player = None
+        if players_kwargs is None:
+            players_kwargs = [{} for _ in players_classes]
+        elif len(players_kwargs) != len(players_classes):
+            raise ValueError('Constructor arguments have to be given for every player')
+
+        basic_players = []
 
         for player_cnt in range(len(players_classes)):
             player_name = f'Player_{str(player_cnt + 1)} ({players_classes[player_cnt].__name__})'
-            basic_player = players_classes[player_cnt](self._init_chips, player_name)
+            basic_player = players_classes[player_cnt](self._init_chips, player_name, **players_kwargs[player_cnt])
 
             if not isinstance(basic_player, BasicPlayer):
                 raise ValueError('Class has to be extended from game.Player base class')
 
-            table_player = TablePlayers(basic_player)
+            player_random = self._create_random(player_cnt + 1)
+            if player_random is not None:
+                basic_player.random = player_random
 
-            if previous_table_player is not None:
-                previous_table_player.next = table_player
-            else:
-                dealer = table_player
+            basic_players.append(basic_player)
 
-            previous_table_player = table_player
+        return Seats(basic_players)
 
-        previous_table_player.next = dealer
+    def _create_random(self, stream: int) -> Optional[Random]:
+        if self._random_streams is None:
+            return None
 
-        return dealer
+        return self._random_streams.child(stream).create_random()
 
     def _init_pre_flop_phase(self) -> None:
         self._current_phase = Phases.PRE_FLOP
@@ -147,28 +317,28 @@ class Table:
     def _init_pot_collection_phase(self) -> None:
         self._current_phase = Phases.POT_COLLECTION
 
-        sorted_players = self._sort_players_by_score()
-        individual_pot_collection = self._split_pot_among_players(sorted_players)
+        self._wait_for_decisions()
+
+        individual_pot_collection = self._split_pot_among_players()
+        same_win_amounts = Counter(individual_pot_collection.values())
         pot_leftover_collections = 0
 
-        for player in self._players:
-            if player in individual_pot_collection:
-                collecting_chips = self._take_from_pot(individual_pot_collection[player])
-                same_win_amount = list(individual_pot_collection.values()).count(individual_pot_collection[player])
-                total_pot_leftover = self._pot_leftover * (pot_leftover_collections + 1)
-                if self._pot_leftover > 0 and total_pot_leftover % same_win_amount == 0:
-                    collecting_chips += self._take_from_pot_leftover(int(total_pot_leftover / same_win_amount))
-                    pot_leftover_collections += 1
-
-                player.receive_chips(collecting_chips)
-            else:
-                player.receive_chips(0)
+        for player, collection in individual_pot_collection.items():
+            collecting_chips = self._take_from_pot(collection)
+            same_win_amount = same_win_amounts[collection]
+            total_pot_leftover = self._pot_leftover * (pot_leftover_collections + 1)
+            if self._pot_leftover > 0 and total_pot_leftover % same_win_amount == 0:
+                collecting_chips += self._take_from_pot_leftover(total_pot_leftover // same_win_amount)
+                pot_leftover_collections += 1
+
+            player.receive_chips(collecting_chips)
 
         self._pot_leftover += self._take_from_pot(self._pot)
 
         self._notify_observers(individual_pot_collection)
 
     def _prepare_next_round(self) -> None:
+        self._hands_played += 1
         self._define_next_dealer()
         self._kick_out_players_who_lost()
         self._update_game_active_state()
@@ -209,11 +379,21 @@ class Table:
                     break
                 continue
 
-            move = player.make_move(moves, self.generate_game_state(tuple(moves)))
+            state = self.generate_game_state(tuple(moves))
+
+            if self._profiler is None and self._decision_time_budget is None:
+                move = player.make_move(moves, state)
+            else:
+                move = self._make_supervised_move(player, moves, state)
 
             raise_cnt_before_move_execution = self._raise_cnt
 
-            self._execute_player_move(player, move)
+            if len(self._observers) == 0:
+                self._execute_player_move(player, move)
+            else:
+                chips = player.get_amount_of_chips()
+                self._execute_player_move(player, move)
+                self._observers.notify_move(player, player.current_move, chips - player.get_amount_of_chips())
 
             if player.current_move is Moves.RAISE or (
                     player.current_move is Moves.ALL_IN and raise_cnt_before_move_execution != self._raise_cnt):
@@ -228,6 +408,56 @@ class Table:
             if player.current_move is Moves.ALL_IN and player.is_active:
                 player.is_active = False
 
+    def _make_supervised_move(self, player: TablePlayers, moves: List[Moves], state: State) -> Moves:
+        start = perf_counter_ns()
+
+        if self._decision_time_budget is None:
+            move = player.make_move(moves, state)
+        else:
+            move = self._make_move_within_budget(player, moves, state)
+
+        if self._profiler is not None:
+            self._profiler.record_decision(player.player_type, self._current_phase, perf_counter_ns() - start)
+
+        return move
+
+    def _make_move_within_budget(self, player: TablePlayers, moves: List[Moves], state: State) -> Moves:
+        """
+        A player whose previous decision timed out and still runs doesn't get a new decision, the timeout move is
+        made for it until the running decision returned.
+        """
+        executor = self._decision_executors.get(player)
+
+        if executor is None:
+            executor = self._decision_executors[player] = DecisionExecutor(player.name)
+
+        if not executor.is_busy:
+            decision = executor.submit(player.make_move, moves, state)
+
+            try:
+                return decision.result(timeout=self._decision_time_budget)
+            except DecisionTimeoutError:
+                pass
+
+        self._timeouts[player.name] = self._timeouts.get(player.name, 0) + 1
+
+        return self._find_timeout_move(state.allowed_moves)
+
+    def _wait_for_decisions(self) -> None:
+        """
+        Waits for decisions which timed out in the hand, so they don't run while the players are paid out and the next
+        hand is dealt.
+        """
+        for executor in self._decision_executors.values():
+            executor.wait()
+
+    def _find_timeout_move(self, allowed_moves: Tuple[Moves, ...]) -> Moves:
+        for move in self.TIMEOUT_MOVES:
+            if move in allowed_moves:
+                return move
+
+        return Moves.FOLD
+
     def _deal_cards(self) -> None:
         for _ in range(2):
             self._deal_one_round()
@@ -263,26 +493,28 @@ class Table:
         player.total_bet += amount
 
     def _generate_player_moves(self, player: TablePlayers) -> Optional[List[Moves]]:
-        moves = list()
+        chips = player.get_amount_of_chips()
 
-        if player.current_move is Moves.FOLD or player.get_amount_of_chips() == 0:
+        if player.current_move is Moves.FOLD or chips == 0:
             return None
 
-        if player.current_bet < self._current_bet < player.get_amount_of_chips() + player.current_bet:
+        moves = list()
+        current_bet = player.current_bet
+        is_raising_capped = self._is_raising_capped()
+
+        if current_bet < self._current_bet < chips + current_bet:
             moves.append(Moves.CALL)
 
-        if player.get_amount_of_chips() + player.current_bet <= self._current_bet \
-                or (player.get_amount_of_chips() + player.current_bet <= (self._current_bet + self._current_raise)
-                    and not self._is_raising_capped()):
+        if chips + current_bet <= self._current_bet \
+                or (chips + current_bet <= (self._current_bet + self._current_raise) and not is_raising_capped):
             moves.append(Moves.ALL_IN)
 
-        if self._current_bet == player.current_bet:
+        if self._current_bet == current_bet:
             moves.append(Moves.CHECK)
 
-        if not self._is_raising_capped() \
-                and player.get_amount_of_chips() + player.current_bet > (self._current_bet + self._current_raise) \
-                and self._players.count() - (
-                len(self._players.find_by_move(Moves.FOLD)) + len(self._players.find_by_move(Moves.ALL_IN))) > 1:
+        if not is_raising_capped \
+                and chips + current_bet > (self._current_bet + self._current_raise) \
+                and self._seat_counters.players - (self._seat_counters.folded + self._seat_counters.all_in) > 1:
             moves.append(Moves.RAISE)
 
         moves.append(Moves.FOLD)
@@ -294,17 +526,29 @@ class Table:
 
     def generate_game_state(self, allowed_moves: Tuple[Moves]) -> State:
         return State(
-            community_cards=tuple(Card(c.rank, c.suit, c.value) for c in self._community_cards),
+            community_cards=self._get_state_community_cards(),
             total_players=self._total_players,
             total_chips=self._total_players * self._init_chips,
-            nbr_of_active_players=self._players.count() - len(self._players.find_by_move(Moves.FOLD)),
+            nbr_of_active_players=self._seat_counters.players - self._seat_counters.folded,
             current_phase=self._current_phase,
             is_raising_capped=self._is_raising_capped(),
             allowed_moves=allowed_moves,
             pot=self._pot,
-            current_bet=self._current_bet
+            current_bet=self._current_bet,
+            decision_time_budget=self._decision_time_budget
         )
 
+    def _get_state_community_cards(self) -> Tuple[Card, ...]:
+        """
+        :return: Community cards as a tuple which is rebuilt only when cards are dealt, so all states of a street share
+            it. Cards are interned and immutable, so the tuple is safe to keep.
+        """
+        if self._board_source is not self._community_cards or len(self._board) != len(self._community_cards):
+            self._board = tuple(self._community_cards)
+            self._board_source = self._community_cards
+
+        return self._board
+
     def _execute_player_move(self, player: TablePlayers, move: Moves) -> None:
 
         if move is Moves.CALL:
@@ -338,245 +582,46 @@ class Table:
         return self._calculate_amount_to_call(player) + self._current_raise
 
     def _update_round_active_state(self) -> None:
-        total_players = self._players.count()
-        folded_players = len(self._players.find_by_move(Moves.FOLD))
-        not_folded_players = total_players - folded_players
-        none_move_players = len(self._players.find_by_move(None))
-
-        self._is_round_active = (self._players.count_active()) > 1 or (not_folded_players > 1 and none_move_players > 0)
-
-    def _find_players_final_hand(self) -> None:
-
-        for player in self._players:
-            if player.current_move is not Moves.FOLD:
-                final_hand = StrongestFinalHandFinder.find(self._community_cards + player.get_hand())
-
-                player.final_hand = final_hand.hand
-                player.final_hand_type = final_hand.type
-                player.score = final_hand.score
-
-    def _sort_players_by_score(self) -> List[List[TablePlayers]]:
-        sorted_players = list()
-
-        for player in self._players:
-            sorted_players = self._insert_player_in_sorted_list(player, sorted_players)
-
-        return sorted_players
-
-    def _insert_player_in_sorted_list(self, player: TablePlayers, sorted_players: List[List[TablePlayers]]) \
-            -> List[List[TablePlayers]]:
-        has_player_been_inserted = False
+        if self.DEBUG_SEAT_COUNTERS:
+            self._check_seat_counters()
 
-        for i in range(len(sorted_players)):
-            if player.score > self._players.find(sorted_players[i][0]).score:
-                sorted_players.insert(i, [player])
-                has_player_been_inserted = True
+        not_folded_players = self._seat_counters.players - self._seat_counters.folded
 
-            elif player.score == self._players.find(sorted_players[i][0]).score:
-                comparing_player = sorted_players[i][0]
-                stronger_player = self._find_stronger_player_on_draw(player, comparing_player)
+        self._is_round_active = self._seat_counters.active > 1 \
+            or (not_folded_players > 1 and self._seat_counters.pending > 0)
 
-                if stronger_player is None:
-                    sorted_players[i].append(player)
-                    has_player_been_inserted = True
-
-                elif player is stronger_player:
-                    sorted_players.insert(i, [player])
-                    has_player_been_inserted = True
-
-            if has_player_been_inserted:
-                break
-
-        if not has_player_been_inserted:
-            sorted_players.append([player])
-
-        return sorted_players
-
-    @staticmethod
-    def _find_stronger_player_on_draw(player_1: TablePlayers, player_2: TablePlayers) -> Optional[TablePlayers]:
-        if player_1.final_hand is None:
-            return None
-
-        for i, player_1_card in enumerate(player_1.final_hand):
-            if player_1_card.value > player_2.final_hand[i].value:
-                return player_1
-
-            if player_2.final_hand[i].value > player_1_card.value:
-                return player_2
-
-        return None
-
-    def _split_pot_among_players(self, players_grouped_by_strength: List[List[TablePlayers]]) \
-            -> Dict[TablePlayers, int]:
-        players_pot_collections = {player: 0 for player in self._players}
-        is_pot_collection = True
-
-        while is_pot_collection:
-            collecting_players = players_grouped_by_strength.pop(0)
-            sub_pot = self._calculate_sub_pot(collecting_players, players_grouped_by_strength)
-
-            if sub_pot is None:
-                pot = 0
-
-                for player in self._players:
-                    pot += player.total_bet
-
-                pot_division = pot / len(collecting_players)
-
-                for player in collecting_players:
-                    players_pot_collections[player] = int(pot_division)
-
-                is_pot_collection = False
-
-            else:
-                individual_pot_collection = self._split_sub_pot_among_players(collecting_players)
-                is_pot_collection = self._should_pot_collection_continue(collecting_players,
-                                                                         players_grouped_by_strength)
-
-                for player in collecting_players:
-                    players_pot_collections[player] = int(individual_pot_collection[player])
-
-                if is_pot_collection:
-                    self._update_players_total_bet(collecting_players, players_grouped_by_strength)
-
-        return players_pot_collections
-
-    def _calculate_sub_pot(self, collecting_players: List[TablePlayers],
-                           players_grouped_by_strength: List[List[TablePlayers]]) -> Optional[int]:
-        is_any_player_all_in = False
-        sub_pot = 0
-
-        for player in collecting_players:
-            player_bet = player.total_bet
-            sub_pot += player_bet
-
-            if player.current_move is Moves.ALL_IN:
-                is_any_player_all_in = True
-
-        if not is_any_player_all_in:
-            return None
-        else:
-            highest_bet = self._find_highest_player_bet(collecting_players)
-            for player_group in players_grouped_by_strength:
-                sub_pot += self._calculate_sub_pot_portion(player_group, highest_bet)
-
-            return sub_pot
-
-    @staticmethod
-    def _calculate_sub_pot_portion(players: List[TablePlayers], amount: int) -> int:
-        sub_pot_portion = 0
-
-        for player in players:
-            if player.total_bet < amount:
-                sub_pot_portion += player.total_bet
-            else:
-                sub_pot_portion += amount
-
-        return sub_pot_portion
-
-    def _split_sub_pot_among_players(self, collecting_players: List[TablePlayers]) -> Dict[TablePlayers, int]:
-        individual_pot_collection = {p: 0 for p in collecting_players}
-        highest_bet = self._find_highest_player_bet(collecting_players)
-        players_bets_asc = [{
-            'bet': highest_bet,
-            'total_players': 0,
-            'collecting_players': 0
-        }]
-
-        for player in self._players:
-            index = None
-            for i, player_bet in enumerate(players_bets_asc):
-                if player.total_bet < player_bet['bet']:
-                    index = i
-                    break
-
-            if index is not None:
-                players_bets_asc.insert(index, {
-                    'bet': player.total_bet,
-                    'total_players': 0,
-                    'collecting_players': 0
-                })
+    def _check_seat_counters(self) -> None:
+        """
+        Compares the seat counters with the amounts counted by walking the list of players.
+        """
+        seat_counters = SeatCounters()
 
         for player in self._players:
-            for player_bet in players_bets_asc:
-                if player.total_bet == player_bet['bet']:
-                    player_bet['total_players'] += 1
-                    if player in collecting_players:
-                        player_bet['collecting_players'] += 1
-                    break
-
-                if player.total_bet > player_bet['bet']:
-                    player_bet['total_players'] += 1
-                    if player in collecting_players:
-                        player_bet['collecting_players'] += 1
-
-        for player in collecting_players:
-            sub = 0
-            for player_bet in players_bets_asc:
-                if player.total_bet >= player_bet['bet']:
-                    individual_pot_collection[player] += \
-                        ((player_bet['bet'] - sub) * player_bet['total_players']) / player_bet['collecting_players']
-                sub = player_bet['bet']
-
-        return individual_pot_collection
-
-    @staticmethod
-    def _find_lowest_bet(players: List[TablePlayers]) -> int:
-        comparing_player = players[0]
-        lowest_bet = comparing_player.total_bet
-
-        for i in range(1, len(players)):
-            if players[i].total_bet < lowest_bet:
-                lowest_bet = players[i].total_bet
+            seat_counters.add_player(player.current_move, player.is_active)
 
-        return lowest_bet
+        if seat_counters != self._seat_counters:
+            raise RuntimeError(f'Seat counters out of sync: {self._seat_counters} instead of {seat_counters}')
 
-    def _should_pot_collection_continue(self, collecting_players: List[TablePlayers],
-                                        players_grouped_by_strength: List[List[TablePlayers]]) -> bool:
-        should_collection_continue = False
-        highest_collecting_player_bet = 0
-
-        for player in collecting_players:
-            if player.total_bet > highest_collecting_player_bet:
-                highest_collecting_player_bet = player.total_bet
-
-        for player_group in players_grouped_by_strength:
-            highest_not_collecting_player_bet = self._find_highest_player_bet(player_group)
-
-            if highest_not_collecting_player_bet > highest_collecting_player_bet:
-                should_collection_continue = True
-                break
-
-        return should_collection_continue
-
-    @staticmethod
-    def _find_highest_player_bet(players: List[TablePlayers]) -> int:
-        comparing_player = players[0]
-        highest_bet = comparing_player.total_bet
-
-        for i in range(1, len(players)):
-            if players[i].total_bet > highest_bet:
-                highest_bet = players[i].total_bet
+    def _find_players_final_hand(self) -> None:
+        """
+        The cards of the final hands are only picked for observers, players are ranked by type, score and strength.
+        Without observers the hand of a player who won without a showdown isn't evaluated.
+        """
+        is_observed = len(self._observers) > 0
 
-        return highest_bet
+        if not is_observed and self._seat_counters.players - self._seat_counters.folded == 1:
+            for player in self._players:
+                if player.current_move is not Moves.FOLD:
+                    player.strength = 1
 
-    def _update_players_total_bet(self, collecting_players: List[TablePlayers],
-                                  players_grouped_by_strength: List[List[TablePlayers]]) -> None:
-        highest_bet = self._find_highest_player_bet(collecting_players)
+            return
 
-        for player in collecting_players:
-            player.total_bet = 0
+        self._seats.evaluate_hands(self._players, self._community_cards, is_observed)
 
-        for player_group in players_grouped_by_strength:
-            self._reduce_players_total_bet(player_group, highest_bet)
+    def _split_pot_among_players(self) -> Dict[TablePlayers, int]:
+        players = self._seats.rotation(self._players.index)
 
-    @staticmethod
-    def _reduce_players_total_bet(players: List[TablePlayers], amount: int) -> None:
-        for player in players:
-            if player.total_bet < amount:
-                player.total_bet = 0
-            else:
-                player.total_bet -= amount
+        return dict(zip(players, self._seats.split_pot(players)))
 
     def _take_from_pot(self, amount: int) -> int:
         self._pot -= amount
@@ -609,11 +654,14 @@ class Table:
         self._current_raise = 0
         self._is_round_active = True
         self._raise_cnt = 0
-        self._deck = Deck()
+        self._reset_deck()
 
         for player in self._players:
             player.reset()
 
+    def _reset_deck(self) -> None:
+        self._deck.reset()
+
     def _update_game_active_state(self) -> None:
         self._is_game_active = not self._is_winner_present()
 
@@ -621,21 +669,10 @@ class Table:
         return self._players.count() == 1
 
     def _reset_players(self) -> None:
-        players = []
+        players = self._players_who_lost + list(self._players)
 
-        for p in self._players_who_lost:
-            players.append(p)
-
-        for p in self._players:
-            players.append(p)
-
-        np = None
-        for p in players:
-            if np is not None:
-                np.next = p
-            np = p
-        np.next = players[0]
-        self._players = np.next
+        self._seats.seat(players)
+        self._players = players[0]
         self._players_who_lost = []
 
     def _reset_player_chips(self) -> None:
@@ -645,9 +682,12 @@ class Table:
             p.receive_chips(self._init_chips)
 
     def _notify_observers(self, individual_pot_collection: Optional[Dict[TablePlayers, int]] = None) -> None:
+        if len(self._observers) == 0:
+            return
+
         state = ObserverState(
             players=self._players,
-            community_cards=deepcopy(self._community_cards),
+            community_cards=self._get_state_community_cards(),
             pot=self._pot,
             phase=self._current_phase,
             individual_pot_collection=individual_pot_collection
@@ -0,0 +1,13 @@
+from typing import NamedTuple, Optional, Tuple
+
+
+class TableSnapshot(NamedTuple):
+    seats: Tuple[int, ...]
+    players_who_lost: Tuple[int, ...]
+    chips: Tuple[int, ...]
+    pot_leftover: int
+    is_game_active: bool
+    hands_played: int
+    tournaments_played: int
+    random_state: tuple
+    players_random_states: Tuple[Optional[tuple], ...]
@@ -1,11 +1,13 @@
 from game.table import Table
 from game.player import Player as BasePlayer, Mode, SimpleDqnBot, MonitoredSimpleDqnBot, CollectiveSimpleDqnBot
-from typing import List, Type
+from typing import Any, Dict, List, Optional, Type
 
 
 class TrainingTable(Table):
-    def __init__(self, players_classes: List[Type[BasePlayer]]) -> None:
-        super().__init__(players_classes)
+    def __init__(self, players_classes: List[Type[BasePlayer]],
+                 players_kwargs: Optional[List[Dict[str, Any]]] = None,
+                 seed: Optional[int] = None) -> None:
+        super().__init__(players_classes, players_kwargs, seed)
         self._monitorable_player_class_names = [MonitoredSimpleDqnBot.__name__]
         self._trainable_player_class_names = [SimpleDqnBot.__name__, MonitoredSimpleDqnBot.__name__,
                                               CollectiveSimpleDqnBot.__name__]
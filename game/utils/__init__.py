@@ -1 +1,2 @@
 from .utils import Utils
+from .random_streams import RandomStreams
@@ -0,0 +1,34 @@
+import numpy as np
+from random import Random
+from typing import Optional, Tuple
+
+
+class RandomStreams:
+    """
+    Independent random streams derived from one seed.
+
+    Children are addressed by their index (not spawned in order), so the stream of a table, player or worker only
+    depends on the seed and its position, e.g. RandomStreams(seed).child(chunk).child(player).
+    """
+
+    def __init__(self, seed: Optional[int] = None, spawn_key: Tuple[int, ...] = ()) -> None:
+        self._seed_sequence = np.random.SeedSequence(seed, spawn_key=spawn_key)
+
+    @property
+    def seed_sequence(self) -> np.random.SeedSequence:
+        return self._seed_sequence
+
+    def child(self, index: int) -> 'RandomStreams':
+        return RandomStreams(self._seed_sequence.entropy, self._seed_sequence.spawn_key + (index,))
+
+    def create_seed(self) -> int:
+        """
+        :return: 32 bit seed, e.g. for the global generators of random, NumPy and PyTorch
+        """
+        return int(self._seed_sequence.generate_state(1)[0])
+
+    def create_random(self) -> Random:
+        return Random(int.from_bytes(self._seed_sequence.generate_state(4).tobytes(), 'little'))
+
+    def create_generator(self) -> np.random.Generator:
+        return np.random.default_rng(self._seed_sequence)
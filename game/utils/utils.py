@@ -1,5 +1,6 @@
 from pathlib import Path
 from datetime import datetime
+import os
 
 
 class Utils:
@@ -16,3 +17,19 @@ class Utils:
     @staticmethod
     def get_now_as_str() -> str:
         return datetime.now().strftime('%Y_%m_%d_%H_%M_%S')
+
+    @staticmethod
+    def write_atomically(path, text: str) -> None:
+        """
+        Writes the text to a temporary file next to the path and replaces the path with it, so the path always holds
+        either the previous or the new content.
+        """
+        path = Path(path)
+        temporary_path = path.with_name(path.name + '.tmp')
+
+        with open(temporary_path, 'w') as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, path)
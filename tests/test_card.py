@@ -0,0 +1,49 @@
+from game import Card, Deck
+from copy import deepcopy
+import unittest
+from unittest import TestCase
+
+
+class TestCard(TestCase):
+    def test_interned_cards(self) -> None:
+        cards = Deck().get_cards()
+
+        self.assertIs(cards[0], Card('2', 'Heart', 1))
+        self.assertIs(cards[-1], Card('Ace', 'Club', 13))
+        self.assertIs(cards[10], deepcopy(cards[10]))
+
+    def test_id_and_mask(self) -> None:
+        for i, card in enumerate(Deck().get_cards()):
+            self.assertEqual(i, card.id)
+            self.assertEqual(1 << i, card.mask)
+            self.assertIs(card, Card.from_id(i))
+
+    def test_masks(self) -> None:
+        hand = [Card('Queen', 'Spade', 11), Card('3', 'Diamond', 2)]
+        board = [Card('3', 'Heart', 2), Card('Queen', 'Spade', 11)]
+
+        mask = Card.to_mask(hand) | Card.to_mask(board)
+
+        self.assertEqual([Card('3', 'Heart', 2), Card('3', 'Diamond', 2), Card('Queen', 'Spade', 11)],
+                         Card.from_mask(mask))
+        self.assertTrue(Card('3', 'Heart', 2).mask & mask)
+        self.assertFalse(Card('3', 'Club', 2).mask & mask)
+
+    def test_immutable(self) -> None:
+        card = Card('7', 'Club', 6)
+
+        with self.assertRaises(AttributeError):
+            card.value = 13
+
+    def test_api(self) -> None:
+        card = Card('Jack', 'Diamond', 10)
+
+        self.assertEqual('Jack', card.rank)
+        self.assertEqual('Diamond', card.suit)
+        self.assertEqual(10, card.value)
+        self.assertEqual('Jack(Diamond)', str(card))
+        self.assertRaises(ValueError, Card, 'Jack', 'Star', 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
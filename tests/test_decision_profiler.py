@@ -0,0 +1,73 @@
+from game import DecisionProfiler, LatencyHistogram, Phases, RandomBot, SemiRandomBot, Table
+from game.table.decision_profiler import TABLE
+import unittest
+
+
+class CountingBot(RandomBot):
+    decisions = 0
+
+    def make_move(self, possible_moves, game_state):
+        CountingBot.decisions += 1
+        return super().make_move(possible_moves, game_state)
+
+
+class TestDecisionProfiler(unittest.TestCase):
+    def test_histogram_percentiles(self) -> None:
+        histogram = LatencyHistogram()
+
+        for value in range(1, 100_001):
+            histogram.record(value)
+
+        self.assertEqual(100_000, histogram.count)
+        self.assertEqual(100_000, histogram.max)
+        self.assertAlmostEqual(50_000.5, histogram.mean)
+
+        for percentile in (50, 95, 99):
+            self.assertAlmostEqual(percentile * 1000, histogram.percentile(percentile), delta=percentile * 1000 / 100)
+
+        self.assertEqual(100_000, histogram.percentile(100))
+        self.assertEqual(1, histogram.percentile(0))
+
+    def test_histogram_exact_small_values_and_merge(self) -> None:
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in (3, 7, 200):
+            first.record(value)
+        second.record(10 ** 9)
+        first.merge(second)
+
+        self.assertEqual(4, first.count)
+        self.assertEqual(7, first.percentile(50))
+        self.assertEqual(200, first.percentile(75))
+        self.assertEqual(10 ** 9, first.percentile(99))
+        self.assertEqual(0, LatencyHistogram().percentile(50))
+
+    def test_profiled_tournament(self) -> None:
+        CountingBot.decisions = 0
+        profiler = DecisionProfiler(print_summary=False)
+        table = Table([CountingBot, SemiRandomBot, CountingBot], seed=4)
+        table.attach_profiler(profiler)
+        table.run_tournament()
+
+        decisions = sum(histogram.count for (name, _), histogram in profiler.histograms.items()
+                        if name == CountingBot.__name__)
+
+        self.assertEqual(CountingBot.decisions, decisions)
+        self.assertEqual(table.hands_played, profiler.get(TABLE, Phases.PRE_FLOP).count)
+        self.assertEqual(profiler.get(TABLE, Phases.PRE_FLOP).count, profiler.get(TABLE, Phases.POT_COLLECTION).count)
+        self.assertIn('SemiRandomBot', profiler.summarize())
+
+    def test_same_tournament_with_profiler(self) -> None:
+        rankings = []
+
+        for profiler in (None, DecisionProfiler(print_summary=False)):
+            table = Table([RandomBot, SemiRandomBot, RandomBot], seed=9)
+            if profiler is not None:
+                table.attach_profiler(profiler)
+            table.run_tournament()
+            rankings.append(table.get_ranking())
+
+        self.assertEqual(rankings[0], rankings[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+from game import Moves, RandomBot, SemiRandomBot, Table
+from threading import enumerate as enumerate_threads
+from time import perf_counter, sleep
+import unittest
+
+
+class SleepyBot(SemiRandomBot):
+    SLEEP = 0.2
+
+    def make_move(self, possible_moves, game_state):
+        sleep(self.SLEEP)
+        return Moves.RAISE if Moves.RAISE in possible_moves else possible_moves[0]
+
+
+class StalledBot(SemiRandomBot):
+    SLEEP = 0.03
+    calls = 0
+    overlaps = 0
+    is_running = False
+
+    def make_move(self, possible_moves, game_state):
+        StalledBot.overlaps += StalledBot.is_running
+        StalledBot.calls += 1
+        StalledBot.is_running = True
+        sleep(self.SLEEP)
+        StalledBot.is_running = False
+        return possible_moves[0]
+
+    def receive_chips(self, amount: int) -> None:
+        StalledBot.overlaps += StalledBot.is_running
+        super().receive_chips(amount)
+
+
+class ShortTable(Table):
+    INIT_CHIPS = 10
+
+
+class BudgetReportingBot(RandomBot):
+    budgets = []
+
+    def make_move(self, possible_moves, game_state):
+        self.budgets.append(game_state.decision_time_budget)
+        return super().make_move(possible_moves, game_state)
+
+
+class TestDecisionTimeBudget(unittest.TestCase):
+    def test_overrun_applies_fallback(self) -> None:
+        table = Table([SleepyBot, SemiRandomBot, SemiRandomBot], seed=1)
+        table.decision_time_budget = 0.01
+        start = perf_counter()
+        table._init_pre_flop_phase()
+
+        self.assertLess(perf_counter() - start, SleepyBot.SLEEP)
+        self.assertEqual({'Player_1 (SleepyBot)': 1}, table.timeouts)
+        self.assertIs(Moves.FOLD, table._players.current_move)
+        table.close()
+
+    def test_stalled_player_skips_decisions(self) -> None:
+        StalledBot.calls = StalledBot.overlaps = 0
+        table = ShortTable([StalledBot, SemiRandomBot], seed=3)
+        table.decision_time_budget = 0.01
+        table.run_tournament()
+
+        self.assertEqual(0, StalledBot.overlaps)
+        self.assertGreater(sum(table.timeouts.values()), StalledBot.calls)
+        self.assertEqual({}, table._decision_executors)
+
+        for thread in enumerate_threads():
+            if thread.name.startswith('DecisionExecutor'):
+                thread.join(1)
+                self.assertFalse(thread.is_alive())
+
+    def test_fallback_prefers_check(self) -> None:
+        table = Table([RandomBot, RandomBot])
+
+        self.assertIs(Moves.CHECK, table._find_timeout_move((Moves.CHECK, Moves.RAISE, Moves.FOLD)))
+        self.assertIs(Moves.FOLD, table._find_timeout_move((Moves.CALL, Moves.FOLD)))
+
+    def test_same_tournament_within_budget(self) -> None:
+        BudgetReportingBot.budgets = []
+        rankings = []
+
+        for budget in (None, 5.0):
+            table = Table([BudgetReportingBot, SemiRandomBot, RandomBot], seed=6)
+            table.decision_time_budget = budget
+            table.run_tournament()
+            rankings.append(table.get_ranking())
+
+            self.assertEqual({}, table.timeouts)
+
+        self.assertEqual(rankings[0], rankings[1])
+        self.assertEqual({None, 5.0}, set(BudgetReportingBot.budgets))
+
+
+if __name__ == '__main__':
+    unittest.main()
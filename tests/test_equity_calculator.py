@@ -0,0 +1,94 @@
+from game import Card, Deck, EquityCalculator, StrongestFinalHandFinder
+from itertools import combinations
+import unittest
+from unittest import TestCase
+
+
+class TestEquityCalculator(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._hand = [Card('Ace', 'Heart', 13), Card('King', 'Heart', 12)]
+        self._flop = [Card('2', 'Heart', 1), Card('7', 'Heart', 6), Card('Jack', 'Club', 10)]
+        self._turn = self._flop + [Card('9', 'Spade', 8)]
+        self._river = self._turn + [Card('Queen', 'Diamond', 11)]
+
+    def test_enumeration_on_river(self) -> None:
+        deck = [card for card in Deck().get_cards() if card not in self._hand + self._river]
+        hero_strength = StrongestFinalHandFinder.find(self._hand + self._river).strength
+        wins = ties = 0
+
+        for opponent_hand in combinations(deck, 2):
+            opponent_strength = StrongestFinalHandFinder.find(list(opponent_hand) + self._river).strength
+            wins += hero_strength > opponent_strength
+            ties += hero_strength == opponent_strength
+
+        equity = EquityCalculator.calculate(self._hand, self._river)
+        total = len(deck) * (len(deck) - 1) // 2
+
+        self.assertTrue(equity.is_exact)
+        self.assertEqual(total, equity.samples)
+        self.assertAlmostEqual(wins / total, equity.win)
+        self.assertAlmostEqual(ties / total, equity.tie)
+        self.assertAlmostEqual((wins + ties / 2) / total, equity.equity)
+        self.assertEqual(0.0, equity.confidence_interval)
+
+    def test_simulation_close_to_enumeration(self) -> None:
+        exact = EquityCalculator.enumerate(self._hand, self._turn)
+        estimated = EquityCalculator.simulate(self._hand, self._turn, samples=5000, seed=3)
+
+        self.assertFalse(estimated.is_exact)
+        self.assertEqual(5000, estimated.samples)
+        self.assertGreater(estimated.confidence_interval, 0)
+        self.assertLess(abs(exact.equity - estimated.equity), 2 * estimated.confidence_interval)
+        self.assertAlmostEqual(1.0, estimated.win + estimated.tie + estimated.loss)
+
+    def test_simulation_is_reproducible(self) -> None:
+        equity_1 = EquityCalculator.simulate(self._hand, self._flop, opponents=2, samples=500, seed=5)
+        equity_2 = EquityCalculator.simulate(self._hand, self._flop, opponents=2, samples=500, seed=5)
+
+        self.assertEqual(equity_1, equity_2)
+
+    def test_simulation_time_limit(self) -> None:
+        equity = EquityCalculator.simulate(self._hand, time_limit=0.01, seed=1)
+
+        self.assertGreaterEqual(equity.samples, EquityCalculator.BUDGET_CHECK_INTERVAL)
+
+    def test_opponent_range(self) -> None:
+        opponent_range = [(Card('Queen', 'Club', 11), Card('Queen', 'Spade', 11)),
+                          (Card('Queen', 'Diamond', 11), Card('2', 'Heart', 1))]
+
+        equity = EquityCalculator.calculate(self._hand, self._turn, opponent_range=opponent_range)
+
+        # The second range hand holds a board card, the hero beats QQ only with an ace, a king or a heart on the river
+        self.assertTrue(equity.is_exact)
+        self.assertEqual(44, equity.samples)
+        self.assertAlmostEqual(15 / 44, equity.win)
+        self.assertAlmostEqual(29 / 44, equity.loss)
+
+    def test_multiple_opponents_split_pot(self) -> None:
+        board = [Card('10', 'Club', 9), Card('Jack', 'Diamond', 10), Card('Queen', 'Spade', 11),
+                 Card('King', 'Club', 12), Card('Ace', 'Diamond', 13)]
+        opponent_range = [(Card('2', 'Club', 1), Card('3', 'Club', 2)), (Card('4', 'Spade', 3), Card('5', 'Spade', 4))]
+
+        equity = EquityCalculator.enumerate([Card('2', 'Heart', 1), Card('3', 'Heart', 2)], board, 2, opponent_range)
+
+        self.assertEqual(1, equity.samples)
+        self.assertEqual(1.0, equity.tie)
+        self.assertAlmostEqual(1 / 3, equity.equity)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            EquityCalculator.calculate(self._hand[:1])
+
+        with self.assertRaises(ValueError):
+            EquityCalculator.calculate(self._hand, [self._hand[0]])
+
+        with self.assertRaises(ValueError):
+            EquityCalculator.calculate(self._hand, opponents=0)
+
+        with self.assertRaises(ValueError):
+            EquityCalculator.calculate(self._hand, opponent_range=[self._hand])
+
+
+if __name__ == '__main__':
+    unittest.main()
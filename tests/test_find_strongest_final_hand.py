@@ -323,3 +323,17 @@ class TestFindStrongestFinalHand(TestGame):
 
         self.assertEqual(FinalHandType.STRAIGHT_FLUSH, self.player_3.final_hand_type)
         self.assertEqual(236500000, self.player_3.score)
+
+    def test_win_without_showdown_not_evaluated(self) -> None:
+        self.prepare_game([Card('2', 'Heart', 1), Card('3', 'Diamond', 2), Card('4', 'Spade', 3)],
+                          [Card('Ace', 'Club', 13), Card('King', 'Club', 12)],
+                          [Card('9', 'Diamond', 8), Card('8', 'Heart', 7)],
+                          [Card('9', 'Club', 8), Card('8', 'Club', 7)])
+        self.player_2.current_move = self.moves.FOLD
+        self.player_3.current_move = self.moves.FOLD
+
+        self.table._find_players_final_hand()
+
+        self.assertEqual(1, self.player_1.strength)
+        self.assertIsNone(self.player_1.final_hand_type)
+        self.assertEqual(0, self.player_2.strength)
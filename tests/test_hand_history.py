@@ -0,0 +1,109 @@
+from game import RandomBot, SemiRandomBot, Table
+from game.table.observer import BaseObserver, FileTextualObserver, HandHistoryObserver, HandHistoryReader, \
+    State as ObserverState
+from game.table.observer.hand_history import HandHistoryFormat
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+
+class ShortTable(Table):
+    INIT_CHIPS = 20
+
+
+class MoveRecordingObserver(BaseObserver):
+    def __init__(self) -> None:
+        self.hands = []
+        self._actions = []
+
+    def update(self, state: ObserverState) -> None:
+        if state.individual_pot_collection is not None:
+            collections = tuple(state.individual_pot_collection[player] for player in state.players)
+            self.hands.append((tuple(self._actions), collections))
+            self._actions = []
+
+    def update_move(self, player, move, amount: int) -> None:
+        self._actions.append((player.index, move, amount))
+
+
+class TestHandHistory(unittest.TestCase):
+    PLAYERS = [RandomBot, SemiRandomBot, RandomBot, SemiRandomBot]
+
+    def test_records_read_back(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'hands.hh'
+            table = ShortTable(self.PLAYERS, seed=4)
+            recorder = MoveRecordingObserver()
+            table.attach_observer(recorder)
+
+            with HandHistoryObserver(str(path), seed=4) as observer:
+                observer.BLOCK_HANDS = 7
+                table.attach_observer(observer)
+                table.run_tournament()
+
+            reader = HandHistoryReader(path)
+            records = list(reader)
+
+            self.assertEqual(4, reader.seed)
+            self.assertEqual(table.hands_played, len(records))
+            self.assertEqual(list(range(len(records))), [record.hand for record in records])
+
+            for record, (actions, collections) in zip(records, recorder.hands):
+                self.assertEqual(actions, tuple((action.seat, action.move, action.amount) for action in record.actions))
+                self.assertEqual(collections, record.collections)
+                self.assertEqual(len(record.seats), len(record.hole_cards))
+                self.assertIn(len(record.community_cards), (0, 3, 4, 5))
+                self.assertGreater(sum(record.blinds), 0)
+
+                cards = [card for hand in record.hole_cards for card in hand] + list(record.community_cards)
+                self.assertEqual(2 * len(record.seats) + len(record.community_cards), len(set(cards)))
+
+                for seat, stack, blind in zip(record.seats, record.stacks, record.blinds):
+                    spent = blind + sum(action.amount for action in record.actions if action.seat == seat)
+                    self.assertLessEqual(spent, stack)
+
+    def test_appends_and_skips_truncated_block(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'hands.hh'
+
+            for _ in range(2):
+                table = ShortTable(self.PLAYERS, seed=5)
+
+                with HandHistoryObserver(str(path)) as observer:
+                    table.attach_observer(observer)
+                    table.run_tournament()
+
+            records = list(HandHistoryReader(path))
+            self.assertIsNone(HandHistoryReader(path).seed)
+            self.assertEqual(2 * table.hands_played, len(records))
+            self.assertEqual(records[:table.hands_played], records[table.hands_played:])
+
+            with open(str(path), 'ab') as file:
+                file.write(HandHistoryFormat.BLOCK_HEADER.pack(3, 100) + b'\x00' * 10)
+
+            self.assertEqual(records, list(HandHistoryReader(path)))
+
+    def test_smaller_than_textual_log(self) -> None:
+        with TemporaryDirectory() as directory:
+            binary_path = Path(directory) / 'hands.hh'
+            text_path = Path(directory) / 'hands.log'
+            table = ShortTable(self.PLAYERS, seed=6)
+            table.attach_observer(FileTextualObserver(str(text_path)))
+
+            with HandHistoryObserver(str(binary_path)) as observer:
+                table.attach_observer(observer)
+                table.run_tournament()
+
+            self.assertLess(binary_path.stat().st_size * 10, text_path.stat().st_size)
+
+    def test_rejects_other_files(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'hands.hh'
+            path.write_bytes(b'not a hand history')
+
+            with self.assertRaises(ValueError):
+                HandHistoryReader(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+from game import Card, Deck, HandPotentialCalculator, Moves, OpponentBot, Phases, State, StrongestFinalHandFinder
+from itertools import combinations
+import unittest
+from unittest import TestCase
+
+
+class TestHandPotentialCalculator(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._hand = [Card('Ace', 'Heart', 13), Card('5', 'Heart', 4)]
+        self._turn = [Card('2', 'Heart', 1), Card('King', 'Heart', 12), Card('Jack', 'Club', 10),
+                      Card('Jack', 'Spade', 10)]
+
+    def test_same_as_enumeration_on_turn(self) -> None:
+        deck = [card for card in Deck().get_cards() if card not in self._hand + self._turn]
+        hero_strength = StrongestFinalHandFinder.find(self._hand + self._turn).strength
+        potential = [[0, 0, 0] for _ in range(3)]
+        current_states = [0, 0, 0]
+
+        for opponent_hand in combinations(deck, 2):
+            opponent_strength = StrongestFinalHandFinder.find(list(opponent_hand) + self._turn).strength
+            current = self._compare(hero_strength, opponent_strength)
+            current_states[current] += 1
+
+            for river in deck:
+                if river not in opponent_hand:
+                    hero_final = StrongestFinalHandFinder.find(self._hand + self._turn + [river]).strength
+                    opponent_final = StrongestFinalHandFinder.find(list(opponent_hand) + self._turn + [river]).strength
+                    potential[current][self._compare(hero_final, opponent_final)] += 1
+
+        totals = [sum(row) for row in potential]
+        hand_potential = HandPotentialCalculator.calculate(self._hand, self._turn)
+
+        self.assertAlmostEqual((current_states[0] + current_states[1] / 2) / sum(current_states),
+                               hand_potential.hand_strength)
+        self.assertAlmostEqual((potential[2][0] + potential[2][1] / 2 + potential[1][0] / 2) / (totals[2] + totals[1]),
+                               hand_potential.positive_potential)
+        self.assertAlmostEqual((potential[0][2] + potential[1][2] / 2 + potential[0][1] / 2) / (totals[0] + totals[1]),
+                               hand_potential.negative_potential)
+
+    def test_no_potential_on_river(self) -> None:
+        hand_potential = HandPotentialCalculator.calculate(self._hand, self._turn + [Card('3', 'Club', 2)])
+
+        self.assertEqual(0.0, hand_potential.positive_potential)
+        self.assertEqual(0.0, hand_potential.negative_potential)
+        self.assertEqual(hand_potential.hand_strength, hand_potential.effective_hand_strength)
+
+    def test_flop(self) -> None:
+        hand_potential = HandPotentialCalculator.calculate(self._hand, self._turn[:3])
+
+        for probability in hand_potential:
+            self.assertGreaterEqual(probability, 0.0)
+            self.assertLessEqual(probability, 1.0)
+
+        self.assertGreater(hand_potential.positive_potential, 0.0)
+
+    def test_invalid_board(self) -> None:
+        with self.assertRaises(ValueError):
+            HandPotentialCalculator.calculate(self._hand, self._turn[:2])
+
+        with self.assertRaises(ValueError):
+            HandPotentialCalculator.calculate(self._hand, self._turn[:2] + self._hand[:1])
+
+    def test_opponent_bot_with_ehs(self) -> None:
+        bot = OpponentBot(100, use_ehs=True, fold_thresh=1, bluff_thresh=100)
+        bot.receive_cards(self._hand)
+        state = State(community_cards=tuple(self._turn[:3]), total_players=2, total_chips=200, pot=10,
+                      nbr_of_active_players=2, current_phase=Phases.FLOP, is_raising_capped=False,
+                      allowed_moves=(Moves.CALL, Moves.FOLD), current_bet=2)
+
+        self.assertGreater(bot.calculate_ehs(state), 0.0)
+        self.assertIs(Moves.CALL, bot.make_move([Moves.CALL, Moves.FOLD], state))
+
+    @staticmethod
+    def _compare(hero_strength: int, opponent_strength: int) -> int:
+        if hero_strength > opponent_strength:
+            return 0
+        if hero_strength < opponent_strength:
+            return 2
+        return 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+from game import Card, Deck, IncrementalHandEvaluator, StrongestFinalHandFinder
+from random import Random
+import unittest
+from unittest import TestCase
+
+
+class TestIncrementalHandEvaluator(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._random = Random(11)
+        self._cards = Deck().get_cards()
+
+    def test_same_final_hand_as_finder_on_every_card(self) -> None:
+        for _ in range(2000):
+            cards = self._random.sample(self._cards, 7)
+            evaluator = IncrementalHandEvaluator(cards[:2])
+
+            for amount in range(2, 8):
+                if amount > 2:
+                    evaluator.add_card(cards[amount - 1])
+
+                expected = StrongestFinalHandFinder.find(cards[:amount])
+
+                self.assertEqual(expected.strength, evaluator.strength)
+                self.assertEqual(expected.type, evaluator.type)
+                self.assertEqual(expected.score, evaluator.score)
+                self.assertEqual(expected, evaluator.find())
+
+    def test_copy_is_independent(self) -> None:
+        community_cards = [Card('2', 'Heart', 1), Card('7', 'Club', 6), Card('Jack', 'Heart', 10)]
+        community_evaluator = IncrementalHandEvaluator(community_cards)
+        hand_1 = [Card('2', 'Spade', 1), Card('Ace', 'Club', 13)]
+        hand_2 = [Card('Ace', 'Heart', 13), Card('King', 'Heart', 12)]
+
+        evaluator_1 = community_evaluator.copy()
+        evaluator_1.add_cards(hand_1)
+        evaluator_2 = community_evaluator.copy()
+        evaluator_2.add_cards(hand_2)
+
+        self.assertEqual(3, len(community_evaluator))
+        self.assertEqual(Card.to_mask(community_cards), community_evaluator.mask)
+        self.assertEqual(StrongestFinalHandFinder.find(community_cards).strength, community_evaluator.strength)
+        self.assertEqual(StrongestFinalHandFinder.find(community_cards + hand_1).strength, evaluator_1.strength)
+        self.assertEqual(StrongestFinalHandFinder.find(community_cards + hand_2).strength, evaluator_2.strength)
+
+    def test_reset(self) -> None:
+        evaluator = IncrementalHandEvaluator(self._cards[:5])
+
+        evaluator.reset()
+        evaluator.add_cards(self._cards[-2:])
+
+        self.assertEqual(self._cards[-2:], evaluator.cards)
+        self.assertEqual(StrongestFinalHandFinder.find(self._cards[-2:]).strength, evaluator.strength)
+
+    def test_no_cards(self) -> None:
+        with self.assertRaises(ValueError):
+            IncrementalHandEvaluator().find()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+from game import Card, Deck, FinalHandType, IncrementalHandEvaluator, StrongestFinalHandFinder
+from game.final_hand import LookupTableEvaluator
+import numpy as np
+from random import Random
+import unittest
+from unittest import TestCase
+
+
+class TestLookupTableEvaluator(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._random = Random(7)
+        self._cards = Deck().get_cards()
+
+    def test_same_final_hand_as_search(self) -> None:
+        for amount in range(2, 8):
+            for _ in range(2000):
+                cards = self._random.sample(self._cards, amount)
+
+                expected = StrongestFinalHandFinder._search(cards)
+                actual = LookupTableEvaluator.find(cards)
+
+                self.assertEqual(expected.type, actual.type)
+                self.assertEqual(expected.score, actual.score)
+                self.assertEqual(expected.hand, actual.hand)
+                self.assertEqual(expected.strength, actual.strength)
+
+    def test_strength_order_same_as_card_comparison(self) -> None:
+        for _ in range(5000):
+            cards_1 = self._random.sample(self._cards, 7)
+            cards_2 = self._random.sample(self._cards, 7)
+
+            final_hand_1 = StrongestFinalHandFinder._search(cards_1)
+            final_hand_2 = StrongestFinalHandFinder._search(cards_2)
+            comparable_1 = [final_hand_1.score] + sorted([card.value for card in final_hand_1.hand], reverse=True)
+            comparable_2 = [final_hand_2.score] + sorted([card.value for card in final_hand_2.hand], reverse=True)
+
+            strength_1 = LookupTableEvaluator.evaluate(cards_1)
+            strength_2 = LookupTableEvaluator.evaluate(cards_2)
+
+            self.assertEqual(final_hand_1.strength, strength_1)
+            self.assertEqual(comparable_1 == comparable_2, strength_1 == strength_2)
+            self.assertEqual(comparable_1 > comparable_2, strength_1 > strength_2)
+
+    def test_rank_only_same_as_find(self) -> None:
+        for amount in range(1, 8):
+            for _ in range(1000):
+                cards = self._random.sample(self._cards, amount)
+                final_hand = LookupTableEvaluator.find(cards)
+                board = IncrementalHandEvaluator(cards[2:])
+
+                self.assertEqual(final_hand.strength, LookupTableEvaluator.evaluate(cards))
+                self.assertEqual(final_hand.type, LookupTableEvaluator.evaluate_type(cards))
+                self.assertEqual(final_hand.strength, board.evaluate_with(cards[:2]))
+                self.assertEqual(cards[2:], board.cards)
+
+    def test_tables_complete_after_build(self) -> None:
+        LookupTableEvaluator.build()
+        rank_table = LookupTableEvaluator._rank_table
+        entries = len(rank_table)
+
+        for _ in range(2000):
+            LookupTableEvaluator.find(self._random.sample(self._cards, self._random.randint(1, 7)))
+
+        self.assertIs(rank_table, LookupTableEvaluator._rank_table)
+        self.assertEqual(entries, len(rank_table))
+
+    def test_batch_same_as_find(self) -> None:
+        for amount in (5, 6, 7):
+            hands = [self._random.sample(self._cards, amount) for _ in range(2000)]
+            card_ids = np.array([[card.id for card in hand] for hand in hands])
+
+            strengths, types = StrongestFinalHandFinder.find_batch(card_ids, with_types=True)
+
+            for i, hand in enumerate(hands):
+                self.assertEqual(LookupTableEvaluator.evaluate(hand), strengths[i])
+                self.assertEqual(StrongestFinalHandFinder.find(hand).type.value, types[i])
+
+    def test_straight_flush_wheel(self) -> None:
+        cards = [Card('Ace', 'Club', 13), Card('2', 'Club', 1), Card('3', 'Club', 2), Card('4', 'Club', 3),
+                 Card('5', 'Club', 4), Card('King', 'Heart', 12), Card('Ace', 'Heart', 13)]
+
+        final_hand = LookupTableEvaluator.find(cards)
+
+        self.assertEqual(FinalHandType.STRAIGHT_FLUSH, final_hand.type)
+        self.assertEqual(StrongestFinalHandFinder._search(cards), final_hand)
+
+    def test_straight_with_paired_top_card(self) -> None:
+        cards = [Card('9', 'Club', 8), Card('9', 'Heart', 8), Card('8', 'Spade', 7), Card('7', 'Club', 6),
+                 Card('6', 'Diamond', 5), Card('5', 'Club', 4), Card('2', 'Heart', 1)]
+
+        expected = StrongestFinalHandFinder._search(cards)
+        actual = LookupTableEvaluator.find(cards)
+
+        self.assertEqual(expected.type, actual.type)
+        self.assertEqual(expected.hand, actual.hand)
+        self.assertEqual(expected.hand[0].suit, actual.hand[0].suit)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+from game import ParallelTournamentRunner, RandomBot, SemiRandomBot, Table
+import numpy as np
+from pathlib import Path
+import random
+from tempfile import TemporaryDirectory
+import unittest
+
+
+class ShortTable(Table):
+    INIT_CHIPS = 10
+
+
+def _set_init_chips(chips: int) -> None:
+    ShortTable.INIT_CHIPS = chips
+
+
+class DeckRecordingTable(ShortTable):
+    first_decks = []
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self._is_first_deal = True
+
+    def _deal_cards(self) -> None:
+        if self._is_first_deal:
+            self.first_decks.append(tuple(self._deck.get_cards()))
+            self._is_first_deal = False
+
+        super()._deal_cards()
+
+
+class TestParallelTournamentRunner(unittest.TestCase):
+    PLAYERS = [RandomBot, SemiRandomBot, RandomBot]
+
+    def _run(self, workers: int, seed: int = 1) -> list:
+        runner = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=workers, seed=seed,
+                                          chunk_size=3)
+        return list(runner.run(7))
+
+    def test_results_independent_of_workers(self) -> None:
+        results = self._run(1)
+
+        self.assertEqual(list(range(7)), [result.tournament for result in results])
+        self.assertEqual(results, self._run(2))
+        self.assertNotEqual(results, self._run(1, seed=2))
+
+    def test_keeps_global_generators_of_caller(self) -> None:
+        random.seed(8)
+        np.random.seed(8)
+        expected = [random.random() for _ in range(3)], list(np.random.random(3))
+
+        for workers in (1, 2):
+            random.seed(8)
+            np.random.seed(8)
+            list(ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=workers, chunk_size=2).run(3))
+
+            self.assertEqual(expected, ([random.random() for _ in range(3)], list(np.random.random(3))))
+
+    def test_initializer_runs_in_worker(self) -> None:
+        runner = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=1, chunk_size=4,
+                                          initializer=_set_init_chips, initargs=(12,))
+
+        self.assertEqual(2, len(list(runner.run(2))))
+        self.assertEqual(10, ShortTable.INIT_CHIPS)
+
+    def test_run_nothing(self) -> None:
+        for workers, initializer in ((2, None), (1, _set_init_chips)):
+            runner = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=workers,
+                                              initializer=initializer, initargs=(10,) if initializer else ())
+
+            self.assertEqual([], list(runner.run(0)))
+            self.assertEqual(0, runner.tournaments)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'checkpoint.json'
+            runner = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=2, chunk_size=2,
+                                              checkpoint_path=path, initializer=_set_init_chips, initargs=(10,))
+            list(runner.run(3))
+            resumed = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=2, chunk_size=2,
+                                               checkpoint_path=path, initializer=_set_init_chips, initargs=(10,))
+
+            self.assertEqual([], list(resumed.run(3 - resumed.deals)))
+            self.assertEqual(runner.wins, resumed.wins)
+
+    def test_aggregated_stats(self) -> None:
+        runner = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=1, chunk_size=4)
+        results = list(runner.run(5)) + list(runner.run(5))
+
+        self.assertEqual(10, runner.tournaments)
+        self.assertEqual(9, results[-1].tournament)
+        self.assertEqual(10, sum(runner.wins.values()))
+        self.assertEqual(sorted(results[0].ranking), list(runner.wins))
+        self.assertAlmostEqual(6, sum(runner.average_ranks.values()))
+
+        for result in results:
+            self.assertEqual(result.winner, result.ranking[0])
+            self.assertEqual(3, len(set(result.ranking)))
+
+    def test_duplicate_rotates_players_over_same_deals(self) -> None:
+        DeckRecordingTable.first_decks = []
+        runner = ParallelTournamentRunner(self.PLAYERS, table_class=DeckRecordingTable, workers=1, duplicate=True)
+        results = list(runner.run(2))
+
+        self.assertEqual(6, runner.tournaments)
+        self.assertEqual([0, 1, 2, 0, 1, 2], [result.rotation for result in results])
+        self.assertEqual(list(range(6)), [result.tournament for result in results])
+        self.assertEqual(6, sum(runner.wins.values()))
+        self.assertAlmostEqual(1, sum(runner.win_rates.values()))
+
+        for result in results:
+            self.assertEqual(sorted(runner.wins), sorted(result.ranking))
+
+        decks = DeckRecordingTable.first_decks
+        self.assertEqual([decks[0]] * 3 + [decks[3]] * 3, decks)
+        self.assertNotEqual(decks[0], decks[3])
+
+    def test_duplicate_results_independent_of_workers(self) -> None:
+        runs = [list(ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=workers, seed=3,
+                                              chunk_size=1, duplicate=True).run(3)) for workers in (1, 3)]
+
+        self.assertEqual(runs[0], runs[1])
+
+    def test_resume_from_checkpoint(self) -> None:
+        uninterrupted = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=1, chunk_size=3)
+        results = list(uninterrupted.run(12))
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'checkpoint.json'
+            runner = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=1, chunk_size=3,
+                                              checkpoint_path=path, checkpoint_interval=5)
+
+            for result in runner.run(12):
+                if result.tournament == 7:
+                    break
+
+            resumed = ParallelTournamentRunner(self.PLAYERS, table_class=ShortTable, workers=2, chunk_size=3,
+                                               checkpoint_path=path, checkpoint_interval=5)
+
+            self.assertEqual(6, resumed.tournaments)
+            self.assertEqual(results[6:], list(resumed.run(12 - resumed.deals)))
+            self.assertEqual(uninterrupted.wins, resumed.wins)
+            self.assertEqual(uninterrupted.average_ranks, resumed.average_ranks)
+            self.assertEqual(12, ParallelTournamentRunner(self.PLAYERS, workers=1, chunk_size=3,
+                                                          checkpoint_path=path).tournaments)
+
+            with self.assertRaises(ValueError):
+                ParallelTournamentRunner(self.PLAYERS, workers=1, seed=5, chunk_size=3, checkpoint_path=path)
+
+
+if __name__ == '__main__':
+    unittest.main()
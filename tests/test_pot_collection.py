@@ -244,23 +244,23 @@ class TestPotCollection(TestGame):
             Card('10', 'Diamond', 9)
         ]
 
-        player_1._basic_player._hand = [Card('2', 'Spade', 1), Card('Queen', 'Spade', 11)]
-        player_2._basic_player._hand = [Card('King', 'Spade', 12), Card('King', 'Diamond', 12)]
-        player_3._basic_player._hand = [Card('8', 'Spade', 7), Card('6', 'Spade', 5)]
+        player_1.basic_player._hand = [Card('2', 'Spade', 1), Card('Queen', 'Spade', 11)]
+        player_2.basic_player._hand = [Card('King', 'Spade', 12), Card('King', 'Diamond', 12)]
+        player_3.basic_player._hand = [Card('8', 'Spade', 7), Card('6', 'Spade', 5)]
 
         table._pot = 28
 
         player_1.total_bet = 10
         player_1.current_move = Moves.CHECK
-        player_1._basic_player._chips = 71
+        player_1.basic_player._chips = 71
 
         player_2.total_bet = 8
         player_2.current_move = Moves.ALL_IN
-        player_2._basic_player._chips = 0
+        player_2.basic_player._chips = 0
 
         player_3.total_bet = 10
         player_3.current_move = Moves.CHECK
-        player_3._basic_player._chips = 51
+        player_3.basic_player._chips = 51
 
         table._init_showdown_phase()
         table._init_pot_collection_phase()
@@ -304,19 +304,19 @@ class TestPotCollection(TestGame):
 
         player_1.total_bet = 4
         player_1.current_move = Moves.FOLD
-        player_1._basic_player._chips = 38
+        player_1.basic_player._chips = 38
 
         player_2.total_bet = 6
         player_2.current_move = Moves.RAISE
-        player_2._basic_player._chips = 164
+        player_2.basic_player._chips = 164
 
         player_3.total_bet = 2
         player_3.current_move = Moves.FOLD
-        player_3._basic_player._chips = 34
+        player_3.basic_player._chips = 34
 
         player_4.total_bet = 2
         player_4.current_move = Moves.ALL_IN
-        player_4._basic_player._chips = 0
+        player_4.basic_player._chips = 0
 
         table._init_showdown_phase()
         table._init_pot_collection_phase()
@@ -0,0 +1,65 @@
+from game import Deck, OpponentBot, RandomBot, RandomStreams, SemiRandomBot, Table
+from game.table.observer import BaseObserver, State as ObserverState
+from random import Random
+import random
+import unittest
+
+
+class SilentObserver(BaseObserver):
+    def update(self, state: ObserverState) -> None:
+        pass
+
+
+class TestRandomStreams(unittest.TestCase):
+    @staticmethod
+    def _play(table: Table, tournaments: int = 2) -> list:
+        results = []
+
+        for _ in range(tournaments):
+            table.reset_tournament()
+            table.run_tournament()
+            results.append(table.get_ranking())
+
+        return results
+
+    def test_children_are_reproducible_and_independent(self) -> None:
+        streams = RandomStreams(7)
+
+        self.assertEqual(streams.child(1).create_seed(), RandomStreams(7).child(1).create_seed())
+        self.assertEqual(streams.child(1).child(2).create_seed(), RandomStreams(7, (1, 2)).create_seed())
+        self.assertNotEqual(streams.child(1).create_seed(), streams.child(2).create_seed())
+        self.assertNotEqual(streams.child(1).create_seed(), RandomStreams(8).child(1).create_seed())
+        self.assertEqual(streams.create_random().random(), RandomStreams(7).create_random().random())
+
+    def test_deck_shuffles_with_its_generator(self) -> None:
+        first, second = Deck(Random(3)), Deck(Random(3))
+        first.shuffle()
+        random.seed(1)
+        second.shuffle()
+
+        self.assertEqual(first.get_cards(), second.get_cards())
+
+    def test_seeded_table_ignores_global_generator(self) -> None:
+        players = [RandomBot, SemiRandomBot, OpponentBot]
+
+        random.seed(1)
+        results = self._play(Table(players, seed=5))
+        random.seed(2)
+
+        self.assertEqual(results, self._play(Table(players, seed=5)))
+
+        observed_table = Table(players, seed=5)
+        observed_table.attach_observer(SilentObserver())
+        self.assertEqual(results, self._play(observed_table))
+
+    def test_players_get_own_streams(self) -> None:
+        table = Table([RandomBot, RandomBot], seed=5)
+        first, second = [player.basic_player.random for player in table._players]
+
+        self.assertIsNot(first, second)
+        self.assertNotEqual(first.random(), second.random())
+        self.assertIs(random, RandomBot(10).random)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+from . import TestGame
+from game import RandomBot, SemiRandomBot, Table
+import random
+
+
+class TestSeatCounters(TestGame):
+    def test_counters_follow_moves(self) -> None:
+        seat_counters = self.table._seat_counters
+
+        self.assertEqual(3, seat_counters.players)
+        self.assertEqual(3, seat_counters.pending)
+        self.assertEqual(3, seat_counters.active)
+
+        self.table._execute_player_move(self.player_1, self.moves.FOLD)
+        self.table._execute_player_move(self.player_2, self.moves.ALL_IN)
+
+        self.assertEqual(1, seat_counters.folded)
+        self.assertEqual(1, seat_counters.all_in)
+        self.assertEqual(1, seat_counters.pending)
+        self.assertEqual(2, seat_counters.active)
+
+        self.player_1.reset()
+
+        self.assertEqual(0, seat_counters.folded)
+        self.assertEqual(2, seat_counters.pending)
+        self.assertEqual(3, seat_counters.active)
+
+    def test_counters_match_players_during_tournaments(self) -> None:
+        random.seed(3)
+        Table.DEBUG_SEAT_COUNTERS = True
+
+        try:
+            table = Table([RandomBot, SemiRandomBot, RandomBot, SemiRandomBot])
+
+            for _ in range(5):
+                table.run_tournament()
+                table._check_seat_counters()
+                self.assertEqual(1, table._seat_counters.players)
+
+                table.reset_tournament()
+                table._check_seat_counters()
+                self.assertEqual(4, table._seat_counters.players)
+        finally:
+            Table.DEBUG_SEAT_COUNTERS = False
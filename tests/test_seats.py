@@ -0,0 +1,36 @@
+from . import TestGame
+
+
+class TestSeats(TestGame):
+    def test_nested_iteration(self) -> None:
+        pairs = [(outer.name, inner.name) for outer in self.player_1 for inner in self.player_1]
+
+        self.assertEqual(9, len(pairs))
+        self.assertEqual([self.player_1, self.player_2, self.player_3], list(self.player_1))
+        self.assertEqual([self.player_2, self.player_3, self.player_1], list(self.player_2))
+
+    def test_get_by_position(self) -> None:
+        self.assertEqual(self.player_1, self.player_1.get_by_position(0))
+        self.assertEqual(self.player_3, self.player_2.get_by_position(1))
+        self.assertEqual(self.player_1, self.player_2.get_by_position(5))
+
+    def test_remove_and_reseat_players(self) -> None:
+        seats = self.table._seats
+        self.player_2.current_move = self.moves.FOLD
+        self.player_1.remove_player(self.player_2)
+
+        self.assertEqual(2, self.player_1.count())
+        self.assertEqual(self.player_3, self.player_1.next)
+        self.assertIsNone(self.player_1.find(self.player_2))
+        self.assertEqual([self.player_3, self.player_1], list(self.player_3))
+        self.assertEqual(0, self.table._seat_counters.folded)
+
+        with self.assertRaises(ValueError):
+            _ = self.player_2.next
+
+        seats.seat([self.player_2, self.player_3, self.player_1])
+
+        self.assertEqual(3, self.player_1.count())
+        self.assertEqual(self.player_2, self.player_1.next)
+        self.assertEqual(1, self.table._seat_counters.folded)
+        self.table._check_seat_counters()
@@ -0,0 +1,278 @@
+from . import TestGame
+from .dummy_player import create_dummy_classes
+from game import Moves, Table
+from game.table.players import Players as TablePlayers
+from game.table.side_pots import SidePots
+from random import Random
+from typing import Dict, List, Optional
+
+
+class LegacyPotTable(Table):
+    """
+    Table with the pot split used before SidePots, as reference.
+    """
+
+    def _split_pot_among_players(self) -> Dict[TablePlayers, int]:
+        return self._split_legacy_pot(self._sort_players_by_score())
+
+    def _sort_players_by_score(self) -> List[List[TablePlayers]]:
+        sorted_players = list()
+
+        for player in self._players:
+            sorted_players = self._insert_player_in_sorted_list(player, sorted_players)
+
+        return sorted_players
+
+    def _insert_player_in_sorted_list(self, player: TablePlayers, sorted_players: List[List[TablePlayers]]) \
+            -> List[List[TablePlayers]]:
+        has_player_been_inserted = False
+
+        for i in range(len(sorted_players)):
+            if player.strength > self._players.find(sorted_players[i][0]).strength:
+                sorted_players.insert(i, [player])
+                has_player_been_inserted = True
+
+            elif player.strength == self._players.find(sorted_players[i][0]).strength:
+                sorted_players[i].append(player)
+                has_player_been_inserted = True
+
+            if has_player_been_inserted:
+                break
+
+        if not has_player_been_inserted:
+            sorted_players.append([player])
+
+        return sorted_players
+
+    def _split_legacy_pot(self, players_grouped_by_strength: List[List[TablePlayers]]) -> Dict[TablePlayers, int]:
+        players_pot_collections = {player: 0 for player in self._players}
+        is_pot_collection = True
+
+        while is_pot_collection:
+            collecting_players = players_grouped_by_strength.pop(0)
+            sub_pot = self._calculate_sub_pot(collecting_players, players_grouped_by_strength)
+
+            if sub_pot is None:
+                pot = 0
+
+                for player in self._players:
+                    pot += player.total_bet
+
+                pot_division = pot / len(collecting_players)
+
+                for player in collecting_players:
+                    players_pot_collections[player] = int(pot_division)
+
+                is_pot_collection = False
+
+            else:
+                individual_pot_collection = self._split_sub_pot_among_players(collecting_players)
+                is_pot_collection = self._should_pot_collection_continue(collecting_players,
+                                                                         players_grouped_by_strength)
+
+                for player in collecting_players:
+                    players_pot_collections[player] = int(individual_pot_collection[player])
+
+                if is_pot_collection:
+                    self._update_players_total_bet(collecting_players, players_grouped_by_strength)
+
+        return players_pot_collections
+
+    def _calculate_sub_pot(self, collecting_players: List[TablePlayers],
+                           players_grouped_by_strength: List[List[TablePlayers]]) -> Optional[int]:
+        is_any_player_all_in = False
+        sub_pot = 0
+
+        for player in collecting_players:
+            player_bet = player.total_bet
+            sub_pot += player_bet
+
+            if player.current_move is Moves.ALL_IN:
+                is_any_player_all_in = True
+
+        if not is_any_player_all_in:
+            return None
+        else:
+            highest_bet = self._find_highest_player_bet(collecting_players)
+            for player_group in players_grouped_by_strength:
+                sub_pot += self._calculate_sub_pot_portion(player_group, highest_bet)
+
+            return sub_pot
+
+    @staticmethod
+    def _calculate_sub_pot_portion(players: List[TablePlayers], amount: int) -> int:
+        sub_pot_portion = 0
+
+        for player in players:
+            if player.total_bet < amount:
+                sub_pot_portion += player.total_bet
+            else:
+                sub_pot_portion += amount
+
+        return sub_pot_portion
+
+    def _split_sub_pot_among_players(self, collecting_players: List[TablePlayers]) -> Dict[TablePlayers, int]:
+        individual_pot_collection = {p: 0 for p in collecting_players}
+        highest_bet = self._find_highest_player_bet(collecting_players)
+        players_bets_asc = [{
+            'bet': highest_bet,
+            'total_players': 0,
+            'collecting_players': 0
+        }]
+
+        for player in self._players:
+            index = None
+            for i, player_bet in enumerate(players_bets_asc):
+                if player.total_bet < player_bet['bet']:
+                    index = i
+                    break
+
+            if index is not None:
+                players_bets_asc.insert(index, {
+                    'bet': player.total_bet,
+                    'total_players': 0,
+                    'collecting_players': 0
+                })
+
+        for player in self._players:
+            for player_bet in players_bets_asc:
+                if player.total_bet == player_bet['bet']:
+                    player_bet['total_players'] += 1
+                    if player in collecting_players:
+                        player_bet['collecting_players'] += 1
+                    break
+
+                if player.total_bet > player_bet['bet']:
+                    player_bet['total_players'] += 1
+                    if player in collecting_players:
+                        player_bet['collecting_players'] += 1
+
+        for player in collecting_players:
+            sub = 0
+            for player_bet in players_bets_asc:
+                if player.total_bet >= player_bet['bet']:
+                    individual_pot_collection[player] += \
+                        ((player_bet['bet'] - sub) * player_bet['total_players']) / player_bet['collecting_players']
+                sub = player_bet['bet']
+
+        return individual_pot_collection
+
+    @staticmethod
+    def _find_lowest_bet(players: List[TablePlayers]) -> int:
+        comparing_player = players[0]
+        lowest_bet = comparing_player.total_bet
+
+        for i in range(1, len(players)):
+            if players[i].total_bet < lowest_bet:
+                lowest_bet = players[i].total_bet
+
+        return lowest_bet
+
+    def _should_pot_collection_continue(self, collecting_players: List[TablePlayers],
+                                        players_grouped_by_strength: List[List[TablePlayers]]) -> bool:
+        should_collection_continue = False
+        highest_collecting_player_bet = 0
+
+        for player in collecting_players:
+            if player.total_bet > highest_collecting_player_bet:
+                highest_collecting_player_bet = player.total_bet
+
+        for player_group in players_grouped_by_strength:
+            highest_not_collecting_player_bet = self._find_highest_player_bet(player_group)
+
+            if highest_not_collecting_player_bet > highest_collecting_player_bet:
+                should_collection_continue = True
+                break
+
+        return should_collection_continue
+
+    @staticmethod
+    def _find_highest_player_bet(players: List[TablePlayers]) -> int:
+        comparing_player = players[0]
+        highest_bet = comparing_player.total_bet
+
+        for i in range(1, len(players)):
+            if players[i].total_bet > highest_bet:
+                highest_bet = players[i].total_bet
+
+        return highest_bet
+
+    def _update_players_total_bet(self, collecting_players: List[TablePlayers],
+                                  players_grouped_by_strength: List[List[TablePlayers]]) -> None:
+        highest_bet = self._find_highest_player_bet(collecting_players)
+
+        for player in collecting_players:
+            player.total_bet = 0
+
+        for player_group in players_grouped_by_strength:
+            self._reduce_players_total_bet(player_group, highest_bet)
+
+    @staticmethod
+    def _reduce_players_total_bet(players: List[TablePlayers], amount: int) -> None:
+        for player in players:
+            if player.total_bet < amount:
+                player.total_bet = 0
+            else:
+                player.total_bet -= amount
+
+
+class TestSidePots(TestGame):
+    SCENARIOS = 3000
+
+    @staticmethod
+    def _prepare(table: Table, bets: List[int], moves: List[Moves], strengths: List[int], leftover: int) -> None:
+        table._pot = sum(bets)
+        table._pot_leftover = leftover
+
+        for player, bet, move, strength in zip(table._players, bets, moves, strengths):
+            player.total_bet = bet
+            player.current_move = move
+            player.strength = strength
+
+    @staticmethod
+    def _create_scenario(random: Random, players: int):
+        highest_bet = random.randint(1, 40)
+        moves = [random.choice((Moves.FOLD, Moves.ALL_IN, Moves.ALL_IN, Moves.CALL)) for _ in range(players)]
+        moves[random.randrange(players)] = random.choice((Moves.ALL_IN, Moves.CALL))
+
+        if Moves.CALL not in moves:
+            bets = [random.randint(0 if move is Moves.FOLD else 1, highest_bet) for move in moves]
+            bets[moves.index(Moves.ALL_IN)] = highest_bet
+        else:
+            bets = [highest_bet if move is Moves.CALL else random.randint(0, highest_bet) for move in moves]
+
+        strengths = [0 if move is Moves.FOLD else random.randint(1, 4) for move in moves]
+
+        return bets, moves, strengths, random.choice((0, 0, 1, 2, 3))
+
+    def test_same_collections_as_legacy_split(self) -> None:
+        random = Random(19)
+
+        for _ in range(self.SCENARIOS):
+            players = random.randint(2, 10)
+            scenario = self._create_scenario(random, players)
+            tables = [Table(create_dummy_classes(players)), LegacyPotTable(create_dummy_classes(players))]
+
+            for table in tables:
+                self._prepare(table, *scenario)
+                table._init_pot_collection_phase()
+
+            self.assertEqual(*[[player.get_amount_of_chips() for player in table._players] for table in tables],
+                             msg=str(scenario))
+            self.assertEqual(tables[1]._pot_leftover, tables[0]._pot_leftover, msg=str(scenario))
+
+    def test_layers(self) -> None:
+        self.assertEqual([30, 0, 0], SidePots.split([10, 10, 10], [3, 2, 1], [False] * 3))
+        self.assertEqual([15, 15, 0], SidePots.split([10, 10, 10], [3, 3, 1], [False] * 3))
+        self.assertEqual([15, 10, 0], SidePots.split([5, 10, 10], [3, 2, 1], [False] * 3))
+        self.assertEqual([0, 20, 0], SidePots.split([0, 10, 10], [0, 2, 1], [True, False, False]))
+        self.assertEqual([1, 4, 5], SidePots.split([1, 4, 5], [2, 2, 2], [False] * 3))
+        self.assertEqual([7, 7, 0], SidePots.split([5, 5, 5], [2, 2, 1], [False] * 3))
+
+    def test_ten_seat_showdown_groups_equal_hands(self) -> None:
+        strengths = [5, 9, 2, 9, 9, 0, 1, 9, 3, 4]
+        is_folded = [strength == 0 for strength in strengths]
+
+        self.assertEqual([0, 25, 0, 25, 25, 0, 0, 25, 0, 0], SidePots.split([10] * 10, strengths, is_folded))
+        self.assertEqual([1] * 9 + [0], SidePots.split([1] * 10, [9] * 9 + [8], [False] * 10))
+        self.assertEqual([0, 0, 0, 0, 0, 0, 0, 0, 0, 100], SidePots.split([10] * 10, [1] * 9 + [2], [False] * 10))
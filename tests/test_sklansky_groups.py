@@ -0,0 +1,37 @@
+from game import Card, Deck
+from game.player import SklanskyGroups
+from itertools import combinations
+import unittest
+from unittest import TestCase
+
+
+class TestSklanskyGroups(TestCase):
+    def test_all_starting_hands(self) -> None:
+        hands = list(combinations(Deck().get_cards(), 2))
+        canonical_hands = {SklanskyGroups.get_canonical_hand(hand) for hand in hands}
+
+        self.assertEqual(1326, len(SklanskyGroups._strengths))
+        self.assertEqual(169, len(canonical_hands))
+
+        for hand in hands:
+            self.assertIn(SklanskyGroups.get_strength(hand), SklanskyGroups.STRENGTHS)
+            self.assertEqual(SklanskyGroups.get_strength(hand), SklanskyGroups.get_strength(hand[::-1]))
+
+    def test_groups(self) -> None:
+        self.assertEqual(1, SklanskyGroups.get_group([Card('Ace', 'Club', 13), Card('King', 'Club', 12)]))
+        self.assertEqual(2, SklanskyGroups.get_group([Card('King', 'Heart', 12), Card('Ace', 'Club', 13)]))
+        self.assertEqual(2, SklanskyGroups.get_group([Card('Ace', 'Spade', 13), Card('Queen', 'Spade', 11)]))
+        self.assertEqual(3, SklanskyGroups.get_group([Card('Ace', 'Spade', 13), Card('Queen', 'Heart', 11)]))
+        self.assertEqual(5, SklanskyGroups.get_group([Card('Ace', 'Spade', 13), Card('5', 'Spade', 4)]))
+        self.assertEqual(7, SklanskyGroups.get_group([Card('2', 'Spade', 1), Card('2', 'Heart', 1)]))
+        self.assertEqual(8, SklanskyGroups.get_group([Card('Jack', 'Spade', 10), Card('8', 'Heart', 7)]))
+        self.assertEqual(9, SklanskyGroups.get_group([Card('7', 'Spade', 6), Card('2', 'Heart', 1)]))
+
+    def test_canonical_hand(self) -> None:
+        self.assertEqual('AT', SklanskyGroups.get_canonical_hand([Card('10', 'Club', 9), Card('Ace', 'Heart', 13)]))
+        self.assertEqual('T9s', SklanskyGroups.get_canonical_hand([Card('9', 'Club', 8), Card('10', 'Club', 9)]))
+        self.assertEqual('55', SklanskyGroups.get_canonical_hand([Card('5', 'Club', 4), Card('5', 'Heart', 4)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+from game import RandomBot, Table
+from game.table.observer import BaseObserver, State as ObserverState
+import unittest
+
+
+class RecordingObserver(BaseObserver):
+    def __init__(self) -> None:
+        self.states = []
+
+    def update(self, state: ObserverState) -> None:
+        self.states.append(state)
+
+
+class TestStateSnapshots(unittest.TestCase):
+    def test_states_share_board(self) -> None:
+        table = Table([RandomBot, RandomBot, RandomBot], seed=2)
+        observer = RecordingObserver()
+        table.attach_observer(observer)
+        table._deck.shuffle()
+        table._deal_community_cards(3)
+
+        board = table.generate_game_state(()).community_cards
+
+        self.assertIsInstance(board, tuple)
+        self.assertIs(board, table.generate_game_state(()).community_cards)
+
+        table._notify_observers()
+        table._deal_community_cards()
+
+        self.assertIs(board, observer.states[0].community_cards)
+        self.assertEqual(3, len(board))
+        self.assertEqual(4, len(table.generate_game_state(()).community_cards))
+
+        table._reset_play()
+
+        self.assertEqual((), table.generate_game_state(()).community_cards)
+        self.assertEqual(3, len(board))
+
+    def test_state_community_cards_follow_hands(self) -> None:
+        table = Table([RandomBot, RandomBot])
+        table._deck.shuffle()
+        table._deal_community_cards(3)
+        flop = table._community_cards[:]
+
+        self.assertEqual(tuple(flop), table._get_state_community_cards())
+
+        table._reset_play()
+        table._deck.shuffle()
+        table._deal_community_cards(3)
+
+        self.assertEqual(tuple(table._community_cards), table._get_state_community_cards())
+        self.assertEqual(48, len(table._deck.get_cards()))
+
+
+if __name__ == '__main__':
+    unittest.main()
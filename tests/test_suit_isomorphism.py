@@ -0,0 +1,82 @@
+from game import Card, Deck, EquityCalculator, IncrementalHandEvaluator, SuitIsomorphism
+from itertools import combinations
+from random import Random
+import unittest
+from unittest import TestCase
+
+
+class TestSuitIsomorphism(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._random = Random(13)
+        self._cards = Deck().get_cards()
+
+    def test_find_symmetries(self) -> None:
+        self.assertEqual(24, len(SuitIsomorphism.find_symmetries([])))
+        self.assertEqual(6, len(SuitIsomorphism.find_symmetries([Card('Ace', 'Heart', 13), Card('King', 'Heart', 12)])))
+        self.assertEqual(2, len(SuitIsomorphism.find_symmetries([Card('Ace', 'Heart', 13), Card('Ace', 'Club', 13),
+                                                                 Card('2', 'Spade', 1)])))
+
+    def test_permute(self) -> None:
+        cards = [Card('Ace', 'Heart', 13), Card('2', 'Club', 1)]
+
+        self.assertEqual([Card('Ace', 'Club', 13), Card('2', 'Heart', 1)], SuitIsomorphism.permute(cards, (3, 1, 2, 0)))
+
+    def test_weights_cover_all_card_sets(self) -> None:
+        hand = [Card('Ace', 'Heart', 13), Card('King', 'Spade', 12)]
+        deck = [card for card in self._cards if card not in hand]
+        card_sets = list(combinations(deck, 2))
+
+        reduced = SuitIsomorphism.reduce(card_sets, hand)
+
+        self.assertLess(len(reduced), len(card_sets))
+        self.assertEqual(len(card_sets), sum(weight for _, weight in reduced))
+
+    def test_same_hand_strength_as_full_enumeration(self) -> None:
+        for _ in range(100):
+            cards = self._random.sample(self._cards, self._random.choice((5, 6, 7)))
+            hand, board = cards[:2], cards[2:]
+            deck = [card for card in self._cards if card not in cards]
+            board_evaluator = IncrementalHandEvaluator(board)
+            hero_strength = self._evaluate(board_evaluator, hand)
+            card_sets = list(combinations(deck, 2))
+
+            expected = [0, 0, 0]
+            for card_set in card_sets:
+                expected[self._compare(hero_strength, self._evaluate(board_evaluator, card_set))] += 1
+
+            actual = [0, 0, 0]
+            for card_set, weight in SuitIsomorphism.reduce(card_sets, cards, board):
+                actual[self._compare(hero_strength, self._evaluate(board_evaluator, card_set))] += weight
+
+            self.assertEqual(expected, actual)
+
+    def test_same_equity_as_without_reduction(self) -> None:
+        hand = [Card('Ace', 'Heart', 13), Card('King', 'Heart', 12)]
+        board = [Card('Jack', 'Club', 10), Card('Jack', 'Diamond', 10), Card('2', 'Spade', 1), Card('7', 'Spade', 6)]
+        deck = [card for card in self._cards if card not in hand + board]
+
+        # Clubs and diamonds are interchangeable, a range disables the reduction of the run-outs
+        self.assertEqual(2, len(SuitIsomorphism.find_symmetries(hand + board)))
+        expected = EquityCalculator.enumerate(hand, board, opponent_range=combinations(deck, 2))
+        actual = EquityCalculator.enumerate(hand, board)
+
+        self.assertEqual(expected.samples, actual.samples)
+        self.assertAlmostEqual(expected.win, actual.win)
+        self.assertAlmostEqual(expected.tie, actual.tie)
+        self.assertAlmostEqual(expected.equity, actual.equity)
+
+    @staticmethod
+    def _evaluate(evaluator: IncrementalHandEvaluator, cards) -> int:
+        evaluator = evaluator.copy()
+        evaluator.add_cards(cards)
+
+        return evaluator.strength
+
+    @staticmethod
+    def _compare(hero_strength: int, opponent_strength: int) -> int:
+        return (hero_strength > opponent_strength) - (hero_strength < opponent_strength) + 1
+
+
+if __name__ == '__main__':
+    unittest.main()
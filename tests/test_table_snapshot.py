@@ -0,0 +1,58 @@
+from game import OpponentBot, RandomBot, SemiRandomBot, Table
+import random
+import unittest
+
+
+class TestTableSnapshot(unittest.TestCase):
+    PLAYERS = [RandomBot, SemiRandomBot, OpponentBot, RandomBot]
+
+    @staticmethod
+    def _play_hands(table: Table, hands: int) -> None:
+        for _ in range(hands):
+            table._play_hand()
+
+    def test_restored_table_continues_tournament(self) -> None:
+        table = Table(self.PLAYERS, seed=11)
+        self._play_hands(table, 15)
+        snapshot = table.snapshot()
+        table.run_tournament()
+
+        restored = Table(self.PLAYERS, seed=12)
+        restored.restore(snapshot)
+
+        self.assertEqual(15, restored.hands_played)
+        self.assertEqual(0, restored.tournaments_played)
+
+        restored.run_tournament()
+
+        self.assertEqual(table.get_ranking(), restored.get_ranking())
+        self.assertEqual(table.hands_played, restored.hands_played)
+        self.assertEqual(table.snapshot(), restored.snapshot())
+
+    def test_snapshot_of_unseeded_table_restores_global_generator(self) -> None:
+        random.seed(3)
+        table = Table(self.PLAYERS)
+        table.reset_tournament()
+        self._play_hands(table, 5)
+        snapshot = table.snapshot()
+        table.run_tournament()
+        ranking = table.get_ranking()
+
+        self.assertEqual((None,) * 4, snapshot.players_random_states)
+
+        random.seed(4)
+        table.reset_tournament()
+        table.restore(snapshot)
+        table.run_tournament()
+
+        self.assertEqual(ranking, table.get_ranking())
+
+    def test_restore_requires_same_table_size(self) -> None:
+        snapshot = Table([RandomBot, RandomBot], seed=1).snapshot()
+
+        with self.assertRaises(ValueError):
+            Table(self.PLAYERS, seed=1).restore(snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
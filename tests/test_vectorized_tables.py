@@ -0,0 +1,148 @@
+from game import Card, Deck, Moves, Phases, State, Table
+from game.player import Player
+from game.player.dqn import SimpleNeuralNetwork
+from game.player.dqn.state_interpreter import InterpretableState, StateInterpreterV2
+from game.simulation import NeuralNetworkBatchPolicy, RandomBatchPolicy, SemiRandomBatchPolicy, VectorizedTables
+import numpy as np
+import random
+from typing import Iterator, List
+import unittest
+
+
+def create_decks(seed: int) -> Iterator[List[int]]:
+    rng = random.Random(seed)
+
+    while True:
+        deck = list(range(52))
+        rng.shuffle(deck)
+        yield deck
+
+
+def choose_move(allowed_moves: List[int], pot: int, hand: List[int], community_cards: int, current_bet: int) -> int:
+    return allowed_moves[(pot * 31 + sum(hand) * 7 + community_cards * 3 + current_bet) % len(allowed_moves)]
+
+
+class ScriptedBot(Player):
+    def make_move(self, possible_moves: List[Moves], game_state) -> Moves:
+        allowed_moves = sorted(move.value for move in possible_moves)
+        hand = [card.id for card in self.get_hand()]
+
+        return Moves(choose_move(allowed_moves, game_state.pot, hand, len(game_state.community_cards),
+                                 game_state.current_bet))
+
+
+class FixedDeck(Deck):
+    def __init__(self, card_ids: List[int]) -> None:
+        super().__init__()
+        self.cards = [Card.from_id(card_id) for card_id in card_ids]
+
+    def shuffle(self) -> None:
+        pass
+
+
+class RecordingTable(Table):
+    INIT_CHIPS = 20
+
+    def __init__(self, players: int, decks: Iterator[List[int]]) -> None:
+        self._fixed_decks = decks
+        self.stacks = []
+        super().__init__([ScriptedBot] * players)
+        self._reset_deck()
+
+    def _reset_deck(self) -> None:
+        self._deck = FixedDeck(next(self._fixed_decks))
+
+    def _init_pot_collection_phase(self) -> None:
+        super()._init_pot_collection_phase()
+        self.stacks.append([self._seats.get(i).get_amount_of_chips() for i in range(self._total_players)])
+
+
+class RecordingTables(VectorizedTables):
+    INIT_CHIPS = 20
+
+    def __init__(self, players: int, decks: Iterator[List[int]]) -> None:
+        self._fixed_decks = decks
+        self.stacks = []
+        super().__init__(1, players)
+
+    def _shuffle_decks(self, tables: np.ndarray) -> np.ndarray:
+        return np.array([next(self._fixed_decks) for _ in tables], dtype=np.int64).reshape(-1, 52)
+
+    def _collect_pots(self, tables: np.ndarray, collections: np.ndarray) -> None:
+        super()._collect_pots(tables, collections)
+        self.stacks.append(self._chips[0].tolist())
+
+    def play_scripted(self) -> None:
+        moves = np.zeros(1, dtype=np.int64)
+
+        while not self.is_finished:
+            allowed_moves = [value for value in range(1, len(Moves) + 1) if self.allowed_moves[0, value - 1]]
+            amount = self.community_card_amounts[0]
+            hand = self.hands[0, self.actors[0]].tolist()
+            moves[0] = choose_move(allowed_moves, self.pots[0], hand, amount, self.current_bets[0])
+            self.step(moves)
+
+
+class ShortTables(VectorizedTables):
+    INIT_CHIPS = 20
+
+
+class TestVectorizedTables(unittest.TestCase):
+    def test_same_hands_as_table(self) -> None:
+        for players in (2, 3, 4, 6):
+            for seed in range(5):
+                table = RecordingTable(players, create_decks(seed))
+                table.run_tournament()
+
+                vectorized_tables = RecordingTables(players, create_decks(seed))
+                vectorized_tables.play_scripted()
+
+                self.assertEqual(table.stacks, vectorized_tables.stacks)
+                self.assertEqual(table._pot_leftover, vectorized_tables._pot_leftovers[0])
+
+    def test_play_keeps_chips(self) -> None:
+        tables = ShortTables(50, 3, tournaments=2, seed=1)
+        wins = tables.play([RandomBatchPolicy(1), SemiRandomBatchPolicy(2), SemiRandomBatchPolicy(3)])
+
+        self.assertEqual(100, wins.sum())
+        self.assertTrue((tables.wins.sum(axis=1) == 2).all())
+        self.assertTrue((tables.chips.sum(axis=1) + tables._pot_leftovers == tables.total_chips).all())
+
+    def test_rejects_moves_which_are_not_allowed(self) -> None:
+        tables = VectorizedTables(4, 2, seed=1)
+
+        with self.assertRaises(ValueError):
+            tables.step(np.zeros(4, dtype=np.int64))
+
+        tables.step(np.full(4, Moves.FOLD.value))
+
+        self.assertEqual([1, 1, 1, 1], tables.hands_played.tolist())
+
+    def test_neural_network_states_match_state_interpreter(self) -> None:
+        policy = NeuralNetworkBatchPolicy(SimpleNeuralNetwork())
+        interpreter = StateInterpreterV2()
+        tables = VectorizedTables(20, 3, seed=2)
+        moves = np.zeros(20, dtype=np.int64)
+
+        for _ in range(10):
+            indices = tables.deciding_tables
+
+            for index, interpreted_state in zip(indices, policy.interpret_states(tables, indices)):
+                amount = tables.community_card_amounts[index]
+                state = State(
+                    community_cards=tuple(Card.from_id(card_id) for card_id in tables.community_cards[index, :amount]),
+                    total_players=3,
+                    total_chips=tables.total_chips,
+                    nbr_of_active_players=3,
+                    current_phase=Phases(tables.phases[index]),
+                    is_raising_capped=False,
+                    allowed_moves=tuple(move for move in Moves if tables.allowed_moves[index, move.value - 1]),
+                    pot=tables.pots[index],
+                    current_bet=tables.current_bets[index]
+                )
+                hand = tuple(Card.from_id(card_id) for card_id in tables.hands[index, tables.actors[index]])
+
+                self.assertEqual(interpreter.interpret(InterpretableState(state, hand, 0)), interpreted_state.tolist())
+
+            moves[indices] = policy.make_moves(tables, indices)
+            tables.step(moves)
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from game import Table, SemiRandomBot, SimpleDqnBot, OpponentBotGold, OpponentBotSilver
+from game import ParallelTournamentRunner, Table, SemiRandomBot, SimpleDqnBot, OpponentBotGold, OpponentBotSilver
 from game.player import Mode as PlayerMode
 from game.player.dqn import SimpleNeuralNetwork
 
@@ -10,29 +10,32 @@ INIT_CHIPS = 10
 SMALL_BET = 2
 BIG_BET = 4
 PLAYERS = [SimpleDqnBot, SemiRandomBot, SemiRandomBot]
+WORKERS = None
+SEED = 0
+DUPLICATE = False
+CHECKPOINT_PATH = None
 
 
 def main() -> None:
-    global VALIDATION_EPISODES, INIT_CHIPS, SMALL_BET, BIG_BET
+    global VALIDATION_EPISODES, PLAYERS, WORKERS, SEED, DUPLICATE, CHECKPOINT_PATH
 
-    Table.INIT_CHIPS = INIT_CHIPS
-    Table.SMALL_BET = SMALL_BET
-    Table.BIG_BET = BIG_BET
-    prepare_dqn()
-
-    table = Table(PLAYERS)
+    runner = ParallelTournamentRunner(PLAYERS, workers=WORKERS, seed=SEED, initializer=prepare, duplicate=DUPLICATE,
+                                      checkpoint_path=CHECKPOINT_PATH)
+    episodes = VALIDATION_EPISODES * runner.tournaments_per_deal
 
-    total_win_cnt = {player_name: 0 for player_name in table.player_names}
+    for episode, _ in enumerate(runner.run(VALIDATION_EPISODES - runner.deals), runner.tournaments + 1):
+        print_progress(episode, episodes, runner.wins)
 
-    for episode in range(1, VALIDATION_EPISODES + 1):
-        table.reset_tournament()
-        table.run_tournament()
+    print_results(runner.wins)
 
-        total_win_cnt[table.get_winner_name()] += 1
 
-        print_progress(episode, total_win_cnt)
+def prepare() -> None:
+    global INIT_CHIPS, SMALL_BET, BIG_BET
 
-    print_results(total_win_cnt)
+    Table.INIT_CHIPS = INIT_CHIPS
+    Table.SMALL_BET = SMALL_BET
+    Table.BIG_BET = BIG_BET
+    prepare_dqn()
 
 
 def prepare_dqn() -> None:
@@ -42,15 +45,13 @@ def prepare_dqn() -> None:
     SimpleDqnBot.MODE = PlayerMode.VALID
 
 
-def print_progress(episode: int, total_win_cnt: dict) -> None:
-    global VALIDATION_EPISODES
-
+def print_progress(episode: int, episodes: int, total_win_cnt: dict) -> None:
     names = ''.join([f'{name}:' for name in total_win_cnt])
     score = ''.join([f'{total_win_cnt.get(name)}:' for name in total_win_cnt])
 
-    perc = round((100 / VALIDATION_EPISODES) * episode, 2)
+    perc = round((100 / episodes) * episode, 2)
     print(
-        f'\rVALIDATING: {episode}/{VALIDATION_EPISODES} ({int(perc)}%)  '
+        f'\rVALIDATING: {episode}/{episodes} ({int(perc)}%)  '
         f'{names[:-1]} - {score[:-1]}', end='')
 
 